@@ -2,19 +2,34 @@ from django.contrib import admin
 from django.utils.html import format_html
 from django.urls import reverse
 from django.utils.safestring import mark_safe
-from .models import Course, Assignment, Exam, Attendance, CalendarEvent
+from django.utils import timezone
+from .models import (
+    Course, Assignment, Exam, Attendance, CalendarEvent, ClassMeeting, GradeCategory, Job, Reminder, Term,
+    TermArchive, UserPreferences,
+)
+
+
+class ClassMeetingInline(admin.TabularInline):
+    model = ClassMeeting
+    extra = 0
+
+
+class GradeCategoryInline(admin.TabularInline):
+    model = GradeCategory
+    extra = 0
 
 
 @admin.register(Course)
 class CourseAdmin(admin.ModelAdmin):
-    list_display = ['name', 'code', 'instructor', 'credits', 'user', 'created_at', 'color_display']
-    list_filter = ['user', 'credits', 'created_at']
+    inlines = [ClassMeetingInline, GradeCategoryInline]
+    list_display = ['name', 'code', 'instructor', 'credits', 'term', 'user', 'created_at', 'color_display']
+    list_filter = ['user', 'term', 'credits', 'created_at']
     search_fields = ['name', 'code', 'instructor']
     readonly_fields = ['created_at', 'updated_at']
     
     fieldsets = (
         ('Basic Information', {
-            'fields': ('user', 'name', 'code', 'instructor')
+            'fields': ('user', 'term', 'name', 'code', 'instructor')
         }),
         ('Details', {
             'fields': ('credits', 'color_display', 'color')
@@ -50,6 +65,9 @@ class AssignmentAdmin(admin.ModelAdmin):
         ('Timing & Priority', {
             'fields': ('due_date', 'priority', 'estimated_hours', 'completed')
         }),
+        ('Grading', {
+            'fields': ('category', 'score', 'max_score')
+        }),
         ('Status', {
             'fields': ('is_overdue_display',)
         }),
@@ -88,6 +106,9 @@ class ExamAdmin(admin.ModelAdmin):
         ('Notes', {
             'fields': ('notes',)
         }),
+        ('Grading', {
+            'fields': ('category', 'score', 'max_score')
+        }),
         ('Timestamps', {
             'fields': ('created_at', 'updated_at'),
             'classes': ('collapse',)
@@ -130,7 +151,7 @@ class CalendarEventAdmin(admin.ModelAdmin):
     list_display = ['title', 'event_type', 'event_date', 'end_date', 'location', 'user', 'color_display']
     list_filter = ['event_type', 'user', 'event_date']
     search_fields = ['title', 'description', 'location']
-    readonly_fields = ['created_at', 'updated_at']
+    readonly_fields = ['recurrence_end', 'created_at', 'updated_at']
     date_hierarchy = 'event_date'
     
     fieldsets = (
@@ -140,6 +161,10 @@ class CalendarEventAdmin(admin.ModelAdmin):
         ('Schedule & Location', {
             'fields': ('event_date', 'end_date', 'location')
         }),
+        ('Recurrence', {
+            'fields': ('recurrence_rule', 'recurrence_exceptions', 'recurrence_end'),
+            'classes': ('collapse',)
+        }),
         ('Description & Styling', {
             'fields': ('description', 'color_display', 'color')
         }),
@@ -159,7 +184,76 @@ class CalendarEventAdmin(admin.ModelAdmin):
     color_display.short_description = 'Color'
 
 
+@admin.register(UserPreferences)
+class UserPreferencesAdmin(admin.ModelAdmin):
+    list_display = ['user', 'study_start_time', 'study_end_time', 'max_study_hours_per_day', 'study_block_minutes']
+    search_fields = ['user__username']
+    readonly_fields = ['updated_at']
+
+    fieldsets = (
+        ('User', {
+            'fields': ('user',)
+        }),
+        ('Study Planning', {
+            'fields': ('study_start_time', 'study_end_time', 'max_study_hours_per_day', 'study_block_minutes')
+        }),
+        ('Workload', {
+            'fields': ('weekly_workload_hours',)
+        }),
+        ('Reminders', {
+            'fields': ('email_reminders', 'assignment_reminder_hours', 'exam_reminder_hours')
+        }),
+        ('Timestamps', {
+            'fields': ('updated_at',),
+            'classes': ('collapse',)
+        }),
+    )
+
+
 # Customize admin site
 admin.site.site_header = "Academic Planner Administration"
 admin.site.site_title = "Academic Planner Admin"
 admin.site.index_title = "Welcome to Academic Planner Administration"
+
+
+@admin.register(Reminder)
+class ReminderAdmin(admin.ModelAdmin):
+    list_display = ['title', 'kind', 'course_name', 'user', 'due_at', 'fire_at', 'sent_at']
+    list_filter = ['kind', 'sent_at']
+    search_fields = ['title', 'course_name', 'user__username']
+    readonly_fields = ['user', 'kind', 'object_id', 'due_at', 'updated_at']
+    date_hierarchy = 'fire_at'
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ['id', 'task', 'status', 'priority', 'attempts', 'user', 'run_at', 'finished_at']
+    list_filter = ['status', 'task']
+    search_fields = ['task', 'user__username']
+    readonly_fields = ['attempts', 'locked_by', 'locked_until', 'result', 'error', 'created_at', 'updated_at', 'finished_at']
+    actions = ['requeue']
+
+    def requeue(self, request, queryset):
+        count = queryset.exclude(status='running').update(
+            status='queued', attempts=0, run_at=timezone.now(), locked_by='', locked_until=None, finished_at=None
+        )
+        self.message_user(request, f"Requeued {count} job(s).")
+    requeue.short_description = 'Requeue selected jobs'
+
+
+
+@admin.register(Term)
+class TermAdmin(admin.ModelAdmin):
+    list_display = ['name', 'user', 'start_date', 'end_date', 'archived_at']
+    list_filter = ['archived_at']
+    search_fields = ['name', 'user__username']
+    readonly_fields = ['archived_at', 'created_at']
+    date_hierarchy = 'start_date'
+
+
+@admin.register(TermArchive)
+class TermArchiveAdmin(admin.ModelAdmin):
+    list_display = ['term', 'counts', 'created_at']
+    search_fields = ['term__name', 'term__user__username']
+    readonly_fields = ['term', 'counts', 'created_at']
+    exclude = ['snapshot']
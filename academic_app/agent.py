@@ -1,34 +1,62 @@
 # academic_app/agent.py
 
-from .models import Course, Assignment, Exam
+import heapq
+from collections import namedtuple
+from itertools import islice
+
+from .models import Course, Assignment, Exam, in_current_term
 from django.utils import timezone
 
+# Deadlines returned when the caller does not ask for a number.
+DEFAULT_DEADLINE_LIMIT = 20
+
+Deadline = namedtuple('Deadline', ['kind', 'title', 'course', 'due'])
+
+
 class AcademicAgent:
+    def __init__(self, user):
+        self.user = user
+
     def add_assignment(self, course_name, title, due_date):
         try:
-            course = Course.objects.get(name=course_name)
+            course = Course.objects.get(user=self.user, name=course_name)
             Assignment.objects.create(course=course, title=title, due_date=due_date)
             return f"Successfully added '{title}' to {course_name}."
         except Course.DoesNotExist:
             return f"Error: Course '{course_name}' not found."
+        except Course.MultipleObjectsReturned:
+            return f"Error: More than one course is named '{course_name}'."
+
+    def iter_upcoming_deadlines(self, limit=DEFAULT_DEADLINE_LIMIT, now=None):
+        """
+        Yields this user's pending assignments and upcoming exams in the
+        current term as ``Deadline`` tuples, soonest first, at most ``limit``
+        of them. Each side is one indexed query capped at ``limit`` rows,
+        merged as it is read.
+        """
+        now = now or timezone.now()
+        assignments = Assignment.objects.filter(
+            in_current_term("course__"), course__user=self.user, completed=False, due_date__gte=now
+        ).order_by('due_date').values_list('title', 'course__name', 'due_date')[:limit]
+        exams = Exam.objects.filter(
+            in_current_term("course__"), course__user=self.user, exam_date__gte=now
+        ).order_by('exam_date').values_list('title', 'course__name', 'exam_date')[:limit]
+
+        merged = heapq.merge(
+            (Deadline('Assignment', *row) for row in assignments.iterator()),
+            (Deadline('Exam', *row) for row in exams.iterator()),
+            key=lambda deadline: deadline.due,
+        )
+        yield from islice(merged, limit)
+
+    def get_upcoming_deadlines(self, limit=DEFAULT_DEADLINE_LIMIT):
+        lines = [
+            f"- Assignment: {d.title} (Course: {d.course}, Due: {d.due})" if d.kind == 'Assignment'
+            else f"- Exam: {d.title} (Course: {d.course}, Date: {d.due})"
+            for d in self.iter_upcoming_deadlines(limit)
+        ]
+        if not lines:
+            return "Your upcoming deadlines are:\nNo upcoming deadlines found."
+        return "Your upcoming deadlines are:\n" + "\n".join(lines) + "\n"
 
-    def get_upcoming_deadlines(self):
-        # Retrieve all upcoming assignments and exams
-        now = timezone.now()
-        upcoming_assignments = Assignment.objects.filter(due_date__gte=now).order_by('due_date')
-        upcoming_exams = Exam.objects.filter(exam_date__gte=now).order_by('exam_date')
-        
-        # Format the output for the user
-        response = "Your upcoming deadlines are:\n"
-        if not upcoming_assignments and not upcoming_exams:
-            response += "No upcoming deadlines found."
-        
-        for assignment in upcoming_assignments:
-            response += f"- Assignment: {assignment.title} (Course: {assignment.course.name}, Due: {assignment.due_date})\n"
-        
-        for exam in upcoming_exams:
-            response += f"- Exam: {exam.title} (Course: {exam.course.name}, Date: {exam.exam_date})\n"
-
-        return response
-
-# ... (add more methods for other tasks)
\ No newline at end of file
+# ... (add more methods for other tasks)
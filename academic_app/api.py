@@ -0,0 +1,155 @@
+# academic_app/api.py
+from django.db import IntegrityError, transaction
+from rest_framework import serializers, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.routers import DefaultRouter
+
+from . import terms
+from .models import Course, Assignment, Exam, Attendance, CalendarEvent, GradeCategory, Term, in_current_term
+from .serializers import (
+    CourseSerializer, AssignmentSerializer, ExamSerializer,
+    AttendanceSerializer, CalendarEventSerializer, GradeCategorySerializer, TermSerializer,
+)
+
+
+class TermScopedMixin:
+    """
+    Lists only the current term unless ``?term=<id>`` picks one or
+    ``?term=all`` asks for everything. Other actions see every row.
+    """
+    term_prefix = "course__"
+
+    def scope_to_term(self, queryset):
+        if self.action != "list":
+            return queryset
+        term = self.request.query_params.get("term")
+        if term == "all":
+            return queryset
+        if term:
+            if not term.isdigit():
+                raise serializers.ValidationError({"term": ["Expected a term id or 'all'."]})
+            return queryset.filter(**{f"{self.term_prefix}term": term})
+        return queryset.filter(in_current_term(self.term_prefix))
+
+
+class TermViewSet(viewsets.ModelViewSet):
+    serializer_class = TermSerializer
+    cursor_ordering = ("-start_date", "-id")
+
+    def get_queryset(self):
+        return Term.objects.filter(user=self.request.user).select_related("archive")
+
+    def perform_create(self, serializer):
+        self._save_unique(serializer, user=self.request.user)
+
+    def perform_update(self, serializer):
+        self._save_unique(serializer)
+
+    def _save_unique(self, serializer, **kwargs):
+        # (user, name) is unique_together; let the database enforce it.
+        try:
+            with transaction.atomic():
+                serializer.save(**kwargs)
+        except IntegrityError:
+            raise serializers.ValidationError({"name": ["You already have a term with this name."]})
+
+    @action(detail=True, methods=["get"])
+    def archive(self, request, pk=None):
+        """The archived courses and items of a closed term."""
+        snapshot = terms.load_archive(self.get_object())
+        if snapshot is None:
+            return Response({"detail": "This term has not been archived."}, status=404)
+        return Response(snapshot)
+
+
+class CourseViewSet(TermScopedMixin, viewsets.ModelViewSet):
+    serializer_class = CourseSerializer
+    cursor_ordering = ("name", "id")
+    term_prefix = ""
+
+    def get_queryset(self):
+        return self.scope_to_term(Course.objects.filter(user=self.request.user).prefetch_related("meetings"))
+
+    def perform_create(self, serializer):
+        if "term" not in serializer.validated_data:
+            serializer.validated_data["term"] = terms.active_term(self.request.user)
+        self._save_unique(serializer, user=self.request.user)
+
+    def perform_update(self, serializer):
+        self._save_unique(serializer)
+
+    def _save_unique(self, serializer, **kwargs):
+        # A code is unique per user within a term; let the database enforce it.
+        try:
+            with transaction.atomic():
+                serializer.save(**kwargs)
+        except IntegrityError:
+            raise serializers.ValidationError({"code": ["You already have a course with this code in this term."]})
+
+
+class GradeCategoryViewSet(viewsets.ModelViewSet):
+    serializer_class = GradeCategorySerializer
+    cursor_ordering = ("course_id", "id")
+
+    def get_queryset(self):
+        return GradeCategory.objects.filter(course__user=self.request.user)
+
+    def perform_create(self, serializer):
+        self._save_unique(serializer)
+
+    def perform_update(self, serializer):
+        self._save_unique(serializer)
+
+    def _save_unique(self, serializer):
+        # (course, name) is unique_together; let the database enforce it.
+        try:
+            with transaction.atomic():
+                serializer.save()
+        except IntegrityError:
+            raise serializers.ValidationError({"name": ["This course already has a category with this name."]})
+
+
+class AssignmentViewSet(TermScopedMixin, viewsets.ModelViewSet):
+    serializer_class = AssignmentSerializer
+    cursor_ordering = ("due_date", "id")
+
+    def get_queryset(self):
+        return self.scope_to_term(Assignment.objects.filter(course__user=self.request.user).select_related("course"))
+
+
+class ExamViewSet(TermScopedMixin, viewsets.ModelViewSet):
+    serializer_class = ExamSerializer
+    cursor_ordering = ("exam_date", "id")
+
+    def get_queryset(self):
+        return self.scope_to_term(Exam.objects.filter(course__user=self.request.user).select_related("course"))
+
+
+class AttendanceViewSet(TermScopedMixin, viewsets.ModelViewSet):
+    serializer_class = AttendanceSerializer
+    cursor_ordering = ("-date", "-id")
+
+    def get_queryset(self):
+        return self.scope_to_term(Attendance.objects.filter(course__user=self.request.user).select_related("course"))
+
+
+class CalendarEventViewSet(viewsets.ModelViewSet):
+    serializer_class = CalendarEventSerializer
+    cursor_ordering = ("event_date", "id")
+
+    def get_queryset(self):
+        return CalendarEvent.objects.filter(user=self.request.user)
+
+    def perform_create(self, serializer):
+        serializer.save(user=self.request.user)
+
+
+router = DefaultRouter()
+router.register("terms", TermViewSet, basename="api-term")
+router.register("courses", CourseViewSet, basename="api-course")
+router.register("assignments", AssignmentViewSet, basename="api-assignment")
+router.register("exams", ExamViewSet, basename="api-exam")
+router.register("events", CalendarEventViewSet, basename="api-event")
+router.register("attendance", AttendanceViewSet, basename="api-attendance")
+router.register("grade-categories", GradeCategoryViewSet, basename="api-grade-category")
@@ -0,0 +1,99 @@
+# academic_app/attendance.py
+"""
+Attendance grid: expected class dates from each course's meeting schedule,
+and bulk marking of a week or a whole term in one statement.
+"""
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Prefetch
+
+from .caching import deferred_invalidation
+from .models import Course, Attendance, ClassMeeting
+
+# Upper bound on the date range one grid request may cover (about a term and a half).
+MAX_GRID_DAYS = 200
+
+
+def current_week(today):
+    monday = today - timedelta(days=today.weekday())
+    return monday, monday + timedelta(days=6)
+
+
+def scheduled_courses(user, course_ids=None):
+    """The user's current-term courses with their meetings prefetched (two queries)."""
+    courses = Course.objects.current().filter(user=user).prefetch_related(
+        Prefetch("meetings", queryset=ClassMeeting.objects.order_by("weekday", "start_time"))
+    )
+    if course_ids is not None:
+        courses = courses.filter(id__in=course_ids)
+    return list(courses)
+
+
+def meeting_dates(course, start, end):
+    """Dates in [start, end] on which ``course`` meets, in order."""
+    weekdays = {meeting.weekday for meeting in course.meetings.all()}
+    if not weekdays:
+        return []
+    return [
+        start + timedelta(days=offset)
+        for offset in range((end - start).days + 1)
+        if (start + timedelta(days=offset)).weekday() in weekdays
+    ]
+
+
+def attendance_grid(user, start, end, course_ids=None):
+    """Scheduled dates per course with the recorded status (None if unrecorded)."""
+    courses = scheduled_courses(user, course_ids)
+    recorded = dict(
+        ((course_id, day), present)
+        for course_id, day, present in Attendance.objects.filter(
+            course__in=courses, date__range=(start, end)
+        ).values_list("course_id", "date", "present")
+    )
+    grid = []
+    for course in courses:
+        days = set(meeting_dates(course, start, end))
+        days.update(day for (course_id, day) in recorded if course_id == course.id)
+        grid.append({
+            "course": course.id,
+            "name": course.name,
+            "code": course.code,
+            "dates": [
+                {"date": day.isoformat(), "present": recorded.get((course.id, day))}
+                for day in sorted(days)
+            ],
+        })
+    return grid
+
+
+def mark_attendance(user, start, end, present=True, course_ids=None, overrides=()):
+    """
+    Records attendance for every scheduled class of the selected courses in
+    [start, end], plus any explicit ``(course_id, date, present)`` overrides.
+
+    Rows are written with a single INSERT ... ON CONFLICT (course, date) DO
+    UPDATE, so re-marking a week only flips ``present`` and keeps any notes.
+    Returns the number of class dates written.
+    """
+    courses = scheduled_courses(user, course_ids)
+    owned = {course.id for course in courses}
+    marks = {
+        (course.id, day): present
+        for course in courses
+        for day in meeting_dates(course, start, end)
+    }
+    for course_id, day, value in overrides:
+        if course_id in owned:
+            marks[(course_id, day)] = value
+
+    rows = [Attendance(course_id=course_id, date=day, present=value) for (course_id, day), value in marks.items()]
+    with transaction.atomic(), deferred_invalidation(user.id):
+        Attendance.objects.bulk_create(
+            rows,
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=["course", "date"],
+            update_fields=["present"],
+        )
+    return len(rows)
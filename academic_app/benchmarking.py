@@ -0,0 +1,93 @@
+# academic_app/benchmarking.py
+"""
+Helpers shared by the ``benchmark_*`` management commands.
+
+Benchmarks seed a throwaway user inside a transaction that is rolled back
+afterwards, so they can be pointed at a development database safely.
+"""
+import statistics
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from .models import Course, Assignment, Exam, CalendarEvent
+
+
+@dataclass
+class Timing:
+    label: str
+    samples_ms: list
+    queries: list
+
+    @property
+    def median(self):
+        return statistics.median(self.samples_ms)
+
+    @property
+    def p95(self):
+        ordered = sorted(self.samples_ms)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    @property
+    def mean_queries(self):
+        return sum(self.queries) / len(self.queries)
+
+    def __str__(self):
+        return (
+            f"{self.label:<28} median {self.median:8.2f} ms   p95 {self.p95:8.2f} ms   "
+            f"queries {self.mean_queries:6.1f}   (n={len(self.samples_ms)})"
+        )
+
+
+def measure(label, func, iterations, before_each=None):
+    """Calls ``func`` ``iterations`` times and records wall time and query count."""
+    samples, queries = [], []
+    for _ in range(iterations):
+        if before_each is not None:
+            before_each()
+        with CaptureQueriesContext(connection) as captured:
+            start = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - start) * 1000)
+        queries.append(len(captured))
+    return Timing(label, samples, queries)
+
+
+def seed_user(username, courses=8, items_per_course=20):
+    """Creates a user with courses and a spread of assignments, exams and events."""
+    user = User.objects.create_user(username=username, password=None)
+    now = timezone.now()
+    priorities = [choice for choice, _ in Assignment.PRIORITY_CHOICES]
+
+    course_objs = Course.objects.bulk_create([
+        Course(user=user, name=f"Benchmark Course {i}", code=f"BENCH{i:03d}", instructor="Dr. Bench")
+        for i in range(courses)
+    ])
+    assignments, exams, events = [], [], []
+    for course in course_objs:
+        for j in range(items_per_course):
+            offset = timedelta(days=j - items_per_course // 4, hours=j)
+            assignments.append(Assignment(
+                course=course,
+                title=f"Assignment {j}",
+                due_date=now + offset,
+                priority=priorities[j % len(priorities)],
+                completed=j % 5 == 0,
+                estimated_hours=1 + j % 6,
+            ))
+            exams.append(Exam(course=course, title=f"Exam {j}", exam_date=now + offset * 2))
+            events.append(CalendarEvent(
+                user=user,
+                title=f"Event {course.code}-{j}",
+                event_date=now + offset,
+                end_date=now + offset + timedelta(hours=1),
+            ))
+    Assignment.objects.bulk_create(assignments)
+    Exam.objects.bulk_create(exams)
+    CalendarEvent.objects.bulk_create(events)
+    return user
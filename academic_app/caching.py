@@ -0,0 +1,71 @@
+# academic_app/caching.py
+import threading
+import time
+from contextlib import contextmanager
+
+from django.core.cache import cache
+from django.db import transaction
+
+# How long rendered dashboard fragments live. Entries are keyed on the user's
+# data version, so this only bounds memory; correctness comes from the version.
+FRAGMENT_CACHE_TIMEOUT = 60 * 60
+
+DATA_VERSION_KEY = "academic:data-version:{user_id}"
+
+_state = threading.local()
+
+
+def get_data_version(user_id):
+    """
+    Returns the current data version for a user.
+
+    The version changes whenever one of the user's courses, assignments, exams,
+    attendance records or events is written, so any cache entry keyed on it
+    goes stale automatically. It starts from the clock rather than 1 so that a
+    version key evicted from the cache never reuses a number that older
+    fragments may still be stored under.
+    """
+    key = DATA_VERSION_KEY.format(user_id=user_id)
+    version = cache.get(key)
+    if version is None:
+        version = time.time_ns()
+        if not cache.add(key, version, timeout=None):
+            version = cache.get(key, version)
+    return version
+
+
+def bump_data_version(user_id):
+    """Invalidates every cache entry tagged with the user's data version."""
+    key = DATA_VERSION_KEY.format(user_id=user_id)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        version = time.time_ns()
+        cache.set(key, version, timeout=None)
+        return version
+
+
+def invalidate_on_commit(user_id):
+    """Bumps the user's data version once the current transaction commits."""
+    transaction.on_commit(lambda: bump_data_version(user_id))
+
+
+def invalidation_deferred():
+    return getattr(_state, "depth", 0) > 0
+
+
+@contextmanager
+def deferred_invalidation(user_id):
+    """
+    Batches cache invalidation for set-based writes to one user's data.
+
+    ``QuerySet.update()`` sends no signals and ``QuerySet.delete()`` sends one
+    per row; inside this block the per-row receivers are skipped and the
+    user's version is bumped once instead.
+    """
+    _state.depth = getattr(_state, "depth", 0) + 1
+    try:
+        yield
+    finally:
+        _state.depth -= 1
+        invalidate_on_commit(user_id)
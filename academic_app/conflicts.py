@@ -0,0 +1,175 @@
+# academic_app/conflicts.py
+"""
+Schedule conflict detection for exams, calendar events and deadlines.
+
+Exams occupy ``exam_date`` for ``duration`` minutes, events occupy
+``event_date``..``end_date`` (an hour when no end is set) and assignment
+deadlines are instants. Intervals are half-open, so back-to-back items do
+not conflict, and two deadlines at the same moment are not a conflict.
+
+Checking one new item only loads its neighbourhood through indexed range
+queries; listing every conflict in a range is a sorted sweep with a heap of
+active intervals, O(n log n + k) for k conflicts.
+"""
+import heapq
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.db.models import DateTimeField, DurationField, ExpressionWrapper, F, Q, Value
+from django.db.models.functions import Coalesce
+
+from .models import Assignment, CalendarEvent, Exam, in_current_term
+
+DEFAULT_EVENT_DURATION = timedelta(hours=1)
+
+# Exams starting this long before a window can still overlap it: no exam is
+# longer (validated on the model). Events are found by their own end instead.
+LOOKBACK = timedelta(minutes=Exam.MAX_DURATION_MINUTES)
+
+
+@dataclass(frozen=True)
+class Interval:
+    kind: str
+    id: int
+    title: str
+    start: object
+    end: object
+
+    @property
+    def is_instant(self):
+        return self.start == self.end
+
+    def overlaps(self, other):
+        if self.is_instant and other.is_instant:
+            return False
+        if self.is_instant:
+            return other.start <= self.start < other.end
+        if other.is_instant:
+            return self.start <= other.start < self.end
+        return self.start < other.end and other.start < self.end
+
+    def as_dict(self):
+        return {
+            "type": self.kind,
+            "id": self.id,
+            "title": self.title,
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+        }
+
+
+def exam_interval(exam):
+    return Interval("exam", exam.id, exam.title, exam.exam_date, exam.exam_date + timedelta(minutes=exam.duration))
+
+
+def deadline_interval(assignment):
+    return Interval("assignment", assignment.id, assignment.title, assignment.due_date, assignment.due_date)
+
+
+def event_duration(event):
+    return (event.end_date - event.event_date) if event.end_date else DEFAULT_EVENT_DURATION
+
+
+def event_intervals(event, start, end):
+    """Intervals of ``event`` (every occurrence, for recurring ones) that start in [start, end]."""
+    duration = event_duration(event)
+    if not event.is_recurring:
+        return [Interval("event", event.id, event.title, event.event_date, event.event_date + duration)]
+    return [
+        Interval("event", event.id, event.title, occurrence_start, occurrence_start + duration)
+        for occurrence_start, _ in event.occurrences(start, end)
+    ]
+
+
+def user_intervals(user, start, end, include_deadlines=True):
+    """
+    Every exam, event occurrence and pending deadline of the user's current
+    term that could touch [start, end).
+    """
+    lookback = start - LOOKBACK
+    current_term = in_current_term("course__")
+    intervals = [
+        exam_interval(exam)
+        for exam in Exam.objects.filter(current_term, course__user=user, exam_date__gte=lookback, exam_date__lt=end)
+    ]
+    # Events have no length limit, so they are matched on where they end:
+    # one-off events on their own end, recurring ones on their last
+    # occurrence's, and occurrences expanded from one duration back.
+    duration = Coalesce(F("end_date") - F("event_date"), Value(DEFAULT_EVENT_DURATION), output_field=DurationField())
+    events = CalendarEvent.objects.filter(user=user).alias(
+        ends_at=ExpressionWrapper(F("event_date") + duration, output_field=DateTimeField()),
+        last_ends_at=ExpressionWrapper(F("recurrence_end") + duration, output_field=DateTimeField()),
+    ).filter(
+        Q(recurrence_rule="", event_date__lt=end, ends_at__gt=start)
+        | (~Q(recurrence_rule="") & Q(event_date__lt=end)
+           & (Q(recurrence_end__isnull=True) | Q(last_ends_at__gt=start)))
+    )
+    for event in events:
+        intervals.extend(event_intervals(event, start - event_duration(event), end))
+    if include_deadlines:
+        intervals.extend(
+            deadline_interval(assignment)
+            for assignment in Assignment.objects.filter(
+                current_term, course__user=user, completed=False, due_date__gte=start, due_date__lt=end
+            )
+        )
+    return [interval for interval in intervals if interval.end > start or interval.start >= start]
+
+
+def sweep_conflicts(intervals):
+    """Returns every overlapping pair among ``intervals`` with a single sorted sweep."""
+    # At equal start times, place spans before instants so an instant at the very
+    # start of a span is compared against it.
+    ordered = sorted(intervals, key=lambda interval: (interval.start, interval.is_instant, interval.end))
+    active = []  # min-heap of (end, sequence, interval)
+    pairs = []
+    for sequence, interval in enumerate(ordered):
+        while active and active[0][0] <= interval.start:
+            heapq.heappop(active)
+        for _, _, other in active:
+            if interval.overlaps(other):
+                pairs.append((other, interval))
+        if not interval.is_instant:
+            heapq.heappush(active, (interval.end, sequence, interval))
+    return pairs
+
+
+def conflicts_for(item):
+    """
+    Conflicts for one newly saved Exam, CalendarEvent or Assignment, found by
+    loading only the items around it.
+    """
+    if isinstance(item, Exam):
+        user, targets = item.course.user, [exam_interval(item)]
+    elif isinstance(item, Assignment):
+        if item.completed:
+            return []
+        user, targets = item.course.user, [deadline_interval(item)]
+    else:
+        user = item.user
+        horizon_end = item.event_date + timedelta(days=366) if item.is_recurring else item.event_date
+        targets = event_intervals(item, item.event_date, horizon_end)
+    if not targets:
+        return []
+
+    start = min(target.start for target in targets)
+    end = max(target.end for target in targets) + timedelta(microseconds=1)
+    neighbours = [
+        other for other in user_intervals(user, start, end, include_deadlines=not isinstance(item, Assignment))
+        if not (other.kind == targets[0].kind and other.id == item.id)
+    ]
+    conflicts = {}
+    for target in targets:
+        for other in neighbours:
+            if target.overlaps(other):
+                conflicts.setdefault((other.kind, other.id, other.start), other)
+    return sorted(conflicts.values(), key=lambda interval: interval.start)
+
+
+def describe(conflicts):
+    """A short human-readable warning for a list of conflicting intervals."""
+    if not conflicts:
+        return ""
+    names = ", ".join(f"{c.kind} '{c.title}'" for c in conflicts[:3])
+    more = f" and {len(conflicts) - 3} more" if len(conflicts) > 3 else ""
+    return f"Overlaps with {names}{more}."
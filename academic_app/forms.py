@@ -1,7 +1,112 @@
 from django import forms
 from django.contrib.auth.models import User
-from .models import Course, Assignment, Exam, Attendance, CalendarEvent
+from django.core.exceptions import ValidationError
+from django.forms.models import ModelChoiceIterator
+from django.utils.functional import cached_property
+from .models import Course, Assignment, Exam, Attendance, CalendarEvent, GradeCategory
+from . import recurrence
 from django.utils import timezone
+from datetime import datetime, time
+
+
+class CourseCatalogue:
+    """
+    A user's current-term courses, loaded with a single query and shared for
+    one request.
+
+    Pass the same catalogue to every form on a page (and to the template) so
+    that the course dropdowns, the course list and validation of a submitted
+    course id all reuse one result set instead of each re-querying.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self.queryset = Course.objects.current().filter(user=user)
+
+    @cached_property
+    def courses(self):
+        return list(self.queryset)
+
+    @cached_property
+    def by_id(self):
+        return {course.pk: course for course in self.courses}
+
+    def get(self, pk):
+        return self.by_id.get(pk)
+
+    def __iter__(self):
+        return iter(self.courses)
+
+    def __len__(self):
+        return len(self.courses)
+
+    def __bool__(self):
+        return bool(self.courses)
+
+
+class CourseCatalogueIterator(ModelChoiceIterator):
+    """Yields choices from the field's catalogue rather than re-running its queryset."""
+
+    def __iter__(self):
+        catalogue = getattr(self.field, "catalogue", None)
+        if catalogue is None:
+            yield from super().__iter__()
+            return
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for course in catalogue:
+            yield self.choice(course)
+
+    def __len__(self):
+        catalogue = getattr(self.field, "catalogue", None)
+        if catalogue is None:
+            return super().__len__()
+        return len(catalogue) + (1 if self.field.empty_label is not None else 0)
+
+    def __bool__(self):
+        catalogue = getattr(self.field, "catalogue", None)
+        if catalogue is None:
+            return super().__bool__()
+        return self.field.empty_label is not None or bool(catalogue)
+
+
+class CourseChoiceField(forms.ModelChoiceField):
+    iterator = CourseCatalogueIterator
+
+    def set_catalogue(self, catalogue):
+        self.catalogue = catalogue
+        self.queryset = catalogue.queryset
+
+    def to_python(self, value):
+        catalogue = getattr(self, "catalogue", None)
+        if catalogue is None or value in self.empty_values:
+            return super().to_python(value)
+        if isinstance(value, Course):
+            value = value.pk
+        try:
+            course = catalogue.get(int(value))
+        except (TypeError, ValueError):
+            course = None
+        if course is None:
+            raise ValidationError(
+                self.error_messages["invalid_choice"],
+                code="invalid_choice",
+                params={"value": value},
+            )
+        return course
+
+
+class CourseScopedFormMixin:
+    """Limits the ``course`` field to the user's courses via a shared catalogue."""
+
+    def __init__(self, *args, user=None, courses=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if courses is None and user:
+            courses = CourseCatalogue(user)
+        if courses is not None:
+            self.fields['course'].set_catalogue(courses)
+            self.fields['course'].widget.attrs.update({"class": "form-select"})
+
 
 class CourseForm(forms.ModelForm):
     class Meta:
@@ -31,15 +136,16 @@ class CourseForm(forms.ModelForm):
             }),
         }
 
-    def __init__(self, *args, user=None, **kwargs):
+    def __init__(self, *args, user=None, courses=None, **kwargs):
         super().__init__(*args, **kwargs)
         # Note: self.user is not needed here as it's not used in this form.
         # But including it prevents the TypeError.
 
-class AssignmentForm(forms.ModelForm):
+class AssignmentForm(CourseScopedFormMixin, forms.ModelForm):
     class Meta:
         model = Assignment
         fields = ["course", "title", "description", "due_date", "priority", "estimated_hours"]
+        field_classes = {"course": CourseChoiceField}
         widgets = {
             "title": forms.TextInput(attrs={
                 "class": "form-control",
@@ -64,16 +170,11 @@ class AssignmentForm(forms.ModelForm):
             }),
         }
 
-    def __init__(self, *args, user=None, **kwargs):
-        super().__init__(*args, **kwargs)
-        if user:
-            self.fields['course'].queryset = Course.objects.filter(user=user)
-            self.fields['course'].widget.attrs.update({"class": "form-select"})
-
-class ExamForm(forms.ModelForm):
+class ExamForm(CourseScopedFormMixin, forms.ModelForm):
     class Meta:
         model = Exam
         fields = ["course", "title", "exam_type", "exam_date", "duration", "location", "notes"]
+        field_classes = {"course": CourseChoiceField}
         widgets = {
             "title": forms.TextInput(attrs={
                 "class": "form-control",
@@ -89,7 +190,7 @@ class ExamForm(forms.ModelForm):
             "duration": forms.NumberInput(attrs={
                 "class": "form-control",
                 "min": 15,
-                "max": 480,
+                "max": Exam.MAX_DURATION_MINUTES,
                 "placeholder": "Duration in minutes"
             }),
             "location": forms.TextInput(attrs={
@@ -103,16 +204,11 @@ class ExamForm(forms.ModelForm):
             }),
         }
 
-    def __init__(self, *args, user=None, **kwargs):
-        super().__init__(*args, **kwargs)
-        if user:
-            self.fields['course'].queryset = Course.objects.filter(user=user)
-            self.fields['course'].widget.attrs.update({"class": "form-select"})
-
-class AttendanceForm(forms.ModelForm):
+class AttendanceForm(CourseScopedFormMixin, forms.ModelForm):
     class Meta:
         model = Attendance
         fields = ["course", "date", "present", "notes"]
+        field_classes = {"course": CourseChoiceField}
         widgets = {
             "date": forms.DateInput(attrs={
                 "type": "date",
@@ -128,13 +224,20 @@ class AttendanceForm(forms.ModelForm):
             }),
         }
 
-    def __init__(self, *args, user=None, **kwargs):
-        super().__init__(*args, **kwargs)
-        if user:
-            self.fields['course'].queryset = Course.objects.filter(user=user)
-            self.fields['course'].widget.attrs.update({"class": "form-select"})
-
 class CalendarEventForm(forms.ModelForm):
+    repeat = forms.ChoiceField(
+        choices=recurrence.REPEAT_CHOICES,
+        required=False,
+        widget=forms.Select(attrs={"class": "form-select"})
+    )
+    repeat_until = forms.DateField(
+        required=False,
+        widget=forms.DateInput(attrs={
+            "type": "date",
+            "class": "form-control"
+        })
+    )
+
     class Meta:
         model = CalendarEvent
         fields = ["title", "event_date", "end_date", "description", "event_type", "location", "color"]
@@ -169,7 +272,7 @@ class CalendarEventForm(forms.ModelForm):
             }),
         }
 
-    def __init__(self, *args, user=None, **kwargs):
+    def __init__(self, *args, user=None, courses=None, **kwargs):
         super().__init__(*args, **kwargs)
         # Note: self.user is not needed here as it's not used in this form.
         # But including it prevents the TypeError.
@@ -181,13 +284,41 @@ class CalendarEventForm(forms.ModelForm):
         
         if end_date and event_date and end_date <= event_date:
             raise forms.ValidationError("End date must be after start date.")
+
+        repeat_until = cleaned_data.get('repeat_until')
+        if repeat_until and event_date and repeat_until < timezone.localdate(event_date):
+            raise forms.ValidationError("Repeat-until date must be on or after the start date.")
+
+        repeat = cleaned_data.get('repeat')
+        if repeat and event_date:
+            until = None
+            if repeat_until:
+                # Inclusive: occurrences on the final day still count.
+                until = timezone.make_aware(datetime.combine(repeat_until, time.max))
+            rule = recurrence.build_rule(repeat, until)
+            try:
+                recurrence.validate_rule(rule, event_date)
+            except ValueError as exc:
+                raise forms.ValidationError(str(exc))
+            cleaned_data['recurrence_rule'] = rule
         
         return cleaned_data
 
+    def save(self, commit=True):
+        event = super().save(commit=False)
+        if self.cleaned_data.get('recurrence_rule'):
+            event.recurrence_rule = self.cleaned_data['recurrence_rule']
+        if commit:
+            event.save()
+        return event
+
 class AssignmentEditForm(forms.ModelForm):
     class Meta:
         model = Assignment
-        fields = ["title", "description", "due_date", "priority", "estimated_hours", "completed"]
+        fields = [
+            "title", "description", "due_date", "priority", "estimated_hours", "completed",
+            "category", "score", "max_score",
+        ]
         widgets = {
             "title": forms.TextInput(attrs={"class": "form-control"}),
             "description": forms.Textarea(attrs={"class": "form-control", "rows": 3}),
@@ -195,4 +326,12 @@ class AssignmentEditForm(forms.ModelForm):
             "priority": forms.Select(attrs={"class": "form-select"}),
             "estimated_hours": forms.NumberInput(attrs={"class": "form-control", "min": 1}),
             "completed": forms.CheckboxInput(attrs={"class": "form-check-input"}),
-        }
\ No newline at end of file
+            "category": forms.Select(attrs={"class": "form-select"}),
+            "score": forms.NumberInput(attrs={"class": "form-control", "min": 0, "step": "any"}),
+            "max_score": forms.NumberInput(attrs={"class": "form-control", "min": 0, "step": "any"}),
+        }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Only the assignment's own course's categories can be chosen
+        self.fields['category'].queryset = GradeCategory.objects.filter(course_id=self.instance.course_id)
\ No newline at end of file
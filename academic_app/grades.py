@@ -0,0 +1,231 @@
+# academic_app/grades.py
+"""
+Course grades from weighted categories, and "what-if" projections.
+
+Within a category items count by points (``max_score``); categories count
+by their ``weight``, renormalised over the categories that have items. A
+course without categories is graded on plain points.
+
+Projections are worked out directly from the weights: the final grade is
+the graded part plus each ungraded item's weight times its score, so the
+range, the average needed on the rest and the score needed on each item
+are closed-form and cost O(items x letters) whatever the course size.
+"""
+import math
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from django.core.cache import cache
+
+from .caching import get_data_version
+from .models import Assignment, Course, Exam, GradeCategory
+
+LETTER_GRADES = (("A", 90.0), ("B", 80.0), ("C", 70.0), ("D", 60.0))
+
+# Score assumed for the other remaining items when solving for one item,
+# if the student has nothing graded yet to go by.
+DEFAULT_ASSUMED_PERCENT = 85.0
+
+GRADES_CACHE_TIMEOUT = 60 * 60
+GRADES_CACHE_KEY = "academic:grades:{user_id}:{version}"
+
+
+@dataclass(frozen=True)
+class GradeItem:
+    kind: str
+    id: int
+    title: str
+    category: str
+    weight: float  # Share of the course grade, all items summing to 1
+    max_score: float
+    score: Optional[float]
+
+    @property
+    def key(self):
+        return f"{self.kind}:{self.id}"
+
+    @property
+    def percent(self):
+        return None if self.score is None else self.score / self.max_score * 100
+
+
+def letter_for(percent):
+    if percent is None:
+        return None
+    for letter, cutoff in LETTER_GRADES:
+        if percent >= cutoff:
+            return letter
+    return "F"
+
+
+def percent_value(value):
+    """``value`` as a float percentage; ValueError unless it is a finite number from 0 to 100."""
+    percent = float(value)
+    if not math.isfinite(percent) or not 0 <= percent <= 100:
+        raise ValueError(f"{value!r} is not a percentage from 0 to 100")
+    return percent
+
+
+def target_cutoff(target):
+    """Accepts a letter ('A', 'b') or a percentage and returns the percentage."""
+    cutoffs = dict(LETTER_GRADES)
+    if isinstance(target, str) and target.strip().upper() in cutoffs:
+        return cutoffs[target.strip().upper()]
+    return percent_value(target)
+
+
+def grade_items(categories, items):
+    """
+    Weights ``items`` — ``(kind, obj)`` pairs for Assignments and Exams —
+    against ``categories``. Uncategorised items are left out when the course
+    has categories.
+    """
+    categories = {category.id: category for category in categories}
+    groups = defaultdict(list)
+    for kind, obj in items:
+        if categories and obj.category_id not in categories:
+            continue
+        groups[obj.category_id if categories else None].append((kind, obj))
+
+    group_weight = {
+        category_id: (categories[category_id].weight if categories else 1.0)
+        for category_id in groups
+    }
+    total_weight = sum(group_weight.values())
+    if not total_weight:
+        return []
+
+    result = []
+    for category_id, members in groups.items():
+        points = sum(obj.max_score for _, obj in members)
+        share = group_weight[category_id] / total_weight
+        name = categories[category_id].name if categories else "Points"
+        for kind, obj in members:
+            result.append(GradeItem(
+                kind, obj.id, obj.title, name, share * obj.max_score / points, obj.max_score, obj.score,
+            ))
+    return result
+
+
+def _needed(value):
+    """Rounds a required percentage; None when it is above 100 (out of reach)."""
+    if value <= 0:
+        return 0.0
+    return round(float(value), 1) if value <= 100 else None
+
+
+def project(items, overrides=None, assume=None, target=None):
+    """
+    Current grade and what-if projections for a list of GradeItems.
+
+    ``overrides`` maps item keys ("exam:3") to hypothetical percentages,
+    which are treated as if graded. ``assume`` is the percentage the other
+    remaining items are taken to score when solving for one item; it
+    defaults to the current grade. ``target`` (a letter or percentage) adds
+    the scores needed for that grade alongside the letter cutoffs.
+    """
+    overrides = {key: percent_value(value) for key, value in (overrides or {}).items()}
+    letters = [letter for letter, _ in LETTER_GRADES]
+    cutoffs = np.array([cutoff for _, cutoff in LETTER_GRADES])
+    if target is not None:
+        letters.append("target")
+        cutoffs = np.append(cutoffs, target_cutoff(target))
+
+    weights = np.array([item.weight for item in items], dtype=float)
+    percents = np.array([
+        overrides.get(item.key, np.nan if item.percent is None else item.percent) for item in items
+    ], dtype=float)
+    graded = ~np.isnan(percents)
+    ungraded_items = [item for item, is_graded in zip(items, graded) if not is_graded]
+
+    graded_weight = weights[graded].sum()
+    known = float(weights[graded] @ percents[graded]) if graded.any() else 0.0
+    current = known / graded_weight if graded_weight else None
+
+    remaining = weights[~graded]
+    remaining_weight = remaining.sum()
+    # Final grade with zero and with full marks on everything left.
+    lowest, highest = known, known + 100 * remaining_weight
+
+    # Average score needed on everything left, per letter.
+    if remaining_weight:
+        uniform = (cutoffs - known) / remaining_weight
+    else:
+        uniform = np.where(known >= cutoffs, 0.0, np.inf)
+
+    # Score needed on each remaining item, per letter, if the rest score `assume`.
+    assumed = percent_value(assume) if assume is not None else (
+        current if current is not None else DEFAULT_ASSUMED_PERCENT
+    )
+    others = (remaining_weight - remaining) * assumed
+    with np.errstate(divide="ignore", invalid="ignore"):  # Zero-weight items can't move the grade
+        needed = (cutoffs[:, None] - known - others[None, :]) / remaining[None, :]
+
+    return {
+        "current": None if current is None else round(current, 1),
+        "current_letter": letter_for(current),
+        "graded_weight": round(float(graded_weight) * 100, 1),
+        "projected_min": round(float(lowest), 1),
+        "projected_max": round(float(highest), 1),
+        "target": None if target is None else float(cutoffs[-1]),
+        # "secured" even with zeros on the rest, "reachable" with enough, else "out of reach".
+        "outlook": {
+            letter: "secured" if lowest >= cutoff else "reachable" if highest >= cutoff else "out of reach"
+            for letter, cutoff in zip(letters, cutoffs)
+        },
+        "needed_average": {letter: _needed(value) for letter, value in zip(letters, uniform)},
+        "assumed_percent": round(assumed, 1),
+        "remaining": [
+            {
+                "key": item.key,
+                "title": item.title,
+                "category": item.category,
+                "weight": round(item.weight * 100, 1),
+                "max_score": item.max_score,
+                "needed": {letter: _needed(needed[row, column]) for row, letter in enumerate(letters)},
+            }
+            for column, item in enumerate(ungraded_items)
+        ],
+    }
+
+
+def _load(courses):
+    """``{course_id: [GradeItem, ...]}`` for ``courses`` in three queries."""
+    course_ids = [course.id for course in courses]
+    categories, items = defaultdict(list), defaultdict(list)
+    for category in GradeCategory.objects.filter(course_id__in=course_ids):
+        categories[category.course_id].append(category)
+    fields = ("id", "course_id", "title", "category_id", "score", "max_score")
+    for assignment in Assignment.objects.filter(course_id__in=course_ids).only(*fields):
+        items[assignment.course_id].append(("assignment", assignment))
+    for exam in Exam.objects.filter(course_id__in=course_ids).only(*fields):
+        items[exam.course_id].append(("exam", exam))
+    return {course_id: grade_items(categories[course_id], items[course_id]) for course_id in course_ids}
+
+
+def course_projection(course, overrides=None, assume=None, target=None):
+    return project(_load([course])[course.id], overrides=overrides, assume=assume, target=target)
+
+
+def compute_grade_summaries(user):
+    courses = list(Course.objects.current().filter(user=user))
+    items = _load(courses)
+    summaries = []
+    for course in courses:
+        if not items[course.id]:
+            continue
+        summary = project(items[course.id])
+        summaries.append({"course_id": course.id, "course": course.name, "code": course.code, **summary})
+    return summaries
+
+
+def get_grade_summaries(user):
+    """Projections for every course with gradable work, cached until the user's data changes."""
+    key = GRADES_CACHE_KEY.format(user_id=user.id, version=get_data_version(user.id))
+    summaries = cache.get(key)
+    if summaries is None:
+        summaries = compute_grade_summaries(user)
+        cache.set(key, summaries, GRADES_CACHE_TIMEOUT)
+    return summaries
@@ -0,0 +1,203 @@
+# academic_app/jobs.py
+"""
+A small background job queue stored in the ``Job`` table.
+
+Tasks are plain functions registered with ``@task("name")`` that take the
+job's JSON payload and return a JSON-serialisable result. ``enqueue``
+writes a row; ``manage.py run_jobs`` workers claim rows in priority order
+and run them.
+
+Claiming is a conditional ``UPDATE`` that only succeeds while the row is
+still claimable, so it is safe with any number of workers on any
+database. A claimed job is hidden from other workers until its lock
+(the visibility timeout) expires; a worker that dies mid-job therefore
+only delays it. Failures are retried with exponential backoff until
+``max_attempts`` is reached.
+"""
+import logging
+import os
+import socket
+import time
+import traceback
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = timedelta(minutes=5)
+RETRY_BASE_DELAY = timedelta(seconds=10)
+MAX_RETRY_DELAY = timedelta(hours=1)
+
+# Finished jobs are kept this long for status polling, then purged by workers.
+FINISHED_RETENTION = timedelta(days=7)
+
+
+@dataclass(frozen=True)
+class Task:
+    name: str
+    func: object
+    max_attempts: int
+    timeout: timedelta
+
+
+_registry = {}
+
+
+def task(name, max_attempts=3, timeout=DEFAULT_TIMEOUT):
+    """Registers ``func`` as the task ``name``."""
+    def register(func):
+        _registry[name] = Task(name, func, max_attempts, timeout)
+        return func
+    return register
+
+
+def get_task(name):
+    return _registry.get(name)
+
+
+def enqueue(name, payload=None, user=None, priority=0, delay=None):
+    """
+    Queues the task ``name`` and returns its Job. Runs it straight away in
+    this process instead when ``JOBS_EAGER`` is set (development, tests).
+    """
+    registered = get_task(name)
+    if registered is None:
+        raise ValueError(f"Unknown task: {name}")
+    job = Job.objects.create(
+        task=name,
+        payload=payload or {},
+        user=user,
+        priority=priority,
+        max_attempts=registered.max_attempts,
+        run_at=timezone.now() + (delay or timedelta()),
+    )
+    if getattr(settings, "JOBS_EAGER", False):
+        transaction.on_commit(lambda: run_job(job.pk, worker_id="eager"))
+    return job
+
+
+def _claimable(now):
+    return Q(status="queued", run_at__lte=now) | Q(status="running", locked_until__lt=now)
+
+
+def claim(worker_id, now=None):
+    """Claims the most urgent runnable job for ``worker_id``, or returns None."""
+    now = now or timezone.now()
+    candidates = Job.objects.filter(_claimable(now)).order_by("-priority", "run_at", "id")
+    # A few candidates at once, so workers racing for the head of the queue
+    # can fall through to the next one instead of polling again.
+    for job_id, task_name, status, attempts, max_attempts in candidates.values_list(
+        "id", "task", "status", "attempts", "max_attempts"
+    )[:5]:
+        if status == "running" and attempts >= max_attempts:
+            # Its worker died or overran on the last attempt; don't run it again.
+            Job.objects.filter(_claimable(now), pk=job_id).update(
+                status="failed", finished_at=now, locked_until=None, updated_at=now,
+                error="Timed out: the visibility timeout expired during the last attempt.",
+            )
+            continue
+        registered = get_task(task_name)
+        timeout = registered.timeout if registered else DEFAULT_TIMEOUT
+        claimed = Job.objects.filter(_claimable(now), pk=job_id).update(
+            status="running",
+            locked_by=worker_id,
+            locked_until=now + timeout,
+            attempts=F("attempts") + 1,
+            updated_at=now,
+        )
+        if claimed:
+            return Job.objects.get(pk=job_id)
+    return None
+
+
+def _finish(job, worker_id, **fields):
+    """Records a job's outcome unless another worker has taken it over since."""
+    return Job.objects.filter(pk=job.pk, status="running", locked_by=worker_id).update(
+        updated_at=timezone.now(), **fields
+    )
+
+
+def execute(job, worker_id):
+    """Runs a claimed job and records success, a retry or the final failure."""
+    registered = get_task(job.task)
+    try:
+        if registered is None:
+            raise LookupError(f"Unknown task: {job.task}")
+        result = registered.func(job.payload, job)
+    except Exception as exc:
+        error = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+        if job.attempts < job.max_attempts and registered is not None:
+            delay = min(RETRY_BASE_DELAY * 2 ** (job.attempts - 1), MAX_RETRY_DELAY)
+            logger.warning("Job %s (%s) failed, retrying in %s: %s", job.pk, job.task, delay, exc)
+            _finish(job, worker_id, status="queued", run_at=timezone.now() + delay,
+                    locked_by="", locked_until=None, error=error)
+        else:
+            logger.error("Job %s (%s) failed permanently: %s", job.pk, job.task, exc)
+            _finish(job, worker_id, status="failed", finished_at=timezone.now(),
+                    locked_until=None, error=error)
+        return False
+    _finish(job, worker_id, status="succeeded", result=result, error="", finished_at=timezone.now(), locked_until=None)
+    return True
+
+
+def run_job(job_id, worker_id):
+    """Claims one specific job (if still runnable) and executes it."""
+    now = timezone.now()
+    task_name = Job.objects.filter(pk=job_id).values_list("task", flat=True).first()
+    registered = get_task(task_name)
+    if not Job.objects.filter(_claimable(now), pk=job_id).update(
+        status="running", locked_by=worker_id, attempts=F("attempts") + 1,
+        locked_until=now + (registered.timeout if registered else DEFAULT_TIMEOUT), updated_at=now,
+    ):
+        return None
+    return execute(Job.objects.get(pk=job_id), worker_id)
+
+
+def purge_finished(now=None):
+    cutoff = (now or timezone.now()) - FINISHED_RETENTION
+    return Job.objects.filter(status__in=("succeeded", "failed"), finished_at__lt=cutoff).delete()[0]
+
+
+def default_worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class Worker:
+    """Polls for jobs and runs them one at a time, backing off while the queue is empty."""
+
+    def __init__(self, worker_id=None, min_poll=0.2, max_poll=5.0):
+        self.worker_id = worker_id or default_worker_id()
+        self.min_poll, self.max_poll = min_poll, max_poll
+
+    def run(self, burst=False, max_jobs=None):
+        """Runs jobs until interrupted; with ``burst``, only until the queue is empty."""
+        processed = 0
+        poll = self.min_poll
+        last_purge = None
+        while max_jobs is None or processed < max_jobs:
+            close_old_connections()
+            if last_purge is None or time.monotonic() - last_purge > 3600:
+                purge_finished()
+                last_purge = time.monotonic()
+            job = claim(self.worker_id)
+            if job is None:
+                if burst:
+                    break
+                time.sleep(poll)
+                poll = min(poll * 2, self.max_poll)
+                continue
+            poll = self.min_poll
+            try:
+                execute(job, self.worker_id)
+            except Exception:
+                # e.g. a result that isn't JSON-serialisable; the lock expires and it is retried
+                logger.exception("Job %s (%s) could not be recorded", job.pk, job.task)
+            processed += 1
+        return processed
@@ -0,0 +1,36 @@
+# academic_app/management/commands/archive_terms.py
+from django.core.management.base import BaseCommand
+
+from academic_app.terms import archive_term, closed_terms
+
+
+class Command(BaseCommand):
+    help = (
+        "Moves the courses of terms that ended more than TERM_ARCHIVE_AFTER_DAYS ago, "
+        "with their assignments, exams and attendance, into compressed term archives."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--after-days", type=int, help="Override TERM_ARCHIVE_AFTER_DAYS")
+        parser.add_argument("--dry-run", action="store_true", help="List the terms that would be archived")
+
+    def handle(self, *args, **options):
+        terms = list(closed_terms(after_days=options["after_days"]).select_related("user").order_by("end_date"))
+        if not terms:
+            self.stdout.write("No terms to archive")
+            return
+
+        archived = 0
+        for term in terms:
+            label = f"{term.user.username}: {term.name} (ended {term.end_date})"
+            if options["dry_run"]:
+                self.stdout.write(f"Would archive {label}")
+                continue
+            archive = archive_term(term)
+            if archive is None:
+                continue
+            archived += 1
+            rows = ", ".join(f"{count} {key.replace('_', ' ')}" for key, count in archive.counts.items())
+            self.stdout.write(f"Archived {label}: {rows}, {len(archive.snapshot):,} bytes")
+        if not options["dry_run"]:
+            self.stdout.write(f"Archived {archived} term(s)")
@@ -0,0 +1,40 @@
+# academic_app/management/commands/benchmark_dashboard.py
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import RequestFactory
+
+from academic_app.benchmarking import measure, seed_user
+from academic_app.caching import bump_data_version
+from academic_app.views import dashboard
+
+
+class Command(BaseCommand):
+    help = "Benchmarks rendering of the dashboard with a cold and a warm fragment cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=50)
+        parser.add_argument("--courses", type=int, default=8)
+        parser.add_argument("--items", type=int, default=20, help="Assignments, exams and events per course")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            user = seed_user("__benchmark_dashboard__", options["courses"], options["items"])
+            request = RequestFactory().get("/")
+            request.user = user
+
+            def render():
+                response = dashboard(request)
+                assert response.status_code == 200
+
+            # First render compiles the templates; keep it out of both series.
+            render()
+
+            cold = measure("cold fragment cache", render, options["iterations"],
+                           before_each=lambda: bump_data_version(user.id))
+            warm = measure("warm fragment cache", render, options["iterations"])
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(str(cold))
+        self.stdout.write(str(warm))
+        self.stdout.write(f"speedup (median)             {cold.median / warm.median:8.2f}x")
@@ -0,0 +1,70 @@
+# academic_app/management/commands/benchmark_recurrence.py
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import RequestFactory
+from django.utils import timezone
+
+from academic_app.benchmarking import measure
+from academic_app.models import CalendarEvent
+from academic_app.views import calendar_data
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares calendar_data for a year of weekly events stored as one row per "
+        "occurrence against the same events stored as recurrence rules."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=30)
+        parser.add_argument("--series", type=int, default=10, help="Number of weekly series (labs, office hours, ...)")
+        parser.add_argument("--weeks", type=int, default=52)
+
+    def handle(self, *args, **options):
+        series, weeks = options["series"], options["weeks"]
+        start = timezone.now().replace(hour=9, minute=0, second=0, microsecond=0)
+        windows = {
+            "month": (start, start + timedelta(days=31)),
+            "year": (start, start + timedelta(weeks=weeks)),
+        }
+
+        with transaction.atomic():
+            expanded_user = User.objects.create_user("__benchmark_expanded__")
+            rule_user = User.objects.create_user("__benchmark_rules__")
+            CalendarEvent.objects.bulk_create([
+                CalendarEvent(
+                    user=expanded_user,
+                    title=f"Series {s}",
+                    event_date=start + timedelta(days=s % 7, weeks=w, hours=s),
+                    end_date=start + timedelta(days=s % 7, weeks=w, hours=s + 1),
+                )
+                for s in range(series) for w in range(weeks)
+            ])
+            for s in range(series):
+                CalendarEvent.objects.create(
+                    user=rule_user,
+                    title=f"Series {s}",
+                    event_date=start + timedelta(days=s % 7, hours=s),
+                    end_date=start + timedelta(days=s % 7, hours=s + 1),
+                    recurrence_rule=f"FREQ=WEEKLY;COUNT={weeks}",
+                )
+
+            self.stdout.write(
+                f"rows stored: expanded {CalendarEvent.objects.filter(user=expanded_user).count()}, "
+                f"rules {CalendarEvent.objects.filter(user=rule_user).count()}"
+            )
+            factory = RequestFactory()
+            for window, (window_start, window_end) in windows.items():
+                for label, user in (("expanded rows", expanded_user), ("rule rows", rule_user)):
+                    request = factory.get("/calendar-data/", {
+                        "start": window_start.isoformat(),
+                        "end": window_end.isoformat(),
+                    })
+                    request.user = user
+                    timing = measure(f"{window:<6} {label}", lambda: calendar_data(request), options["iterations"])
+                    self.stdout.write(f"{timing}   payload {len(calendar_data(request).content)} bytes")
+
+            transaction.set_rollback(True)
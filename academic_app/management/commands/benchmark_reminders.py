@@ -0,0 +1,71 @@
+# academic_app/management/commands/benchmark_reminders.py
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from academic_app.benchmarking import measure, seed_user
+from academic_app.models import Assignment, Exam, Reminder, UserPreferences
+from academic_app.reminders import ReminderWorker, lead_times, schedule_all
+
+
+class Command(BaseCommand):
+    help = (
+        "Times one reminder worker tick (heap of the loaded window) against scanning "
+        "every pending assignment and exam for due reminders."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=30)
+        parser.add_argument("--users", type=int, default=20)
+        parser.add_argument("--items", type=int, default=200, help="Assignments and exams per course")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            users = [
+                seed_user(f"__benchmark_reminders_{i}__", courses=5, items_per_course=options["items"])
+                for i in range(options["users"])
+            ]
+            User.objects.filter(id__in=[user.id for user in users]).update(email="student@example.com")
+            self.stdout.write(f"scheduled {schedule_all(user_ids=[user.id for user in users])} reminders")
+            now = timezone.now()
+            # As if scheduled a while ago, so ticks only see genuinely new changes.
+            Reminder.objects.update(updated_at=now - timedelta(hours=1))
+
+            def table_scan():
+                due = []
+                preferences = {pref.user_id: pref for pref in UserPreferences.objects.all()}
+                default = UserPreferences()
+                for kind, items, field in (
+                    ("assignment", Assignment.objects.filter(completed=False, due_date__gt=now), "due_date"),
+                    ("exam", Exam.objects.filter(exam_date__gt=now), "exam_date"),
+                ):
+                    for item in items.select_related("course"):
+                        lead = lead_times(preferences.get(item.course.user_id, default))[kind]
+                        if getattr(item, field) - lead <= now:
+                            due.append(item)
+                return due
+
+            # The locmem backend keeps timings to the worker itself rather than SMTP.
+            worker = ReminderWorker(connection=mail.get_connection("django.core.mail.backends.locmem.EmailBackend"))
+            clock = [now]
+
+            def advance(seconds):
+                clock[0] += timedelta(seconds=seconds)
+
+            first = measure("first tick (loads window)", lambda: worker.tick(clock[0]), 1)
+            idle = measure("idle tick", lambda: worker.tick(clock[0]), options["iterations"],
+                           before_each=lambda: advance(1))
+            # Jump a day ahead so every tick has reminders to send.
+            advance(24 * 60 * 60)
+            busy = measure("tick sending reminders", lambda: worker.tick(clock[0]), options["iterations"],
+                           before_each=lambda: advance(30 * 60))
+            scan = measure("table scan per tick", table_scan, options["iterations"])
+            for timing in (first, idle, busy, scan):
+                self.stdout.write(str(timing))
+            self.stdout.write(f"heap size {len(worker.heap)}, emails sent {len(mail.outbox)}")
+
+            transaction.set_rollback(True)
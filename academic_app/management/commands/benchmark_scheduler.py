@@ -0,0 +1,58 @@
+# academic_app/management/commands/benchmark_scheduler.py
+import random
+from datetime import time, timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from academic_app.benchmarking import measure
+from academic_app.scheduler import StudyTask, plan_study_blocks, study_windows
+
+
+class Command(BaseCommand):
+    help = "Benchmarks the study scheduler on synthetic assignments and busy intervals (no database)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--assignments", type=int, nargs="+", default=[100, 500])
+        parser.add_argument("--busy", type=int, nargs="+", default=[1000, 5000])
+        parser.add_argument("--days", type=int, default=120)
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        tz = timezone.get_current_timezone()
+        now = timezone.now().replace(second=0, microsecond=0)
+        days = options["days"]
+        windows = study_windows(now, now + timedelta(days=days), time(8, 0), time(23, 0), tz)
+        priorities = ["low", "medium", "high", "urgent"]
+
+        for assignment_count in options["assignments"]:
+            tasks = [
+                StudyTask(
+                    id=i,
+                    title=f"Assignment {i}",
+                    course=f"Course {i % 8}",
+                    color="#007bff",
+                    due=now + timedelta(minutes=rng.randrange(60, days * 24 * 60)),
+                    priority=rng.choice(priorities),
+                    minutes=60 * rng.randint(1, 8),
+                )
+                for i in range(assignment_count)
+            ]
+            for busy_count in options["busy"]:
+                busy = []
+                for _ in range(busy_count):
+                    start = now + timedelta(minutes=rng.randrange(0, days * 24 * 60))
+                    busy.append((start, start + timedelta(minutes=rng.choice([30, 60, 90, 120, 180]))))
+
+                result = {}
+
+                def run():
+                    result["plan"] = plan_study_blocks(tasks, busy, windows, max_block_minutes=90, max_minutes_per_day=360, tz=tz)
+
+                timing = measure(f"{assignment_count} tasks / {busy_count} busy", run, options["iterations"])
+                plan = result["plan"]
+                self.stdout.write(
+                    f"{timing}   blocks {len(plan.blocks)}   short {sum(plan.unscheduled.values()) / 60:.0f} h"
+                )
@@ -0,0 +1,84 @@
+# academic_app/management/commands/benchmark_startup.py
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Runs in a fresh interpreter, playing a new worker: load the WSGI app,
+# optionally warm up, then serve the same request twice.
+PROBE = """
+import json, os, sys, time
+started = time.perf_counter()
+from django.core.wsgi import get_wsgi_application
+application = get_wsgi_application()
+if os.environ.get("PROBE_WARMUP"):
+    from academic_app import warmup
+    warmup.run(os.environ["PROBE_WARMUP"].split(","))
+ready = time.perf_counter()
+
+def serve(path):
+    from wsgiref.util import setup_testing_defaults
+    environ = {"PATH_INFO": path, "HTTP_HOST": "localhost"}
+    setup_testing_defaults(environ)
+    status = []
+    began = time.perf_counter()
+    result = application(environ, lambda code, headers, exc_info=None: status.append(code))
+    try:
+        b"".join(result)
+    finally:
+        getattr(result, "close", lambda: None)()
+    return (time.perf_counter() - began) * 1000, status[0]
+
+first_ms, first_status = serve(sys.argv[1])
+second_ms, _ = serve(sys.argv[1])
+print(json.dumps({
+    "ready_ms": (ready - started) * 1000,
+    "first_ms": first_ms,
+    "second_ms": second_ms,
+    "to_first_response_ms": (ready - started) * 1000 + first_ms,
+    "status": first_status,
+}))
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures time to the first request served by a fresh worker process, "
+        "with and without the warm-up hooks (academic_app/warmup.py)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per scenario")
+        parser.add_argument("--path", default="/accounts/login/", help="Request to serve")
+        parser.add_argument("--hooks", default="database,urls,templates,caches",
+                            help="Warm-up hooks for the warm scenario, comma separated")
+
+    def probe(self, path, hooks):
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": os.environ.get("DJANGO_SETTINGS_MODULE", settings.SETTINGS_MODULE)}
+        env.pop("PROBE_WARMUP", None)
+        if hooks:
+            env["PROBE_WARMUP"] = hooks
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE, path], env=env, cwd=settings.BASE_DIR,
+            capture_output=True, text=True, check=True,
+        )
+        return json.loads(result.stdout.strip().splitlines()[-1])
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        self.stdout.write(f"GET {path}, median of {options['runs']} fresh processes")
+        for label, hooks in (("cold", ""), (f"warm-up ({options['hooks']})", options["hooks"])):
+            runs = [self.probe(path, hooks) for _ in range(options["runs"])]
+            median = {key: statistics.median(run[key] for run in runs)
+                      for key in ("ready_ms", "first_ms", "second_ms", "to_first_response_ms")}
+            self.stdout.write(
+                f"{label}\n"
+                f"  ready to accept      {median['ready_ms']:8.1f} ms\n"
+                f"  first request        {median['first_ms']:8.1f} ms   (status {runs[0]['status']})\n"
+                f"  second request       {median['second_ms']:8.1f} ms\n"
+                f"  start to first reply {median['to_first_response_ms']:8.1f} ms"
+            )
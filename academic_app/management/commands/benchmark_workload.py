@@ -0,0 +1,62 @@
+# academic_app/management/commands/benchmark_workload.py
+from collections import defaultdict
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from academic_app import workload
+from academic_app.benchmarking import measure, seed_user
+from academic_app.caching import bump_data_version
+from academic_app.models import Assignment, Exam
+
+
+class Command(BaseCommand):
+    help = (
+        "Times the weekly workload forecast for a user with a multi-year history, "
+        "grouped in SQL versus bucketed in a Python loop, and from the cache."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=30)
+        parser.add_argument("--years", type=int, default=4)
+        parser.add_argument("--courses", type=int, default=10)
+
+    def handle(self, *args, **options):
+        days = 365 * options["years"]
+        with transaction.atomic():
+            # One item per course per day, shifted so most of the history lies in the past.
+            user = seed_user("__benchmark_workload__", courses=options["courses"], items_per_course=days)
+            Assignment.objects.filter(course__user=user).update(due_date=F("due_date") - timedelta(days=days // 2))
+            Exam.objects.filter(course__user=user).update(exam_date=F("exam_date") - timedelta(days=days))
+            self.stdout.write(
+                f"assignments {Assignment.objects.filter(course__user=user).count()}, "
+                f"exams {Exam.objects.filter(course__user=user).count()}"
+            )
+            today = timezone.localdate()
+            threshold = 20
+
+            def python_loop():
+                first = workload.week_start(today)
+                buckets = defaultdict(int)
+                for assignment in Assignment.objects.filter(course__user=user, completed=False):
+                    monday = workload.week_start(timezone.localtime(assignment.due_date).date())
+                    buckets[monday] += assignment.estimated_hours
+                for exam in Exam.objects.filter(course__user=user):
+                    monday = workload.week_start(timezone.localtime(exam.exam_date).date())
+                    buckets[monday] += workload.EXAM_PREP_HOURS.get(exam.exam_type, workload.DEFAULT_EXAM_PREP_HOURS)
+                return [buckets[first + timedelta(weeks=w)] for w in range(workload.DEFAULT_WEEKS)]
+
+            iterations = options["iterations"]
+            for timing in (
+                measure("python loop", python_loop, iterations),
+                measure("sql group by", lambda: workload.compute_workload(user, today, workload.DEFAULT_WEEKS, threshold), iterations),
+                measure("cold (cache miss)", lambda: workload.get_workload(user), iterations,
+                        before_each=lambda: bump_data_version(user.id)),
+                measure("warm (cached)", lambda: workload.get_workload(user), iterations),
+            ):
+                self.stdout.write(str(timing))
+
+            transaction.set_rollback(True)
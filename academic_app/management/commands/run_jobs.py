@@ -0,0 +1,49 @@
+# academic_app/management/commands/run_jobs.py
+import multiprocessing
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from academic_app.jobs import Worker, default_worker_id
+
+
+def _work(index, burst):
+    # Each process opens its own database connection on first use.
+    Worker(worker_id=f"{default_worker_id()}:{index}").run(burst=burst)
+
+
+class Command(BaseCommand):
+    help = "Runs background job workers that claim and execute queued jobs."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--processes", type=int, default=1, help="Number of worker processes")
+        parser.add_argument("--burst", action="store_true", help="Exit once the queue is empty")
+
+    def handle(self, *args, **options):
+        processes, burst = options["processes"], options["burst"]
+        if processes <= 1:
+            self.stdout.write(f"Job worker {default_worker_id()} started")
+            try:
+                count = Worker().run(burst=burst)
+            except KeyboardInterrupt:
+                self.stdout.write("Job worker stopped")
+                return
+            self.stdout.write(f"Processed {count} job(s)")
+            return
+
+        # Forked children must not share the parent's database connections.
+        connections.close_all()
+        workers = [
+            multiprocessing.Process(target=_work, args=(index, burst), daemon=True)
+            for index in range(processes)
+        ]
+        for worker in workers:
+            worker.start()
+        self.stdout.write(f"Started {processes} job workers")
+        try:
+            for worker in workers:
+                worker.join()
+        except KeyboardInterrupt:
+            for worker in workers:
+                worker.terminate()
+            self.stdout.write("Job workers stopped")
@@ -0,0 +1,34 @@
+# academic_app/management/commands/run_reminders.py
+from django.core.management.base import BaseCommand
+
+from academic_app.reminders import ReminderWorker, schedule_all
+
+
+class Command(BaseCommand):
+    help = "Runs the deadline reminder worker, emailing reminders through EMAIL_BACKEND as they fall due."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--interval", type=float, default=30, help="Seconds between ticks")
+        parser.add_argument("--once", action="store_true", help="Run a single tick and exit")
+        parser.add_argument(
+            "--rebuild", action="store_true",
+            help="Rebuild the reminder schedule from all assignments and exams first (e.g. after enabling reminders)",
+        )
+
+    def handle(self, *args, **options):
+        if options["rebuild"]:
+            self.stdout.write(f"Scheduled {schedule_all()} reminder(s)")
+
+        worker = ReminderWorker()
+        if options["once"]:
+            try:
+                self.stdout.write(f"Sent {worker.tick()} reminder email(s)")
+            finally:
+                worker.close()
+            return
+
+        self.stdout.write(f"Reminder worker running every {options['interval']:g}s (Ctrl+C to stop)")
+        try:
+            worker.run(interval=options["interval"])
+        except KeyboardInterrupt:
+            self.stdout.write("Reminder worker stopped")
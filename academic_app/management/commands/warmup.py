@@ -0,0 +1,15 @@
+# academic_app/management/commands/warmup.py
+from django.core.management.base import BaseCommand
+
+from academic_app import warmup
+
+
+class Command(BaseCommand):
+    help = "Runs the worker warm-up hooks in this process and reports how long each took."
+
+    def add_arguments(self, parser):
+        parser.add_argument("hooks", nargs="*", help="Hooks to run (default: WARMUP_HOOKS, else all)")
+
+    def handle(self, *args, **options):
+        for name, ms in warmup.run(options["hooks"] or None):
+            self.stdout.write(f"{name:<12} {ms:8.1f} ms")
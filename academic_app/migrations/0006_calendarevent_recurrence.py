@@ -0,0 +1,32 @@
+# Generated by Django 4.2.24 on 2026-10-19 15:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic_app', '0005_remove_attendance_unique_course_date_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='calendarevent',
+            name='recurrence_end',
+            field=models.DateTimeField(blank=True, editable=False, help_text='Start of the last occurrence (null if the rule never ends); derived on save', null=True),
+        ),
+        migrations.AddField(
+            model_name='calendarevent',
+            name='recurrence_exceptions',
+            field=models.JSONField(blank=True, default=list, help_text='UTC ISO start times of skipped occurrences'),
+        ),
+        migrations.AddField(
+            model_name='calendarevent',
+            name='recurrence_rule',
+            field=models.CharField(blank=True, default='', help_text="RRULE for repeating events, e.g. 'FREQ=WEEKLY;BYDAY=MO,WE' (blank for one-off events)", max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name='calendarevent',
+            index=models.Index(fields=['user', 'event_date'], name='academic_ap_user_id_d73771_idx'),
+        ),
+    ]
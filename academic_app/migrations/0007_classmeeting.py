@@ -0,0 +1,29 @@
+# Generated by Django 4.2.24 on 2026-10-19 15:43
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic_app', '0006_calendarevent_recurrence'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClassMeeting',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('weekday', models.PositiveSmallIntegerField(choices=[(0, 'Monday'), (1, 'Tuesday'), (2, 'Wednesday'), (3, 'Thursday'), (4, 'Friday'), (5, 'Saturday'), (6, 'Sunday')], help_text='Day of the week the class meets')),
+                ('start_time', models.TimeField(help_text='Class start time')),
+                ('end_time', models.TimeField(help_text='Class end time')),
+                ('location', models.CharField(blank=True, help_text='Room or building', max_length=200, null=True)),
+                ('course', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='meetings', to='academic_app.course')),
+            ],
+            options={
+                'ordering': ['weekday', 'start_time'],
+                'unique_together': {('course', 'weekday', 'start_time')},
+            },
+        ),
+    ]
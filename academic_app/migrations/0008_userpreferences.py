@@ -0,0 +1,32 @@
+# Generated by Django 4.2.24 on 2026-10-19 15:44
+
+import datetime
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('academic_app', '0007_classmeeting'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserPreferences',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('study_start_time', models.TimeField(default=datetime.time(18, 0), help_text='Earliest time of day to schedule study blocks')),
+                ('study_end_time', models.TimeField(default=datetime.time(22, 0), help_text='Latest time of day to schedule study blocks')),
+                ('max_study_hours_per_day', models.PositiveSmallIntegerField(default=4, help_text='Upper limit on scheduled study time per day (hours)')),
+                ('study_block_minutes', models.PositiveSmallIntegerField(default=60, help_text='Longest single study block before switching tasks (minutes)')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='planner_preferences', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name_plural': 'user preferences',
+            },
+        ),
+    ]
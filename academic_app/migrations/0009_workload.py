@@ -0,0 +1,26 @@
+# Generated by Django 4.2.24 on 2026-10-19 15:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic_app', '0008_userpreferences'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userpreferences',
+            name='weekly_workload_hours',
+            field=models.PositiveSmallIntegerField(default=20, help_text='Weeks with more assignment and exam preparation hours than this are flagged as overloaded'),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['course', 'due_date'], name='academic_ap_course__0d1c19_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exam',
+            index=models.Index(fields=['course', 'exam_date'], name='academic_ap_course__452b6e_idx'),
+        ),
+    ]
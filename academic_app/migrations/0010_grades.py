@@ -0,0 +1,59 @@
+# Generated by Django 4.2.24 on 2026-10-19 15:50
+
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic_app', '0009_workload'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='assignment',
+            name='max_score',
+            field=models.FloatField(default=100, help_text='Points available', validators=[django.core.validators.MinValueValidator(0.01)]),
+        ),
+        migrations.AddField(
+            model_name='assignment',
+            name='score',
+            field=models.FloatField(blank=True, help_text='Points earned (blank until graded)', null=True, validators=[django.core.validators.MinValueValidator(0)]),
+        ),
+        migrations.AddField(
+            model_name='exam',
+            name='max_score',
+            field=models.FloatField(default=100, help_text='Points available', validators=[django.core.validators.MinValueValidator(0.01)]),
+        ),
+        migrations.AddField(
+            model_name='exam',
+            name='score',
+            field=models.FloatField(blank=True, help_text='Points earned (blank until graded)', null=True, validators=[django.core.validators.MinValueValidator(0)]),
+        ),
+        migrations.CreateModel(
+            name='GradeCategory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text="Category name (e.g., 'Homework', 'Exams')", max_length=100)),
+                ('weight', models.FloatField(help_text='Share of the course grade (percent)', validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(100)])),
+                ('course', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='grade_categories', to='academic_app.course')),
+            ],
+            options={
+                'verbose_name_plural': 'grade categories',
+                'ordering': ['-weight', 'name'],
+                'unique_together': {('course', 'name')},
+            },
+        ),
+        migrations.AddField(
+            model_name='assignment',
+            name='category',
+            field=models.ForeignKey(blank=True, help_text='Grade category this counts towards', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='assignments', to='academic_app.gradecategory'),
+        ),
+        migrations.AddField(
+            model_name='exam',
+            name='category',
+            field=models.ForeignKey(blank=True, help_text='Grade category this counts towards', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='exams', to='academic_app.gradecategory'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 4.2.24 on 2026-10-19 15:52
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('academic_app', '0010_grades'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userpreferences',
+            name='assignment_reminder_hours',
+            field=models.PositiveSmallIntegerField(default=24, help_text='How long before an assignment is due to send its reminder (hours)'),
+        ),
+        migrations.AddField(
+            model_name='userpreferences',
+            name='email_reminders',
+            field=models.BooleanField(default=True, help_text='Email a reminder before assignments are due and before exams'),
+        ),
+        migrations.AddField(
+            model_name='userpreferences',
+            name='exam_reminder_hours',
+            field=models.PositiveSmallIntegerField(default=48, help_text='How long before an exam to send its reminder (hours)'),
+        ),
+        migrations.CreateModel(
+            name='Reminder',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('assignment', 'Assignment'), ('exam', 'Exam')], max_length=20)),
+                ('object_id', models.PositiveIntegerField()),
+                ('title', models.CharField(max_length=200)),
+                ('course_name', models.CharField(max_length=200)),
+                ('due_at', models.DateTimeField(help_text='Due date or exam start this reminder is for')),
+                ('fire_at', models.DateTimeField(help_text='When the reminder should be sent')),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reminders', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['fire_at'],
+                'indexes': [models.Index(fields=['sent_at', 'fire_at'], name='academic_ap_sent_at_5a0390_idx'), models.Index(fields=['updated_at'], name='academic_ap_updated_494dc9_idx')],
+                'unique_together': {('kind', 'object_id')},
+            },
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 4.2.24 on 2026-10-19 15:56
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('academic_app', '0011_reminders'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task', models.CharField(help_text='Registered task name', max_length=100)),
+                ('payload', models.JSONField(blank=True, default=dict)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('succeeded', 'Succeeded'), ('failed', 'Failed')], default='queued', max_length=10)),
+                ('priority', models.SmallIntegerField(default=0, help_text='Higher runs first')),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('max_attempts', models.PositiveSmallIntegerField(default=3)),
+                ('run_at', models.DateTimeField(default=django.utils.timezone.now, help_text='Not picked up before this time')),
+                ('locked_by', models.CharField(blank=True, default='', max_length=100)),
+                ('locked_until', models.DateTimeField(blank=True, help_text='Visibility timeout: a running job whose lock expires is picked up again', null=True)),
+                ('result', models.JSONField(blank=True, null=True)),
+                ('error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='jobs', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'priority', 'run_at'], name='academic_ap_status_6e5dc4_idx'), models.Index(fields=['status', 'locked_until'], name='academic_ap_status_e637ac_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 4.2.24 on 2026-10-19 16:15
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('academic_app', '0012_job'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Term',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text="Term name (e.g., 'Fall 2026')", max_length=100)),
+                ('start_date', models.DateField()),
+                ('end_date', models.DateField()),
+                ('archived_at', models.DateTimeField(blank=True, help_text="When the term's courses were moved out into its archive", null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='terms', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-start_date'],
+            },
+        ),
+        migrations.CreateModel(
+            name='TermArchive',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('snapshot', models.BinaryField(help_text='zlib-compressed JSON, one list of rows per table')),
+                ('counts', models.JSONField(default=dict, help_text='Rows archived per table')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('term', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='archive', to='academic_app.term')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='term',
+            field=models.ForeignKey(blank=True, help_text='Term the course runs in; courses without one always count as current', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='courses', to='academic_app.term'),
+        ),
+        migrations.AddIndex(
+            model_name='term',
+            index=models.Index(fields=['user', 'end_date'], name='academic_ap_user_id_79d970_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='term',
+            unique_together={('user', 'name')},
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.24 on 2026-10-19 16:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic_app', '0013_terms'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='course',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='course',
+            constraint=models.UniqueConstraint(condition=models.Q(('term__isnull', False)), fields=('user', 'term', 'code'), name='unique_course_code_per_term'),
+        ),
+        migrations.AddConstraint(
+            model_name='course',
+            constraint=models.UniqueConstraint(condition=models.Q(('term__isnull', True)), fields=('user', 'code'), name='unique_course_code_without_term'),
+        ),
+    ]
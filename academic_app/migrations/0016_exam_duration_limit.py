@@ -0,0 +1,19 @@
+# Generated by Django 4.2.24 on 2026-10-19 16:42
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic_app', '0015_cache_table'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='exam',
+            name='duration',
+            field=models.PositiveIntegerField(default=120, help_text='Duration in minutes', validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(480)]),
+        ),
+    ]
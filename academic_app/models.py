@@ -1,10 +1,68 @@
 from django.db import models
 from django.contrib.auth.models import User
-from django.core.validators import MinLengthValidator
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.validators import MaxValueValidator, MinLengthValidator, MinValueValidator
 from django.utils import timezone
+from datetime import time
+import json
+import zlib
+
+from . import recurrence
+
+
+class Term(models.Model):
+    """A semester or other teaching period grouping a user's courses (see academic_app/terms.py)."""
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="terms")
+    name = models.CharField(max_length=100, help_text="Term name (e.g., 'Fall 2026')")
+    start_date = models.DateField()
+    end_date = models.DateField()
+    archived_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text="When the term's courses were moved out into its archive"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ['user', 'name']
+        ordering = ['-start_date']
+        indexes = [
+            models.Index(fields=['user', 'end_date']),
+        ]
+
+    def __str__(self):
+        return self.name
+
+    def clean(self):
+        if self.start_date and self.end_date and self.end_date < self.start_date:
+            raise ValidationError({"end_date": "A term cannot end before it starts."})
+
+
+def in_current_term(prefix="", today=None):
+    """
+    Filter for courses (or, with ``prefix="course__"``, their items) in the
+    current term: courses with no term, or whose term has not ended yet.
+    """
+    today = today or timezone.localdate()
+    return models.Q(**{f"{prefix}term__isnull": True}) | models.Q(**{f"{prefix}term__end_date__gte": today})
+
+
+class CourseQuerySet(models.QuerySet):
+    def current(self, today=None):
+        return self.filter(in_current_term(today=today))
+
 
 class Course(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="courses")
+    term = models.ForeignKey(
+        Term,
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name="courses",
+        help_text="Term the course runs in; courses without one always count as current"
+    )
     name = models.CharField(
         max_length=200,
         validators=[MinLengthValidator(2)],
@@ -33,15 +91,50 @@ class Course(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+    objects = CourseQuerySet.as_manager()
     
     class Meta:
-        unique_together = ['user', 'code']
+        # A code is unique within a term, so a course can be taken again in a
+        # later one; term-less courses share one namespace.
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'term', 'code'],
+                condition=models.Q(term__isnull=False),
+                name='unique_course_code_per_term',
+            ),
+            models.UniqueConstraint(
+                fields=['user', 'code'],
+                condition=models.Q(term__isnull=True),
+                name='unique_course_code_without_term',
+            ),
+        ]
         ordering = ['name']
     
     def __str__(self):
         return f"{self.name} ({self.code})" if self.code else self.name
 
 
+class GradeCategory(models.Model):
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name="grade_categories")
+    name = models.CharField(
+        max_length=100,
+        help_text="Category name (e.g., 'Homework', 'Exams')"
+    )
+    weight = models.FloatField(
+        validators=[MinValueValidator(0), MaxValueValidator(100)],
+        help_text="Share of the course grade (percent)"
+    )
+
+    class Meta:
+        unique_together = ['course', 'name']
+        ordering = ['-weight', 'name']
+        verbose_name_plural = "grade categories"
+
+    def __str__(self):
+        return f"{self.course.name} - {self.name} ({self.weight:g}%)"
+
+
 class Assignment(models.Model):
     PRIORITY_CHOICES = [
         ('low', 'Low'),
@@ -73,11 +166,33 @@ class Assignment(models.Model):
         default=1,
         help_text="Estimated time to complete (hours)"
     )
+    category = models.ForeignKey(
+        GradeCategory,
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name="assignments",
+        help_text="Grade category this counts towards"
+    )
+    score = models.FloatField(
+        blank=True,
+        null=True,
+        validators=[MinValueValidator(0)],
+        help_text="Points earned (blank until graded)"
+    )
+    max_score = models.FloatField(
+        default=100,
+        validators=[MinValueValidator(0.01)],
+        help_text="Points available"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['due_date', 'priority']
+        indexes = [
+            models.Index(fields=['course', 'due_date']),
+        ]
     
     def __str__(self):
         return f"{self.title} ({self.course.name})"
@@ -95,6 +210,9 @@ class Exam(models.Model):
         ('project', 'Project'),
         ('presentation', 'Presentation'),
     ]
+    # Enforced by forms, the API and the agent tools; conflict checks rely
+    # on it to bound how far back an overlapping exam can start.
+    MAX_DURATION_MINUTES = 8 * 60
     
     course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name="exams")
     title = models.CharField(
@@ -111,6 +229,7 @@ class Exam(models.Model):
     exam_date = models.DateTimeField(help_text="Exam date and time")
     duration = models.PositiveIntegerField(
         default=120,
+        validators=[MinValueValidator(1), MaxValueValidator(MAX_DURATION_MINUTES)],
         help_text="Duration in minutes"
     )
     location = models.CharField(
@@ -124,11 +243,33 @@ class Exam(models.Model):
         null=True,
         help_text="Additional notes or topics to study"
     )
+    category = models.ForeignKey(
+        GradeCategory,
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name="exams",
+        help_text="Grade category this counts towards"
+    )
+    score = models.FloatField(
+        blank=True,
+        null=True,
+        validators=[MinValueValidator(0)],
+        help_text="Points earned (blank until graded)"
+    )
+    max_score = models.FloatField(
+        default=100,
+        validators=[MinValueValidator(0.01)],
+        help_text="Points available"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['exam_date']
+        indexes = [
+            models.Index(fields=['course', 'exam_date']),
+        ]
     
     def __str__(self):
         return f"{self.title} ({self.course.name})"
@@ -154,6 +295,39 @@ class Attendance(models.Model):
         return f"{self.course.name} - {self.date} - {status}"
 
 
+class ClassMeeting(models.Model):
+    WEEKDAY_CHOICES = [
+        (0, 'Monday'),
+        (1, 'Tuesday'),
+        (2, 'Wednesday'),
+        (3, 'Thursday'),
+        (4, 'Friday'),
+        (5, 'Saturday'),
+        (6, 'Sunday'),
+    ]
+
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name="meetings")
+    weekday = models.PositiveSmallIntegerField(
+        choices=WEEKDAY_CHOICES,
+        help_text="Day of the week the class meets"
+    )
+    start_time = models.TimeField(help_text="Class start time")
+    end_time = models.TimeField(help_text="Class end time")
+    location = models.CharField(
+        max_length=200,
+        blank=True,
+        null=True,
+        help_text="Room or building"
+    )
+
+    class Meta:
+        unique_together = ['course', 'weekday', 'start_time']
+        ordering = ['weekday', 'start_time']
+
+    def __str__(self):
+        return f"{self.course.name} - {self.get_weekday_display()} {self.start_time:%H:%M}-{self.end_time:%H:%M}"
+
+
 class CalendarEvent(models.Model):
     EVENT_TYPE_CHOICES = [
         ('personal', 'Personal'),
@@ -196,12 +370,212 @@ class CalendarEvent(models.Model):
         default="#28a745",
         help_text="Color for calendar display (hex code)"
     )
+    recurrence_rule = models.CharField(
+        max_length=255,
+        blank=True,
+        default="",
+        help_text="RRULE for repeating events, e.g. 'FREQ=WEEKLY;BYDAY=MO,WE' (blank for one-off events)"
+    )
+    recurrence_exceptions = models.JSONField(
+        blank=True,
+        default=list,
+        help_text="UTC ISO start times of skipped occurrences"
+    )
+    recurrence_end = models.DateTimeField(
+        blank=True,
+        null=True,
+        editable=False,
+        help_text="Start of the last occurrence (null if the rule never ends); derived on save"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['event_date']
+        indexes = [
+            models.Index(fields=['user', 'event_date']),
+        ]
     
     def __str__(self):
         return f"{self.title} ({self.event_date})"
 
+    @property
+    def is_recurring(self):
+        return bool(self.recurrence_rule)
+
+    def clean(self):
+        if self.recurrence_rule and self.event_date:
+            try:
+                recurrence.validate_rule(self.recurrence_rule, self.event_date)
+            except ValueError as exc:
+                raise ValidationError({"recurrence_rule": f"Invalid RRULE: {exc}"})
+
+    def save(self, *args, **kwargs):
+        self.recurrence_end = (
+            recurrence.last_occurrence(self.recurrence_rule, self.event_date)
+            if self.recurrence_rule else None
+        )
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'recurrence_rule' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'recurrence_end'}
+        super().save(*args, **kwargs)
+
+    def occurrences(self, start, end):
+        """Yields (start, end) of each occurrence beginning inside [start, end]."""
+        return recurrence.occurrences(self, start, end)
+
+    def next_occurrence(self, after):
+        return recurrence.next_occurrence(self, after)
+
+    def skip_occurrence(self, occurrence_start):
+        """Removes a single occurrence from a recurring event."""
+        key = recurrence.exception_key(occurrence_start)
+        if key not in self.recurrence_exceptions:
+            self.recurrence_exceptions = [*self.recurrence_exceptions, key]
+            self.save(update_fields=['recurrence_exceptions', 'updated_at'])
+
+
+class UserPreferences(models.Model):
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="planner_preferences")
+    study_start_time = models.TimeField(
+        default=time(18, 0),
+        help_text="Earliest time of day to schedule study blocks"
+    )
+    study_end_time = models.TimeField(
+        default=time(22, 0),
+        help_text="Latest time of day to schedule study blocks"
+    )
+    max_study_hours_per_day = models.PositiveSmallIntegerField(
+        default=4,
+        help_text="Upper limit on scheduled study time per day (hours)"
+    )
+    study_block_minutes = models.PositiveSmallIntegerField(
+        default=60,
+        help_text="Longest single study block before switching tasks (minutes)"
+    )
+    weekly_workload_hours = models.PositiveSmallIntegerField(
+        default=20,
+        help_text="Weeks with more assignment and exam preparation hours than this are flagged as overloaded"
+    )
+    email_reminders = models.BooleanField(
+        default=True,
+        help_text="Email a reminder before assignments are due and before exams"
+    )
+    assignment_reminder_hours = models.PositiveSmallIntegerField(
+        default=24,
+        help_text="How long before an assignment is due to send its reminder (hours)"
+    )
+    exam_reminder_hours = models.PositiveSmallIntegerField(
+        default=48,
+        help_text="How long before an exam to send its reminder (hours)"
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "user preferences"
+
+    def __str__(self):
+        return f"Preferences for {self.user}"
+
+    @classmethod
+    def for_user(cls, user):
+        """The user's saved preferences, or unsaved defaults if they have none."""
+        return cls.objects.filter(user=user).first() or cls(user=user)
+
+
+class TermArchive(models.Model):
+    """
+    A closed term's courses and everything under them, as one compressed
+    JSON snapshot, written by ``manage.py archive_terms``.
+    """
+    term = models.OneToOneField(Term, on_delete=models.CASCADE, related_name="archive")
+    snapshot = models.BinaryField(help_text="zlib-compressed JSON, one list of rows per table")
+    counts = models.JSONField(default=dict, help_text="Rows archived per table")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Archive of {self.term}"
+
+    @classmethod
+    def pack(cls, data):
+        return zlib.compress(json.dumps(data, cls=DjangoJSONEncoder, separators=(",", ":")).encode(), 9)
+
+    def load(self):
+        return json.loads(zlib.decompress(bytes(self.snapshot)))
+
+
+class Reminder(models.Model):
+    """
+    One scheduled deadline reminder per pending assignment or upcoming exam,
+    kept in step with them by signals (see academic_app/reminders.py).
+    """
+    KIND_CHOICES = [
+        ('assignment', 'Assignment'),
+        ('exam', 'Exam'),
+    ]
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="reminders")
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.PositiveIntegerField()
+    title = models.CharField(max_length=200)
+    course_name = models.CharField(max_length=200)
+    due_at = models.DateTimeField(help_text="Due date or exam start this reminder is for")
+    fire_at = models.DateTimeField(help_text="When the reminder should be sent")
+    sent_at = models.DateTimeField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ['kind', 'object_id']
+        ordering = ['fire_at']
+        indexes = [
+            models.Index(fields=['sent_at', 'fire_at']),
+            models.Index(fields=['updated_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.get_kind_display()} reminder: {self.title} at {self.fire_at:%Y-%m-%d %H:%M}"
+
+
+class Job(models.Model):
+    """A unit of background work, claimed and run by ``manage.py run_jobs`` (see academic_app/jobs.py)."""
+    STATUS_CHOICES = [
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('succeeded', 'Succeeded'),
+        ('failed', 'Failed'),
+    ]
+
+    task = models.CharField(max_length=100, help_text="Registered task name")
+    payload = models.JSONField(default=dict, blank=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, blank=True, null=True, related_name="jobs")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='queued')
+    priority = models.SmallIntegerField(default=0, help_text="Higher runs first")
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=3)
+    run_at = models.DateTimeField(default=timezone.now, help_text="Not picked up before this time")
+    locked_by = models.CharField(max_length=100, blank=True, default="")
+    locked_until = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text="Visibility timeout: a running job whose lock expires is picked up again"
+    )
+    result = models.JSONField(blank=True, null=True)
+    error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'priority', 'run_at']),
+            models.Index(fields=['status', 'locked_until']),
+        ]
+
+    def __str__(self):
+        return f"{self.task} #{self.pk} ({self.status})"
+
+    @property
+    def is_finished(self):
+        return self.status in ('succeeded', 'failed')
+
@@ -0,0 +1,18 @@
+# academic_app/pagination.py
+from rest_framework.pagination import CursorPagination
+
+
+class StableCursorPagination(CursorPagination):
+    """
+    Cursor pagination ordered by the view's ``cursor_ordering``.
+
+    Cursors stay valid while rows are added or removed, and each page is a
+    single indexed range query rather than an OFFSET scan.
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def get_ordering(self, request, queryset, view):
+        return getattr(view, "cursor_ordering", self.ordering)
@@ -0,0 +1,200 @@
+# academic_app/recurrence.py
+"""
+RRULE-based recurrence for calendar events.
+
+A recurring event is stored as one row: ``event_date`` is the first
+occurrence and ``recurrence_rule`` an RFC 5545 RRULE body such as
+``FREQ=WEEKLY;BYDAY=TU,TH;UNTIL=20261215T000000Z``. Occurrences are never
+written to the database; they are expanded on demand for the window being
+displayed.
+
+Rules are limited so that no single event can cost much to store or
+expand: nothing finer than daily and, for rules with an end, at most
+``MAX_OCCURRENCES`` occurrences and nothing after ``MAX_SPAN`` from the
+first one (``validate_rule``).
+Whatever a stored rule says, expanding it never scans past that horizon.
+"""
+from datetime import timedelta, timezone as dt_timezone
+from itertools import islice
+
+from dateutil.parser import isoparse
+from dateutil.rrule import rrulestr
+
+ALLOWED_FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+# The time of day comes from the event start, so BYHOUR and friends are out.
+# The rest (BYSETPOS, BYYEARDAY, BYWEEKNO...) can describe rules that never
+# match, which dateutil scans for up to the year 9999.
+ALLOWED_PARTS = ("FREQ", "INTERVAL", "COUNT", "UNTIL", "BYDAY", "BYMONTHDAY", "BYMONTH", "WKST")
+# Longest each month can be, February counting leap years.
+MONTH_DAYS = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+MAX_OCCURRENCES = 1000
+MAX_SPAN = timedelta(days=4 * 366)
+
+# Simple presets offered by the event form, mapped to RRULE FREQ/INTERVAL.
+REPEAT_CHOICES = [
+    ('', 'Does not repeat'),
+    ('daily', 'Daily'),
+    ('weekly', 'Weekly'),
+    ('biweekly', 'Every two weeks'),
+    ('monthly', 'Monthly'),
+]
+
+_PRESETS = {
+    'daily': ('DAILY', 1),
+    'weekly': ('WEEKLY', 1),
+    'biweekly': ('WEEKLY', 2),
+    'monthly': ('MONTHLY', 1),
+}
+
+
+def build_rule(repeat, until=None):
+    """Builds an RRULE body from a form preset and an optional aware end datetime."""
+    freq, interval = _PRESETS[repeat]
+    parts = [f"FREQ={freq}"]
+    if interval != 1:
+        parts.append(f"INTERVAL={interval}")
+    if until is not None:
+        parts.append("UNTIL=" + _format_until(until))
+    return ";".join(parts)
+
+
+def parse_rule(rule, dtstart):
+    """Parses an RRULE body anchored at ``dtstart``. Raises ValueError if invalid."""
+    return rrulestr(rule, dtstart=dtstart)
+
+
+def rule_parts(rule):
+    """``{"FREQ": "WEEKLY", ...}`` for an RRULE body."""
+    parts = {}
+    for part in rule.upper().replace("RRULE:", "").split(";"):
+        if part:
+            key, _, value = part.partition("=")
+            parts[key.strip()] = value.strip()
+    return parts
+
+
+def is_bounded(rule):
+    parts = rule_parts(rule)
+    return "UNTIL" in parts or "COUNT" in parts
+
+
+def _format_until(moment):
+    return moment.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _parse_until(value, dtstart):
+    until = isoparse(value)
+    if until.tzinfo is None:
+        until = until.replace(tzinfo=dtstart.tzinfo)
+    return until
+
+
+def bounded_occurrences(rule, dtstart):
+    """
+    The rule's occurrences, but never more than ``MAX_OCCURRENCES + 1`` and
+    never past ``MAX_SPAN`` from ``dtstart``. COUNT and UNTIL are applied
+    here, so the underlying expansion always stops at the horizon.
+    """
+    parts = rule_parts(rule)
+    until = dtstart + MAX_SPAN
+    if "UNTIL" in parts:
+        until = min(until, _parse_until(parts["UNTIL"], dtstart))
+    limit = MAX_OCCURRENCES + 1
+    if "COUNT" in parts:
+        limit = min(limit, int(parts["COUNT"]))
+    capped = [f"{key}={value}" for key, value in parts.items() if key not in ("COUNT", "UNTIL")]
+    capped.append(f"UNTIL={_format_until(until)}")
+    return list(islice(parse_rule(";".join(capped), dtstart), limit))
+
+
+def validate_rule(rule, dtstart):
+    """
+    Parses an RRULE body anchored at ``dtstart`` and checks it against the
+    limits above. Raises ValueError with a message for the user otherwise.
+    """
+    parts = rule_parts(rule)
+    if parts.get("FREQ") not in ALLOWED_FREQUENCIES:
+        raise ValueError("FREQ must be DAILY, WEEKLY, MONTHLY or YEARLY.")
+    unsupported = sorted(set(parts) - set(ALLOWED_PARTS))
+    if unsupported:
+        raise ValueError(f"{', '.join(unsupported)} is not supported.")
+    parsed = parse_rule(rule, dtstart)
+    months = [int(month) for month in parts["BYMONTH"].split(",")] if "BYMONTH" in parts else range(1, 13)
+    days = [int(day) for day in parts["BYMONTHDAY"].split(",")] if "BYMONTHDAY" in parts else [1]
+    if any(not 1 <= month <= 12 for month in months) or any(not 1 <= abs(day) <= 31 for day in days):
+        raise ValueError("BYMONTH must be 1 to 12 and BYMONTHDAY 1 to 31 (or -1 to -31).")
+    if not any(abs(day) <= MONTH_DAYS[month - 1] for month in months for day in days):
+        raise ValueError("None of the BYMONTHDAY days exist in the BYMONTH months.")
+    if "COUNT" in parts and int(parts["COUNT"]) > MAX_OCCURRENCES:
+        raise ValueError(f"COUNT may be at most {MAX_OCCURRENCES}.")
+    if "UNTIL" in parts and _parse_until(parts["UNTIL"], dtstart) > dtstart + MAX_SPAN:
+        raise ValueError(f"UNTIL may be at most {MAX_SPAN.days // 366} years after the start date.")
+    try:
+        found = bounded_occurrences(rule, dtstart)
+    except (IndexError, OverflowError) as exc:
+        # dateutil's own errors for e.g. a BYDAY ordinal beyond the period.
+        raise ValueError(f"The rule cannot be expanded: {exc}")
+    if not found:
+        raise ValueError(f"The rule has no occurrences in the {MAX_SPAN.days // 366} years after the start date.")
+    # Open-ended rules are only ever expanded a window at a time.
+    if is_bounded(rule) and len(found) > MAX_OCCURRENCES:
+        raise ValueError(f"The rule repeats more than {MAX_OCCURRENCES} times.")
+    return parsed
+
+
+def exception_key(occurrence):
+    """The form in which skipped occurrences are stored in ``recurrence_exceptions``."""
+    return occurrence.astimezone(dt_timezone.utc).isoformat()
+
+
+def last_occurrence(rule, dtstart):
+    """
+    Start of the final occurrence of a bounded rule, or None if it never ends
+    (or, for a rule stored before the limits, ends beyond them).
+    """
+    if not is_bounded(rule):
+        return None
+    parts = rule_parts(rule)
+    found = bounded_occurrences(rule, dtstart)
+    if not found or len(found) > MAX_OCCURRENCES:
+        return None
+    if "COUNT" in parts and len(found) < int(parts["COUNT"]):
+        # Cut short by the horizon rather than by COUNT.
+        return None
+    if "UNTIL" in parts and _parse_until(parts["UNTIL"], dtstart) > dtstart + MAX_SPAN:
+        return None
+    return found[-1]
+
+
+def next_occurrence(event, after):
+    """Start of the first non-skipped occurrence at or after ``after``, or None."""
+    if not event.recurrence_rule:
+        return event.event_date if event.event_date >= after else None
+    skipped = set(event.recurrence_exceptions or ())
+    for occurrence in parse_rule(event.recurrence_rule, event.event_date).xafter(after, inc=True):
+        if exception_key(occurrence) not in skipped:
+            return occurrence
+    return None
+
+
+def occurrences(event, start, end):
+    """
+    Yields ``(occurrence_start, occurrence_end)`` pairs of ``event`` that start
+    inside [start, end]. Only the occurrences in the window are generated.
+    """
+    duration = event.end_date - event.event_date if event.end_date else None
+    if not event.recurrence_rule:
+        if start <= event.event_date <= end:
+            yield event.event_date, event.end_date
+        return
+
+    skipped = set(event.recurrence_exceptions or ())
+    produced = 0
+    for occurrence in parse_rule(event.recurrence_rule, event.event_date).xafter(start, inc=True):
+        # Caps rules stored before validate_rule existed.
+        if occurrence > end or produced >= MAX_OCCURRENCES:
+            break
+        if exception_key(occurrence) in skipped:
+            continue
+        produced += 1
+        yield occurrence, occurrence + duration if duration else None
@@ -0,0 +1,326 @@
+# academic_app/reminders.py
+"""
+Deadline reminders for pending assignments and upcoming exams.
+
+The schedule lives in the ``Reminder`` table, one row per item, which the
+save/delete signals keep in step with assignments, exams and the user's
+lead-time preferences. ``ReminderWorker`` (run by ``manage.py
+run_reminders``) holds the next window of unsent reminders in a min-heap
+keyed on fire time, so an idle tick is a heap peek plus one indexed query
+for rows other processes changed since the last tick, never a scan of the
+assignment and exam tables. Reminders are re-checked against their item
+just before sending, which also catches set-based ``update()`` calls that
+bypass signals.
+"""
+import heapq
+import logging
+import time
+import weakref
+from collections import defaultdict
+from datetime import timedelta
+
+from django.core import mail
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Assignment, Exam, Reminder, UserPreferences
+
+logger = logging.getLogger(__name__)
+
+KIND_BY_MODEL = {Assignment: "assignment", Exam: "exam"}
+
+# How far ahead the worker loads reminders into its heap at a time.
+LOAD_WINDOW = timedelta(hours=6)
+
+# Rows updated this long before the previous sync are fetched again, so a
+# write that committed just after its ``updated_at`` is not missed.
+SYNC_OVERLAP = timedelta(minutes=1)
+
+# Fields a reminder is built from. Saves whose ``update_fields`` touch none
+# of them leave the reminder as it is.
+REMINDER_FIELDS = {"course", "course_id", "title", "due_date", "completed", "exam_date"}
+PREFERENCE_FIELDS = {"email_reminders", "assignment_reminder_hours", "exam_reminder_hours"}
+
+# Stale reminder rows are deleted by id in batches of this size, to stay
+# under SQLite's limit on query parameters.
+DELETE_BATCH_SIZE = 500
+
+# Live workers in this process, which signals notify directly.
+_workers = weakref.WeakSet()
+
+
+def lead_times(preferences):
+    return {
+        "assignment": timedelta(hours=preferences.assignment_reminder_hours),
+        "exam": timedelta(hours=preferences.exam_reminder_hours),
+    }
+
+
+def _due(kind, item):
+    """When ``item`` is due, or None if it no longer needs a reminder."""
+    if kind == "assignment":
+        due = None if item.completed else item.due_date
+    else:
+        due = item.exam_date
+    return due if due and due > timezone.now() else None
+
+
+def _notify_workers(reminder_id, fire_at):
+    for worker in list(_workers):
+        worker.push(reminder_id, fire_at)
+
+
+def sync_reminder(item):
+    """Creates, moves or removes the reminder for one Assignment or Exam after it is saved."""
+    kind = KIND_BY_MODEL[type(item)]
+    due = _due(kind, item)
+    preferences = UserPreferences.for_user(item.course.user) if due else None
+    if due is None or not preferences.email_reminders:
+        Reminder.objects.filter(kind=kind, object_id=item.pk).delete()
+        return None
+
+    fire_at = due - lead_times(preferences)[kind]
+    reminder, created = Reminder.objects.get_or_create(
+        kind=kind,
+        object_id=item.pk,
+        defaults={
+            "user_id": item.course.user_id,
+            "title": item.title,
+            "course_name": item.course.name,
+            "due_at": due,
+            "fire_at": fire_at,
+        },
+    )
+    if not created:
+        if reminder.due_at != due:
+            reminder.sent_at = None  # Rescheduled items get a fresh reminder
+        reminder.title, reminder.course_name = item.title, item.course.name
+        reminder.due_at, reminder.fire_at = due, fire_at
+        reminder.save()
+    if reminder.sent_at is None:
+        transaction.on_commit(lambda: _notify_workers(reminder.id, reminder.fire_at))
+    return reminder
+
+
+def cancel_reminder(item):
+    Reminder.objects.filter(kind=KIND_BY_MODEL[type(item)], object_id=item.pk).delete()
+
+
+def schedule_all(user_ids=None):
+    """
+    Rebuilds reminder rows from the assignment and exam tables, for every
+    user or just ``user_ids``. Used for backfills and when a user changes
+    their reminder preferences. Reminders already sent stay sent unless
+    their item's due time has moved since.
+    """
+    now = timezone.now()
+    preferences = UserPreferences.objects.all()
+    assignments = Assignment.objects.filter(completed=False, due_date__gt=now)
+    exams = Exam.objects.filter(exam_date__gt=now)
+    stale = Reminder.objects.filter(sent_at__isnull=True)
+    if user_ids is not None:
+        preferences = preferences.filter(user_id__in=user_ids)
+        assignments = assignments.filter(course__user_id__in=user_ids)
+        exams = exams.filter(course__user_id__in=user_ids)
+        stale = stale.filter(user_id__in=user_ids)
+    preferences = {pref.user_id: pref for pref in preferences}
+    default = UserPreferences()
+
+    rows = []
+    for kind, items, date_field in (("assignment", assignments, "due_date"), ("exam", exams, "exam_date")):
+        for item in items.select_related("course"):
+            pref = preferences.get(item.course.user_id, default)
+            if not pref.email_reminders:
+                continue
+            due = getattr(item, date_field)
+            rows.append(Reminder(
+                user_id=item.course.user_id, kind=kind, object_id=item.pk, title=item.title,
+                course_name=item.course.name, due_at=due, fire_at=due - lead_times(pref)[kind],
+            ))
+
+    with transaction.atomic():
+        keep = {(row.kind, row.object_id) for row in rows}
+        existing = Reminder.objects.all() if user_ids is None else Reminder.objects.filter(user_id__in=user_ids)
+        sent = {}
+        for kind, object_id, due_at, sent_at in existing.filter(sent_at__isnull=False).values_list(
+            "kind", "object_id", "due_at", "sent_at"
+        ).iterator():
+            sent[kind, object_id] = (due_at, sent_at)
+        for row in rows:
+            # A reminder already sent for the same due time stays sent; a moved
+            # item gets a fresh one.
+            due_at, sent_at = sent.get((row.kind, row.object_id), (None, None))
+            row.sent_at = sent_at if due_at == row.due_at else None
+
+        stale_ids = [
+            pk for pk, kind, object_id in stale.values_list("id", "kind", "object_id").iterator()
+            if (kind, object_id) not in keep
+        ]
+        for start in range(0, len(stale_ids), DELETE_BATCH_SIZE):
+            Reminder.objects.filter(id__in=stale_ids[start:start + DELETE_BATCH_SIZE]).delete()
+        Reminder.objects.bulk_create(
+            rows,
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=["kind", "object_id"],
+            update_fields=["title", "course_name", "due_at", "fire_at", "sent_at", "updated_at"],
+        )
+    return len(rows)
+
+
+def _still_due(reminders):
+    """The subset of ``reminders`` whose item still exists, is pending and has the same due time."""
+    current = {}
+    by_kind = defaultdict(list)
+    for reminder in reminders:
+        by_kind[reminder.kind].append(reminder.object_id)
+    if by_kind["assignment"]:
+        current.update(
+            (("assignment", pk), due) for pk, due in Assignment.objects.filter(
+                id__in=by_kind["assignment"], completed=False
+            ).values_list("id", "due_date")
+        )
+    if by_kind["exam"]:
+        current.update(
+            (("exam", pk), due) for pk, due in Exam.objects.filter(id__in=by_kind["exam"]).values_list("id", "exam_date")
+        )
+    return [reminder for reminder in reminders if current.get((reminder.kind, reminder.object_id)) == reminder.due_at]
+
+
+def build_message(user, reminders, connection=None):
+    lines = [f"Hi {user.first_name or user.username},", "", "Coming up soon:", ""]
+    for reminder in sorted(reminders, key=lambda r: r.due_at):
+        when = timezone.localtime(reminder.due_at).strftime("%A, %B %d at %I:%M %p")
+        label = "due" if reminder.kind == "assignment" else "exam on"
+        lines.append(f"- {reminder.title} ({reminder.course_name}): {label} {when}")
+    lines += ["", "Good luck!", "Academic Planner"]
+    count = len(reminders)
+    return mail.EmailMessage(
+        subject=f"Reminder: {count} upcoming deadline{'s' if count != 1 else ''}",
+        body="\n".join(lines),
+        to=[user.email],
+        connection=connection,
+    )
+
+
+class ReminderWorker:
+    """Sends reminders as they fall due from a lazily loaded, time-ordered heap."""
+
+    def __init__(self, window=LOAD_WINDOW, connection=None):
+        self.window = window
+        self.heap = []  # (fire_at, reminder_id)
+        self.scheduled = {}  # reminder_id -> fire_at of its live heap entry
+        self.loaded_until = None
+        self.synced_at = None
+        # One backend connection reused for every batch this worker sends.
+        self.connection = connection or mail.get_connection(fail_silently=False)
+        _workers.add(self)
+
+    def push(self, reminder_id, fire_at):
+        """Schedules (or reschedules) a reminder if it falls inside the loaded window."""
+        if self.loaded_until is None or fire_at >= self.loaded_until:
+            self.scheduled.pop(reminder_id, None)
+            return
+        if self.scheduled.get(reminder_id) == fire_at:
+            return
+        # Any older entry for this id stays in the heap and is skipped when popped.
+        self.scheduled[reminder_id] = fire_at
+        heapq.heappush(self.heap, (fire_at, reminder_id))
+
+    def _load(self, until):
+        rows = Reminder.objects.filter(sent_at__isnull=True, fire_at__lt=until)
+        if self.loaded_until is not None:
+            rows = rows.filter(fire_at__gte=self.loaded_until)
+        self.loaded_until = until
+        for reminder_id, fire_at in rows.values_list("id", "fire_at"):
+            self.push(reminder_id, fire_at)
+
+    def _sync(self, now):
+        """Applies reminder rows other processes changed since the last tick."""
+        changed = Reminder.objects.filter(updated_at__gte=self.synced_at - SYNC_OVERLAP)
+        self.synced_at = now
+        for reminder_id, fire_at, sent_at in changed.values_list("id", "fire_at", "sent_at"):
+            if sent_at is None:
+                self.push(reminder_id, fire_at)
+            else:
+                self.scheduled.pop(reminder_id, None)
+
+    def tick(self, now=None):
+        """Sends every reminder due by ``now``; returns how many emails were sent."""
+        now = now or timezone.now()
+        if self.loaded_until is None:
+            self.synced_at = now
+            self._load(now + self.window)
+        else:
+            self._sync(now)
+            if self.loaded_until - now < self.window / 2:
+                self._load(now + self.window)
+
+        due_ids = []
+        while self.heap and self.heap[0][0] <= now:
+            fire_at, reminder_id = heapq.heappop(self.heap)
+            if self.scheduled.get(reminder_id) == fire_at:
+                del self.scheduled[reminder_id]
+                due_ids.append(reminder_id)
+        return self._send(due_ids, now) if due_ids else 0
+
+    def _send(self, reminder_ids, now):
+        # Claim the reminders (and drop stale ones) in a short transaction,
+        # so no row lock or SQLite write lock is held while talking to SMTP.
+        # Other workers skip claimed rows because their ``sent_at`` is set.
+        with transaction.atomic():
+            reminders = list(
+                Reminder.objects.select_for_update(of=("self",)).select_related("user").filter(
+                    id__in=reminder_ids, sent_at__isnull=True, fire_at__lte=now,
+                )
+            )
+            valid = _still_due(reminders)
+            stale = {reminder.id for reminder in reminders} - {reminder.id for reminder in valid}
+            if stale:
+                Reminder.objects.filter(id__in=stale).delete()
+            claimed = [reminder.id for reminder in valid]
+            Reminder.objects.filter(id__in=claimed).update(sent_at=now)
+
+        by_user = defaultdict(list)
+        for reminder in valid:
+            by_user[reminder.user].append(reminder)
+        messages = [
+            build_message(user, items, self.connection)
+            for user, items in by_user.items() if user.email
+        ]
+        try:
+            sent = self.connection.send_messages(messages) if messages else 0
+        except Exception:
+            # Release the claim, drop the connection and retry on the next tick.
+            # Bumping ``updated_at`` lets other workers pick the rows up again too.
+            logger.exception("Sending %d reminder email(s) failed", len(messages))
+            self.close()
+            Reminder.objects.filter(id__in=claimed, sent_at=now).update(sent_at=None, updated_at=timezone.now())
+            for reminder in valid:
+                self.push(reminder.id, reminder.fire_at)
+            return 0
+        return sent or 0
+
+    def run(self, interval=30, max_ticks=None):
+        """Ticks every ``interval`` seconds until interrupted (or ``max_ticks`` ticks)."""
+        ticks = 0
+        try:
+            while max_ticks is None or ticks < max_ticks:
+                started = time.monotonic()
+                try:
+                    sent = self.tick()
+                except Exception:
+                    logger.exception("Reminder tick failed")
+                    sent = 0
+                if sent:
+                    logger.info("Sent %d reminder email(s)", sent)
+                ticks += 1
+                time.sleep(max(0.0, interval - (time.monotonic() - started)))
+        finally:
+            self.close()
+
+    def close(self):
+        try:
+            self.connection.close()
+        except Exception:
+            logger.exception("Closing the email connection failed")
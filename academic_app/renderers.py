@@ -0,0 +1,26 @@
+# academic_app/renderers.py
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib-based renderer
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson when it is installed.
+
+    Output is compact UTF-8, matching DRF's JSONRenderer defaults, so clients
+    see the same payload either way.
+    """
+
+    _encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+        return orjson.dumps(data, default=self._encoder.default, option=orjson.OPT_NON_STR_KEYS)
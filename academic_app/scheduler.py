@@ -0,0 +1,240 @@
+# academic_app/scheduler.py
+"""
+Study-time scheduler: packs each pending assignment's ``estimated_hours``
+into free time before its due date.
+
+Free time is the user's preferred daily study window minus busy intervals
+(calendar events, exams and class meetings). Slots are filled in time order
+by earliest-deadline-first from a heap, with priority breaking ties; EDF
+meets every deadline whenever any schedule can. The core works on plain
+tuples so it can be benchmarked without a database.
+"""
+import heapq
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils import timezone
+
+from .caching import get_data_version
+from .models import Assignment, CalendarEvent, ClassMeeting, Exam, UserPreferences, in_current_term
+
+PRIORITY_RANK = {'urgent': 0, 'high': 1, 'medium': 2, 'low': 3}
+
+# Plans never look further ahead than this, however distant a due date is.
+MAX_HORIZON = timedelta(days=120)
+
+PLAN_CACHE_TIMEOUT = 15 * 60
+PLAN_CACHE_KEY = "academic:study-plan:{user_id}:{version}:{stamp}"
+
+
+@dataclass(frozen=True)
+class StudyTask:
+    id: int
+    title: str
+    course: str
+    color: str
+    due: datetime
+    priority: str
+    minutes: int
+
+
+@dataclass(frozen=True)
+class StudyBlock:
+    task_id: int
+    title: str
+    course: str
+    color: str
+    start: datetime
+    end: datetime
+
+
+@dataclass
+class StudyPlan:
+    blocks: list = field(default_factory=list)
+    # Minutes that could not be fitted before the due date, by assignment id.
+    unscheduled: dict = field(default_factory=dict)
+
+    def blocks_between(self, start, end):
+        return [block for block in self.blocks if block.end > start and block.start < end]
+
+
+def merge_intervals(intervals):
+    """Sorts and merges overlapping (start, end) intervals."""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def free_slots(windows, busy):
+    """
+    Subtracts merged, sorted ``busy`` intervals from sorted, disjoint
+    ``windows`` with a single forward sweep.
+    """
+    slots = []
+    i = 0
+    for window_start, window_end in windows:
+        while i < len(busy) and busy[i][1] <= window_start:
+            i += 1
+        cursor = window_start
+        j = i
+        while j < len(busy) and busy[j][0] < window_end:
+            if busy[j][0] > cursor:
+                slots.append((cursor, busy[j][0]))
+            cursor = max(cursor, busy[j][1])
+            j += 1
+        if cursor < window_end:
+            slots.append((cursor, window_end))
+    return slots
+
+
+def study_windows(start, end, day_start, day_end, tz):
+    """The preferred study window of each local day between ``start`` and ``end``."""
+    windows = []
+    day = start.astimezone(tz).date()
+    last_day = end.astimezone(tz).date()
+    while day <= last_day:
+        window_start = timezone.make_aware(datetime.combine(day, day_start), tz)
+        window_end = timezone.make_aware(datetime.combine(day, day_end), tz)
+        if window_end <= window_start:  # Window runs past midnight
+            window_end += timedelta(days=1)
+        window_start, window_end = max(window_start, start), min(window_end, end)
+        if window_start < window_end:
+            windows.append((window_start, window_end))
+        day += timedelta(days=1)
+    return windows
+
+
+def plan_study_blocks(tasks, busy, windows, max_block_minutes=60, max_minutes_per_day=240, tz=None):
+    """
+    Assigns study blocks for ``tasks`` to the free parts of ``windows``.
+
+    Runs in O((S + T) log T) for S free slots and T tasks once the busy
+    intervals are merged.
+    """
+    tz = tz or timezone.get_current_timezone()
+    plan = StudyPlan()
+    heap = [(task.due, PRIORITY_RANK.get(task.priority, 2), task.id, task.minutes, task) for task in tasks if task.minutes > 0]
+    heapq.heapify(heap)
+    used_per_day = defaultdict(int)
+
+    for slot_start, slot_end in free_slots(windows, merge_intervals(busy)):
+        cursor = slot_start
+        while heap and cursor < slot_end:
+            day = cursor.astimezone(tz).date()
+            day_left = max_minutes_per_day - used_per_day[day]
+            if day_left <= 0:
+                break
+            due, rank, task_id, remaining, task = heap[0]
+            if due - cursor < timedelta(minutes=1):
+                heapq.heappop(heap)
+                plan.unscheduled[task_id] = remaining
+                continue
+            minutes = min(
+                remaining,
+                max_block_minutes,
+                day_left,
+                int((slot_end - cursor).total_seconds() // 60),
+                int((due - cursor).total_seconds() // 60),
+            )
+            if minutes <= 0:
+                break
+            block_end = cursor + timedelta(minutes=minutes)
+            plan.blocks.append(StudyBlock(task_id, task.title, task.course, task.color, cursor, block_end))
+            used_per_day[day] += minutes
+            cursor = block_end
+            if remaining - minutes > 0:
+                heapq.heapreplace(heap, (due, rank, task_id, remaining - minutes, task))
+            else:
+                heapq.heappop(heap)
+        if not heap:
+            break
+
+    for _, _, task_id, remaining, _ in heap:
+        plan.unscheduled[task_id] = remaining
+    return plan
+
+
+def _busy_intervals(user, start, end, tz):
+    busy = []
+    events = CalendarEvent.objects.filter(user=user).filter(
+        Q(recurrence_rule="", event_date__lt=end)
+        & (Q(end_date__gt=start) | Q(end_date__isnull=True, event_date__gte=start))
+        | (~Q(recurrence_rule="") & Q(event_date__lte=end)
+           & (Q(recurrence_end__isnull=True) | Q(recurrence_end__gte=start - timedelta(days=1))))
+    )
+    for event in events:
+        if not event.is_recurring:
+            busy.append((event.event_date, event.end_date or event.event_date + timedelta(hours=1)))
+            continue
+        for occurrence_start, occurrence_end in event.occurrences(start - timedelta(days=1), end):
+            busy.append((occurrence_start, occurrence_end or occurrence_start + timedelta(hours=1)))
+
+    for exam_date, duration in Exam.objects.filter(
+        in_current_term("course__"), course__user=user, exam_date__range=(start - timedelta(days=1), end)
+    ).values_list("exam_date", "duration"):
+        busy.append((exam_date, exam_date + timedelta(minutes=duration)))
+
+    meetings = defaultdict(list)
+    for weekday, start_time, end_time in ClassMeeting.objects.filter(in_current_term("course__"), course__user=user).values_list(
+        "weekday", "start_time", "end_time"
+    ):
+        meetings[weekday].append((start_time, end_time))
+    if meetings:
+        day = start.astimezone(tz).date()
+        while day <= end.astimezone(tz).date():
+            for start_time, end_time in meetings.get(day.weekday(), ()):
+                busy.append((
+                    timezone.make_aware(datetime.combine(day, start_time), tz),
+                    timezone.make_aware(datetime.combine(day, end_time), tz),
+                ))
+            day += timedelta(days=1)
+    return busy
+
+
+def build_study_plan(user, now=None):
+    """Loads the user's pending work and busy time and plans study blocks from ``now``."""
+    now = (now or timezone.now()).replace(second=0, microsecond=0)
+    tz = timezone.get_current_timezone()
+    preferences = UserPreferences.for_user(user)
+    tasks = [
+        StudyTask(a.id, a.title, a.course.name, a.course.color, a.due_date, a.priority, a.estimated_hours * 60)
+        for a in Assignment.objects.filter(
+            in_current_term("course__"), course__user=user, completed=False, due_date__gt=now
+        ).select_related("course").order_by("due_date")
+    ]
+    if not tasks:
+        return StudyPlan()
+
+    horizon = min(max(task.due for task in tasks), now + MAX_HORIZON)
+    windows = study_windows(now, horizon, preferences.study_start_time, preferences.study_end_time, tz)
+    return plan_study_blocks(
+        tasks,
+        _busy_intervals(user, now, horizon, tz),
+        windows,
+        max_block_minutes=preferences.study_block_minutes,
+        max_minutes_per_day=preferences.max_study_hours_per_day * 60,
+        tz=tz,
+    )
+
+
+def get_study_plan(user):
+    """
+    The user's current plan, cached until their data changes. Plans start at
+    the top of the current hour so a cached plan never schedules in the past
+    by more than that.
+    """
+    now = timezone.now().replace(minute=0, second=0, microsecond=0)
+    key = PLAN_CACHE_KEY.format(user_id=user.id, version=get_data_version(user.id), stamp=now.strftime("%Y%m%d%H"))
+    plan = cache.get(key)
+    if plan is None:
+        plan = build_study_plan(user, now)
+        cache.set(key, plan, PLAN_CACHE_TIMEOUT)
+    return plan
@@ -0,0 +1,199 @@
+# academic_app/serializers.py
+from rest_framework import serializers
+
+from . import recurrence
+from .models import Course, Assignment, Exam, Attendance, CalendarEvent, ClassMeeting, GradeCategory, Term
+
+
+class SparseFieldsetMixin:
+    """
+    Trims the serializer to the fields named in ``?fields=a,b,c``.
+
+    ``id`` is always kept so clients can address what they fetched. Only safe
+    (read) requests are trimmed; writes always see the full serializer.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get("request")
+        if request is None or request.method not in ("GET", "HEAD", "OPTIONS"):
+            return
+        requested = request.query_params.get("fields")
+        if not requested:
+            return
+        wanted = {name.strip() for name in requested.split(",") if name.strip()} | {"id"}
+        for name in set(self.fields) - wanted:
+            self.fields.pop(name)
+
+
+class UserCourseField(serializers.PrimaryKeyRelatedField):
+    """A course id limited to the requesting user's courses."""
+
+    def get_queryset(self):
+        return Course.objects.filter(user=self.context["request"].user)
+
+
+class UserTermField(serializers.PrimaryKeyRelatedField):
+    """A term id limited to the requesting user's unarchived terms."""
+
+    def get_queryset(self):
+        return Term.objects.filter(user=self.context["request"].user, archived_at__isnull=True)
+
+
+class UserGradeCategoryField(serializers.PrimaryKeyRelatedField):
+    """A grade category id limited to the requesting user's courses."""
+
+    def get_queryset(self):
+        return GradeCategory.objects.filter(course__user=self.context["request"].user)
+
+
+class GradedItemMixin:
+    """Checks that an item's grade category belongs to the item's course."""
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        category = attrs.get("category", getattr(self.instance, "category", None))
+        course = attrs.get("course", getattr(self.instance, "course", None))
+        if category is not None and course is not None and category.course_id != course.id:
+            raise serializers.ValidationError({"category": ["This category belongs to a different course."]})
+        return attrs
+
+
+class ClassMeetingSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ClassMeeting
+        fields = ["weekday", "start_time", "end_time", "location"]
+
+    def validate(self, attrs):
+        if attrs["end_time"] <= attrs["start_time"]:
+            raise serializers.ValidationError("End time must be after start time.")
+        return attrs
+
+
+class TermSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    archive_counts = serializers.JSONField(source="archive.counts", read_only=True, default=None)
+
+    class Meta:
+        model = Term
+        fields = ["id", "name", "start_date", "end_date", "archived_at", "archive_counts", "created_at"]
+        read_only_fields = ["archived_at", "created_at"]
+
+    def validate(self, attrs):
+        start_date = attrs.get("start_date", getattr(self.instance, "start_date", None))
+        end_date = attrs.get("end_date", getattr(self.instance, "end_date", None))
+        if start_date and end_date and end_date < start_date:
+            raise serializers.ValidationError({"end_date": ["A term cannot end before it starts."]})
+        return attrs
+
+
+class CourseSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    term = UserTermField(required=False, allow_null=True)
+    # Writable: sending "meetings" replaces the course's whole weekly schedule.
+    meetings = ClassMeetingSerializer(many=True, required=False)
+
+    class Meta:
+        model = Course
+        fields = [
+            "id", "name", "code", "instructor", "credits", "color", "term", "meetings", "created_at", "updated_at",
+        ]
+        read_only_fields = ["created_at", "updated_at"]
+
+    def validate_meetings(self, meetings):
+        slots = [(meeting["weekday"], meeting["start_time"]) for meeting in meetings]
+        if len(slots) != len(set(slots)):
+            raise serializers.ValidationError("Two meetings start on the same day at the same time.")
+        return meetings
+
+    def create(self, validated_data):
+        meetings = validated_data.pop("meetings", [])
+        course = super().create(validated_data)
+        self._set_meetings(course, meetings)
+        return course
+
+    def update(self, instance, validated_data):
+        meetings = validated_data.pop("meetings", None)
+        course = super().update(instance, validated_data)
+        if meetings is not None:
+            course.meetings.all().delete()
+            self._set_meetings(course, meetings)
+        return course
+
+    def _set_meetings(self, course, meetings):
+        # The course's own save above already bumped the user's data version.
+        ClassMeeting.objects.bulk_create([ClassMeeting(course=course, **meeting) for meeting in meetings])
+        if hasattr(course, "_prefetched_objects_cache"):
+            course._prefetched_objects_cache.pop("meetings", None)
+
+
+class GradeCategorySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    course = UserCourseField()
+
+    class Meta:
+        model = GradeCategory
+        fields = ["id", "course", "name", "weight"]
+
+
+class AssignmentSerializer(GradedItemMixin, SparseFieldsetMixin, serializers.ModelSerializer):
+    course = UserCourseField()
+    category = UserGradeCategoryField(required=False, allow_null=True)
+    course_name = serializers.CharField(source="course.name", read_only=True)
+    course_code = serializers.CharField(source="course.code", read_only=True)
+    is_overdue = serializers.BooleanField(read_only=True)
+
+    class Meta:
+        model = Assignment
+        fields = [
+            "id", "course", "course_name", "course_code", "title", "description", "due_date",
+            "priority", "completed", "estimated_hours", "category", "score", "max_score",
+            "is_overdue", "created_at", "updated_at",
+        ]
+        read_only_fields = ["created_at", "updated_at"]
+
+
+class ExamSerializer(GradedItemMixin, SparseFieldsetMixin, serializers.ModelSerializer):
+    course = UserCourseField()
+    category = UserGradeCategoryField(required=False, allow_null=True)
+    course_name = serializers.CharField(source="course.name", read_only=True)
+    course_code = serializers.CharField(source="course.code", read_only=True)
+
+    class Meta:
+        model = Exam
+        fields = [
+            "id", "course", "course_name", "course_code", "title", "exam_type", "exam_date",
+            "duration", "location", "notes", "category", "score", "max_score", "created_at", "updated_at",
+        ]
+        read_only_fields = ["created_at", "updated_at"]
+
+
+class AttendanceSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    course = UserCourseField()
+    course_name = serializers.CharField(source="course.name", read_only=True)
+
+    class Meta:
+        model = Attendance
+        fields = ["id", "course", "course_name", "date", "present", "notes", "created_at"]
+        read_only_fields = ["created_at"]
+
+
+class CalendarEventSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    class Meta:
+        model = CalendarEvent
+        fields = [
+            "id", "title", "event_date", "end_date", "description", "event_type",
+            "location", "color", "recurrence_rule", "recurrence_exceptions", "recurrence_end",
+            "created_at", "updated_at",
+        ]
+        read_only_fields = ["recurrence_end", "created_at", "updated_at"]
+
+    def validate(self, attrs):
+        event_date = attrs.get("event_date", getattr(self.instance, "event_date", None))
+        end_date = attrs.get("end_date", getattr(self.instance, "end_date", None))
+        if end_date and event_date and end_date <= event_date:
+            raise serializers.ValidationError("End date must be after start date.")
+        rule = attrs.get("recurrence_rule", getattr(self.instance, "recurrence_rule", ""))
+        if rule and event_date:
+            try:
+                recurrence.validate_rule(rule, event_date)
+            except (ValueError, TypeError) as exc:
+                raise serializers.ValidationError({"recurrence_rule": [f"Invalid RRULE: {exc}"]})
+        return attrs
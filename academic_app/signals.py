@@ -0,0 +1,56 @@
+# academic_app/signals.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from . import reminders
+from .caching import invalidate_on_commit, invalidation_deferred
+from .models import (
+    Course, Assignment, Exam, Attendance, CalendarEvent, ClassMeeting, GradeCategory, Term, UserPreferences,
+)
+
+# A term's dates decide which courses are current, and deleting a term
+# detaches its courses with an UPDATE (SET_NULL) that sends no signal of its
+# own, so Term writes and deletes bump the version too.
+VERSIONED_MODELS = (
+    Course, Assignment, Exam, Attendance, CalendarEvent, ClassMeeting, GradeCategory, Term, UserPreferences,
+)
+
+
+def owner_id(instance):
+    """Returns the id of the user who owns a term, course, event, preference or course item."""
+    if isinstance(instance, (Term, Course, CalendarEvent, UserPreferences)):
+        return instance.user_id
+    if type(instance).course.is_cached(instance):
+        return instance.course.user_id
+    return Course.objects.filter(pk=instance.course_id).values_list("user_id", flat=True).first()
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_user_caches(sender, instance, **kwargs):
+    if sender not in VERSIONED_MODELS or invalidation_deferred():
+        return
+    user_id = owner_id(instance)
+    if user_id is not None:
+        invalidate_on_commit(user_id)
+
+
+@receiver(post_save, sender=Assignment)
+@receiver(post_save, sender=Exam)
+def schedule_reminder(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not reminders.REMINDER_FIELDS & update_fields:
+        return
+    reminders.sync_reminder(instance)
+
+
+@receiver(post_delete, sender=Assignment)
+@receiver(post_delete, sender=Exam)
+def cancel_reminder(sender, instance, **kwargs):
+    reminders.cancel_reminder(instance)
+
+
+@receiver(post_save, sender=UserPreferences)
+def reschedule_reminders(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not reminders.PREFERENCE_FIELDS & update_fields:
+        return
+    reminders.schedule_all(user_ids=[instance.user_id])
@@ -0,0 +1,50 @@
+# academic_app/stats.py
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models import F, Func, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .caching import get_data_version
+from .models import Course, Assignment, Exam, in_current_term
+
+# Writes invalidate through the data version; the timeout only bounds how long
+# "upcoming" counts can lag behind the clock.
+STATS_CACHE_TIMEOUT = 5 * 60
+
+STATS_CACHE_KEY = "academic:stats:{user_id}:{version}"
+
+
+def _count(queryset):
+    """A correlated ``SELECT COUNT(*)`` subquery over ``queryset``."""
+    counted = queryset.order_by().annotate(n=Func(F("pk"), function="COUNT")).values("n")
+    return Coalesce(Subquery(counted, output_field=IntegerField()), Value(0))
+
+
+def compute_dashboard_stats(user_id):
+    """
+    Returns the dashboard stat card counts for a user's current term in one
+    SQL statement.
+
+    Each count is a scalar subquery on its own index rather than a join, so
+    assignments and exams are never multiplied against each other.
+    """
+    now = timezone.now()
+    today = timezone.localdate(now)
+    current_items = in_current_term("course__", today)
+    assignments = Assignment.objects.filter(current_items, course__user=OuterRef("pk"))
+    return User.objects.filter(pk=user_id).values(
+        total_assignments=_count(assignments),
+        pending_assignments=_count(assignments.filter(completed=False)),
+        upcoming_exams=_count(Exam.objects.filter(current_items, course__user=OuterRef("pk"), exam_date__gte=now)),
+        total_courses=_count(Course.objects.current(today).filter(user=OuterRef("pk"))),
+    ).get()
+
+
+def get_dashboard_stats(user_id):
+    key = STATS_CACHE_KEY.format(user_id=user_id, version=get_data_version(user_id))
+    stats = cache.get(key)
+    if stats is None:
+        stats = compute_dashboard_stats(user_id)
+        cache.set(key, stats, STATS_CACHE_TIMEOUT)
+    return stats
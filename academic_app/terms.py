@@ -0,0 +1,99 @@
+# academic_app/terms.py
+"""
+Terms and archiving of past terms.
+
+Courses may belong to a ``Term``. The dashboard and its stats, the
+calendar, study plan, workload, conflicts, grade summaries, the course API
+and the assistant show the current term by default: courses without a
+term plus courses whose term has not ended (``Course.objects.current()``,
+``in_current_term``). New courses go into the user's ``active_term``, if
+they have one.
+
+Once a term has been over for ``TERM_ARCHIVE_AFTER_DAYS``, ``archive_term``
+copies its courses and everything under them (grade categories, meetings,
+assignments, exams, attendance) into one compressed JSON snapshot in
+``TermArchive``. It then deletes the rows. The hot tables therefore only
+hold live terms, however many semesters a user keeps. ``load_archive``
+reads a snapshot back on demand; the term row itself stays, marked
+``archived_at``.
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .caching import deferred_invalidation
+from .models import Assignment, Attendance, ClassMeeting, Course, Exam, GradeCategory, Term, TermArchive
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+# Tables copied into a snapshot, keyed by the name used in it, with the
+# lookup from each table to the term.
+ARCHIVED_TABLES = (
+    ("courses", Course, "term"),
+    ("grade_categories", GradeCategory, "course__term"),
+    ("meetings", ClassMeeting, "course__term"),
+    ("assignments", Assignment, "course__term"),
+    ("exams", Exam, "course__term"),
+    ("attendance", Attendance, "course__term"),
+)
+
+
+def active_term(user, today=None):
+    """The user's unarchived term covering ``today``, if any."""
+    today = today or timezone.localdate()
+    return user.terms.filter(
+        start_date__lte=today, end_date__gte=today, archived_at__isnull=True
+    ).order_by("-start_date").first()
+
+
+def closed_terms(today=None, after_days=None):
+    """Unarchived terms that ended more than ``after_days`` ago, for every user."""
+    today = today or timezone.localdate()
+    if after_days is None:
+        after_days = getattr(settings, "TERM_ARCHIVE_AFTER_DAYS", 30)
+    return Term.objects.filter(archived_at__isnull=True, end_date__lt=today - timedelta(days=after_days))
+
+
+def build_snapshot(term):
+    """The term and its rows from every archived table, one query per table."""
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "term": {"id": term.id, "name": term.name, "start_date": term.start_date, "end_date": term.end_date},
+    }
+    for key, model, lookup in ARCHIVED_TABLES:
+        snapshot[key] = list(model.objects.filter(**{lookup: term}).order_by("pk").values())
+    return snapshot
+
+
+def archive_term(term):
+    """
+    Moves a term's courses and their items into its ``TermArchive``. Returns
+    the archive, or None if the term was already archived.
+    """
+    with transaction.atomic(), deferred_invalidation(term.user_id):
+        term = Term.objects.select_for_update().get(pk=term.pk)
+        if term.archived_at is not None:
+            return None
+        snapshot = build_snapshot(term)
+        archive = TermArchive.objects.create(
+            term=term,
+            snapshot=TermArchive.pack(snapshot),
+            counts={key: len(snapshot[key]) for key, _, _ in ARCHIVED_TABLES},
+        )
+        # Cascades to every table above; reminders are cancelled by signals.
+        Course.objects.filter(term=term).delete()
+        term.archived_at = timezone.now()
+        term.save(update_fields=["archived_at"])
+    logger.info("Archived term %s of user %s: %s", term.pk, term.user_id, archive.counts)
+    return archive
+
+
+def load_archive(term):
+    """The snapshot of an archived term, or None if it has not been archived."""
+    archive = TermArchive.objects.filter(term=term).first()
+    return archive.load() if archive else None
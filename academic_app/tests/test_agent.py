@@ -0,0 +1,43 @@
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+
+from academic_app.agent import AcademicAgent
+from academic_app.models import Assignment, Course, Exam, Term
+
+
+class UpcomingDeadlineTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("ada", password="pw")
+        self.now = timezone.now()
+        self.course = Course.objects.create(user=self.user, name="Algorithms", code="CS201")
+        self.agent = AcademicAgent(self.user)
+
+    def at(self, days):
+        return self.now + timedelta(days=days)
+
+    def titles(self, limit=20):
+        return [deadline.title for deadline in self.agent.iter_upcoming_deadlines(limit, now=self.now)]
+
+    def test_merged_soonest_first_and_limited(self):
+        Assignment.objects.create(course=self.course, title="Lab", due_date=self.at(3))
+        Assignment.objects.create(course=self.course, title="Essay", due_date=self.at(1))
+        Exam.objects.create(course=self.course, title="Quiz", exam_date=self.at(2))
+        Assignment.objects.create(course=self.course, title="Overdue", due_date=self.at(-1))
+        self.assertEqual(self.titles(), ["Essay", "Quiz", "Lab"])
+        self.assertEqual(self.titles(limit=2), ["Essay", "Quiz"])
+
+    def test_completed_work_and_ended_terms_are_left_out(self):
+        Assignment.objects.create(course=self.course, title="Done", due_date=self.at(1), completed=True)
+        ended = Term.objects.create(
+            user=self.user, name="Spring", start_date=date(2020, 1, 10), end_date=date(2020, 5, 20),
+        )
+        old = Course.objects.create(user=self.user, name="History", code="HIST110", term=ended)
+        Assignment.objects.create(course=old, title="Old essay", due_date=self.at(1))
+        Exam.objects.create(course=old, title="Old final", exam_date=self.at(1))
+        other = Course.objects.create(user=User.objects.create_user("bob", password="pw"), name="DB", code="CS340")
+        Assignment.objects.create(course=other, title="Bob's lab", due_date=self.at(1))
+        self.assertEqual(self.titles(), [])
+        self.assertIn("No upcoming deadlines found.", self.agent.get_upcoming_deadlines())
@@ -0,0 +1,76 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+
+from academic_app.models import Assignment, Course
+
+
+class ApiTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("ada", password="pw")
+        self.client.force_login(self.user)
+        self.course = Course.objects.create(user=self.user, name="Algorithms", code="CS201")
+
+
+class PaginationTests(ApiTestCase):
+    def test_cursor_pages_cover_every_row_once(self):
+        now = timezone.now()
+        Assignment.objects.bulk_create([
+            Assignment(course=self.course, title=f"Lab {number}", due_date=now + timedelta(days=number % 7))
+            for number in range(45)
+        ])
+        seen, url = [], "/api/assignments/?page_size=20"
+        while url:
+            page = self.client.get(url).json()
+            self.assertLessEqual(len(page["results"]), 20)
+            seen += [row["id"] for row in page["results"]]
+            url = page["next"]
+        self.assertEqual(len(seen), 45)
+        self.assertEqual(len(set(seen)), 45)
+        dues = list(Assignment.objects.filter(id__in=seen).order_by("due_date", "id").values_list("id", flat=True))
+        self.assertEqual(seen, dues)
+
+    def test_page_size_is_capped(self):
+        Assignment.objects.bulk_create([
+            Assignment(course=self.course, title=f"Lab {number}", due_date=timezone.now()) for number in range(120)
+        ])
+        self.assertEqual(len(self.client.get("/api/assignments/?page_size=500").json()["results"]), 100)
+
+
+class SparseFieldsetTests(ApiTestCase):
+    def test_list_returns_only_requested_fields_and_id(self):
+        Assignment.objects.create(course=self.course, title="Lab 1", due_date=timezone.now())
+        row = self.client.get("/api/assignments/?fields=title,due_date").json()["results"][0]
+        self.assertEqual(set(row), {"id", "title", "due_date"})
+
+    def test_writes_ignore_fields(self):
+        response = self.client.post(
+            "/api/assignments/?fields=title",
+            {"course": self.course.pk, "title": "Lab 2", "due_date": "2026-11-02T17:00:00Z"},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertIn("due_date", response.json())
+
+
+class OwnershipTests(ApiTestCase):
+    def test_rows_and_courses_of_other_users_are_out_of_reach(self):
+        other = User.objects.create_user("bob", password="pw")
+        theirs = Course.objects.create(user=other, name="Databases", code="CS340")
+        hidden = Assignment.objects.create(course=theirs, title="Theirs", due_date=timezone.now())
+
+        self.assertEqual(self.client.get("/api/assignments/").json()["results"], [])
+        self.assertEqual(self.client.get(f"/api/assignments/{hidden.pk}/").status_code, 404)
+        response = self.client.post(
+            "/api/assignments/",
+            {"course": theirs.pk, "title": "Sneaky", "due_date": "2026-11-02T17:00:00Z"},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("course", response.json())
+
+    def test_requires_login(self):
+        self.client.logout()
+        self.assertEqual(self.client.get("/api/courses/").status_code, 403)
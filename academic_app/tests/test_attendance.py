@@ -0,0 +1,104 @@
+import json
+from datetime import date, time
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from academic_app import attendance
+from academic_app.models import Attendance, ClassMeeting, Course
+
+# 2026-10-05 is a Monday.
+WEEK = (date(2026, 10, 5), date(2026, 10, 11))
+
+
+class AttendanceTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("ada", password="pw")
+        self.client.force_login(self.user)
+        self.course = Course.objects.create(user=self.user, name="Algorithms", code="CS201")
+        for weekday in (0, 2):
+            ClassMeeting.objects.create(course=self.course, weekday=weekday, start_time=time(9), end_time=time(10))
+
+    def post_grid(self, body):
+        return self.client.post("/attendance/grid/", json.dumps(body), content_type="application/json")
+
+
+class MarkAttendanceTests(AttendanceTestCase):
+    def test_marks_every_scheduled_class_once(self):
+        self.assertEqual(attendance.meeting_dates(self.course, *WEEK), [date(2026, 10, 5), date(2026, 10, 7)])
+        self.assertEqual(attendance.mark_attendance(self.user, *WEEK), 2)
+        self.assertEqual(attendance.mark_attendance(self.user, *WEEK, present=False), 2)
+        self.assertEqual(list(Attendance.objects.values_list("present", flat=True)), [False, False])
+
+    def test_remarking_keeps_notes(self):
+        Attendance.objects.create(course=self.course, date=date(2026, 10, 5), present=False, notes="Dentist")
+        attendance.mark_attendance(self.user, *WEEK)
+        record = Attendance.objects.get(date=date(2026, 10, 5))
+        self.assertEqual((record.present, record.notes), (True, "Dentist"))
+
+    def test_overrides_for_other_users_courses_are_ignored(self):
+        other = Course.objects.create(user=User.objects.create_user("bob", password="pw"), name="DB", code="CS340")
+        attendance.mark_attendance(self.user, *WEEK, overrides=[(other.id, date(2026, 10, 6), True)])
+        self.assertFalse(Attendance.objects.filter(course=other).exists())
+
+
+class AttendanceGridViewTests(AttendanceTestCase):
+    def test_post_then_get(self):
+        response = self.post_grid({
+            "start": "2026-10-05", "end": "2026-10-11", "present": True,
+            "overrides": [{"course": self.course.pk, "date": "2026-10-07", "present": False}],
+        })
+        self.assertEqual(response.json()["count"], 2)
+        grid = self.client.get("/attendance/grid/", {"start": "2026-10-05", "end": "2026-10-11"}).json()["grid"]
+        self.assertEqual(grid[0]["dates"], [
+            {"date": "2026-10-05", "present": True}, {"date": "2026-10-07", "present": False},
+        ])
+
+    def test_bad_bodies_are_a_400(self):
+        for body in (
+            [1, 2],
+            "false",
+            {"present": "false"},
+            {"courses": "12"},
+            {"overrides": {"course": 1}},
+            {"overrides": ["x"]},
+            {"overrides": [{"course": self.course.pk, "date": "2026-10-07", "present": "false"}]},
+            {"overrides": [{"course": "abc", "date": "2026-10-07"}]},
+            {"overrides": [{"course": self.course.pk, "date": "not a date"}]},
+            {"start": "2026-10-05", "end": "2026-01-01"},
+        ):
+            with self.subTest(body=body):
+                self.assertEqual(self.post_grid(body).status_code, 400)
+        self.assertFalse(Attendance.objects.exists())
+
+
+class MeetingApiTests(AttendanceTestCase):
+    def test_create_and_replace_meetings(self):
+        response = self.client.post("/api/courses/", {
+            "name": "Compilers", "code": "CS415", "credits": 3,
+            "meetings": [{"weekday": 1, "start_time": "13:00", "end_time": "14:30", "location": "B12"}],
+        }, content_type="application/json")
+        self.assertEqual(response.status_code, 201, response.content)
+        course_id = response.json()["id"]
+        self.assertEqual(ClassMeeting.objects.filter(course_id=course_id).count(), 1)
+
+        response = self.client.patch(f"/api/courses/{course_id}/", {"meetings": [
+            {"weekday": 2, "start_time": "09:00", "end_time": "10:00"},
+            {"weekday": 4, "start_time": "09:00", "end_time": "10:00"},
+        ]}, content_type="application/json")
+        self.assertEqual([meeting["weekday"] for meeting in response.json()["meetings"]], [2, 4])
+
+        self.client.patch(f"/api/courses/{course_id}/", {"name": "Compilers II"}, content_type="application/json")
+        self.assertEqual(ClassMeeting.objects.filter(course_id=course_id).count(), 2)
+
+    def test_invalid_meetings_are_rejected(self):
+        url = f"/api/courses/{self.course.pk}/"
+        for meetings in (
+            [{"weekday": 1, "start_time": "10:00", "end_time": "09:00"}],
+            [{"weekday": 1, "start_time": "09:00", "end_time": "10:00"}] * 2,
+            [{"weekday": 9, "start_time": "09:00", "end_time": "10:00"}],
+        ):
+            with self.subTest(meetings=meetings):
+                response = self.client.patch(url, {"meetings": meetings}, content_type="application/json")
+                self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.course.meetings.count(), 2)
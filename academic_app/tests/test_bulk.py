@@ -0,0 +1,114 @@
+import json
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from academic_app.models import Assignment, Course, Exam, Reminder, Term
+
+
+class BulkTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("ada", password="pw")
+        self.client.force_login(self.user)
+        self.course = Course.objects.create(user=self.user, name="Algorithms", code="CS201")
+        self.other_course = Course.objects.create(user=self.user, name="Compilers", code="CS415")
+        due = timezone.now() + timedelta(days=3)
+        self.assignments = [
+            Assignment.objects.create(course=self.course, title=f"Lab {number}", due_date=due) for number in range(3)
+        ]
+        self.ids = [assignment.pk for assignment in self.assignments]
+
+    def bulk(self, **body):
+        return self.client.post("/bulk/", json.dumps(body), content_type="application/json")
+
+
+class BulkUpdateTests(BulkTestCase):
+    def test_complete_and_priority(self):
+        response = self.bulk(type="assignment", action="complete", ids=self.ids[:2])
+        self.assertEqual(response.json()["count"], 2)
+        self.assertEqual(Assignment.objects.filter(completed=True).count(), 2)
+
+        self.bulk(type="assignment", action="priority", ids=self.ids, priority="high")
+        self.assertEqual(Assignment.objects.filter(priority="high").count(), 3)
+        self.assertEqual(self.bulk(type="assignment", action="priority", ids=self.ids, priority="x").status_code, 400)
+
+    def test_reassign_and_delete(self):
+        exam = Exam.objects.create(course=self.course, title="Midterm", exam_date=timezone.now() + timedelta(days=5))
+        self.bulk(type="exam", action="reassign", ids=[exam.pk], course=self.other_course.pk)
+        exam.refresh_from_db()
+        self.assertEqual(exam.course, self.other_course)
+
+        self.assertEqual(self.bulk(type="assignment", action="delete", ids=self.ids).json()["count"], 3)
+        self.assertFalse(Assignment.objects.exists())
+
+    def test_other_users_rows_are_untouched(self):
+        other = User.objects.create_user("bob", password="pw")
+        theirs = Assignment.objects.create(
+            course=Course.objects.create(user=other, name="Databases", code="CS340"),
+            title="Theirs", due_date=timezone.now(),
+        )
+        self.assertEqual(self.bulk(type="assignment", action="delete", ids=[theirs.pk]).json()["count"], 0)
+        self.assertTrue(Assignment.objects.filter(pk=theirs.pk).exists())
+
+    def test_bad_input_is_a_400(self):
+        for body in (
+            {"type": "assignment", "action": "complete"},
+            {"type": "assignment", "action": "complete", "ids": ["x"]},
+            {"type": "event", "action": "complete", "ids": self.ids},
+            {"type": "assignment", "action": "reassign", "ids": self.ids, "course": "abc"},
+            {"type": "assignment", "action": "reassign", "ids": self.ids, "course": [self.other_course.pk]},
+            {"type": "assignment", "action": "reassign", "ids": self.ids},
+        ):
+            with self.subTest(body=body):
+                self.assertEqual(self.bulk(**body).status_code, 400)
+        self.assertEqual(self.client.post("/bulk/", "[1]", content_type="application/json").status_code, 400)
+
+    def test_reassign_to_an_ended_term_is_rejected(self):
+        today = timezone.localdate()
+        old = Term.objects.create(
+            user=self.user, name="Spring", start_date=today - timedelta(days=200), end_date=today - timedelta(days=90)
+        )
+        archived = Course.objects.create(user=self.user, name="Old", code="CS100", term=old)
+        response = self.bulk(type="assignment", action="reassign", ids=self.ids, course=archived.pk)
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Assignment.objects.filter(course=archived).exists())
+
+
+class BulkReminderTests(BulkTestCase):
+    def test_completion_removes_and_restores_reminders(self):
+        self.assertEqual(Reminder.objects.filter(kind="assignment").count(), 3)
+        self.bulk(type="assignment", action="complete", ids=self.ids)
+        self.assertFalse(Reminder.objects.exists())
+        self.bulk(type="assignment", action="incomplete", ids=self.ids)
+        self.assertEqual(Reminder.objects.filter(kind="assignment").count(), 3)
+
+    def test_reassign_updates_reminder_course(self):
+        self.bulk(type="assignment", action="reassign", ids=self.ids[:1], course=self.other_course.pk)
+        self.assertEqual(Reminder.objects.get(object_id=self.ids[0]).course_name, "Compilers")
+
+    def test_priority_change_leaves_reminders_alone(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.bulk(type="assignment", action="priority", ids=self.ids, priority="low")
+        self.assertFalse(any("academic_app_reminder" in query["sql"] for query in queries))
+
+
+class ToggleCompletionTests(BulkTestCase):
+    def test_toggle_writes_only_the_flag(self):
+        assignment = self.assignments[0]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(f"/assignment/{assignment.pk}/toggle/")
+        self.assertTrue(response.json()["completed"])
+        updates = [query["sql"] for query in queries if query["sql"].startswith('UPDATE "academic_app_assignment"')]
+        self.assertEqual(len(updates), 1)
+        self.assertNotIn('"title"', updates[0])
+        self.assertTrue(self.client.post(f"/assignment/{assignment.pk}/toggle/").json()["completed"] is False)
+
+    def test_toggle_requires_post_and_ownership(self):
+        assignment = self.assignments[0]
+        self.assertEqual(self.client.get(f"/assignment/{assignment.pk}/toggle/").status_code, 405)
+        self.client.force_login(User.objects.create_user("bob", password="pw"))
+        self.assertEqual(self.client.post(f"/assignment/{assignment.pk}/toggle/").status_code, 404)
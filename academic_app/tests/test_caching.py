@@ -0,0 +1,67 @@
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from academic_app.caching import bump_data_version, deferred_invalidation, get_data_version
+from academic_app.models import Assignment, Course
+
+# Rendering pages must not depend on a collectstatic manifest.
+PLAIN_STATIC = override_settings(STORAGES={
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+})
+
+
+class DataVersionTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("ada", password="pw")
+        self.other = User.objects.create_user("bob", password="pw")
+
+    def test_version_is_stable_until_bumped(self):
+        version = get_data_version(self.user.id)
+        self.assertEqual(get_data_version(self.user.id), version)
+        self.assertGreater(bump_data_version(self.user.id), version)
+        self.assertNotEqual(get_data_version(self.user.id), version)
+
+    def test_writes_bump_only_the_owner_after_commit(self):
+        mine, theirs = get_data_version(self.user.id), get_data_version(self.other.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            course = Course.objects.create(user=self.user, name="Algorithms", code="CS201")
+            self.assertEqual(get_data_version(self.user.id), mine)
+        after_course = get_data_version(self.user.id)
+        self.assertNotEqual(after_course, mine)
+        self.assertEqual(get_data_version(self.other.id), theirs)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Assignment.objects.create(course=course, title="Lab 1", due_date=timezone.now())
+        self.assertNotEqual(get_data_version(self.user.id), after_course)
+
+    def test_deferred_invalidation_bumps_once(self):
+        course = Course.objects.create(user=self.user, name="Algorithms", code="CS201")
+        for number in range(3):
+            Assignment.objects.create(course=course, title=f"Lab {number}", due_date=timezone.now())
+        with self.captureOnCommitCallbacks() as callbacks:
+            with deferred_invalidation(self.user.id):
+                Assignment.objects.filter(course=course).delete()
+        self.assertEqual(len(callbacks), 1)
+
+
+@PLAIN_STATIC
+class DashboardFragmentTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("ada", password="pw")
+        self.client.force_login(self.user)
+
+    def test_course_list_fragment_refreshes_after_a_write(self):
+        Course.objects.create(user=self.user, name="Algorithms", code="CS201")
+        self.assertContains(self.client.get("/"), "CS201")
+        with self.captureOnCommitCallbacks(execute=True):
+            Course.objects.create(user=self.user, name="Compilers", code="CS415")
+        self.assertContains(self.client.get("/"), "CS415")
+
+    def test_fragments_are_not_shared_between_users(self):
+        Course.objects.create(user=self.user, name="Algorithms", code="CS201")
+        self.client.get("/")
+        other = User.objects.create_user("bob", password="pw")
+        self.client.force_login(other)
+        self.assertNotContains(self.client.get("/"), "CS201")
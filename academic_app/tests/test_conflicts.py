@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+
+from academic_app import conflicts
+from academic_app.conflicts import Interval
+from academic_app.forms import ExamForm
+from academic_app.models import Assignment, CalendarEvent, Course, Exam
+
+T0 = datetime(2026, 10, 5, 9, 0, tzinfo=dt_timezone.utc)
+
+
+def span(name, start_hour, end_hour):
+    return Interval("event", name, name, T0 + timedelta(hours=start_hour), T0 + timedelta(hours=end_hour))
+
+
+def instant(name, hour):
+    return Interval("assignment", name, name, T0 + timedelta(hours=hour), T0 + timedelta(hours=hour))
+
+
+class SweepTests(SimpleTestCase):
+    def test_overlap_rules(self):
+        self.assertTrue(span("a", 0, 2).overlaps(span("b", 1, 3)))
+        self.assertFalse(span("a", 0, 1).overlaps(span("b", 1, 2)))  # Back to back
+        self.assertTrue(instant("d", 0).overlaps(span("a", 0, 1)))
+        self.assertFalse(instant("d", 1).overlaps(span("a", 0, 1)))
+        self.assertFalse(instant("d", 1).overlaps(instant("e", 1)))
+
+    def test_sweep_finds_every_pair_once(self):
+        intervals = [span("a", 0, 4), span("b", 1, 2), span("c", 3, 5), instant("d", 0), instant("e", 6), span("f", 5, 6)]
+        found = {frozenset((x.id, y.id)) for x, y in conflicts.sweep_conflicts(intervals)}
+        self.assertEqual(found, {frozenset(p) for p in ({"a", "b"}, {"a", "c"}, {"a", "d"})})
+        self.assertEqual(len(conflicts.sweep_conflicts(intervals)), 3)
+
+    def test_sweep_matches_brute_force(self):
+        intervals = [span(str(n), n % 7, n % 7 + 1 + n % 3) for n in range(30)] + [instant(f"i{n}", n % 9) for n in range(10)]
+        brute = {
+            frozenset((x.id, y.id))
+            for i, x in enumerate(intervals) for y in intervals[i + 1:] if x.overlaps(y)
+        }
+        swept = {frozenset((x.id, y.id)) for x, y in conflicts.sweep_conflicts(intervals)}
+        self.assertEqual(swept, brute)
+
+
+class ConflictsForTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("ada", password="pw")
+        self.course = Course.objects.create(user=self.user, name="Algorithms", code="CS201")
+
+    def test_long_exam_that_started_earlier_is_found(self):
+        Exam.objects.create(course=self.course, title="Final", exam_date=T0, duration=Exam.MAX_DURATION_MINUTES)
+        event = CalendarEvent.objects.create(
+            user=self.user, title="Dinner", event_date=T0 + timedelta(minutes=Exam.MAX_DURATION_MINUTES - 30),
+        )
+        self.assertEqual([c.title for c in conflicts.conflicts_for(event)], ["Final"])
+
+    def test_multi_day_event_that_started_days_earlier_is_found(self):
+        CalendarEvent.objects.create(
+            user=self.user, title="Conference", event_date=T0 - timedelta(days=3), end_date=T0 + timedelta(hours=2),
+        )
+        exam = Exam.objects.create(course=self.course, title="Quiz", exam_date=T0, duration=30)
+        self.assertEqual([c.title for c in conflicts.conflicts_for(exam)], ["Conference"])
+
+    def test_recurring_occurrences_and_deadlines(self):
+        CalendarEvent.objects.create(
+            user=self.user, title="Seminar", event_date=T0 - timedelta(weeks=2), end_date=T0 - timedelta(weeks=2, hours=-2),
+            recurrence_rule="FREQ=WEEKLY;COUNT=5",
+        )
+        deadline = Assignment.objects.create(course=self.course, title="Lab", due_date=T0 + timedelta(hours=1))
+        self.assertEqual([c.title for c in conflicts.conflicts_for(deadline)], ["Seminar"])
+        deadline.completed = True
+        self.assertEqual(conflicts.conflicts_for(deadline), [])
+
+    def test_endpoint_lists_conflicts_in_range(self):
+        Exam.objects.create(course=self.course, title="Midterm", exam_date=T0, duration=90)
+        CalendarEvent.objects.create(user=self.user, title="Gym", event_date=T0 + timedelta(minutes=30))
+        self.client.force_login(self.user)
+        response = self.client.get("/conflicts/", {"start": "2026-10-05", "end": "2026-10-06"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["conflicts"]), 1)
+
+
+class ExamDurationLimitTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("ada", password="pw")
+        self.course = Course.objects.create(user=self.user, name="Algorithms", code="CS201")
+
+    def test_form_and_api_reject_overlong_exams(self):
+        for duration, valid in ((Exam.MAX_DURATION_MINUTES, True), (Exam.MAX_DURATION_MINUTES + 1, False), (0, False)):
+            with self.subTest(duration=duration):
+                form = ExamForm({
+                    "course": self.course.pk, "title": "Final", "exam_type": "final",
+                    "exam_date": "2026-12-10T09:00", "duration": duration,
+                }, user=self.user)
+                self.assertEqual(form.is_valid(), valid, form.errors)
+
+        self.client.force_login(self.user)
+        response = self.client.post("/api/exams/", {
+            "course": self.course.pk, "title": "Final", "exam_date": "2026-12-10T09:00:00Z", "duration": 24 * 60,
+        }, content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("duration", response.json())
@@ -0,0 +1,52 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+
+from academic_app.forms import AssignmentForm, CourseCatalogue, ExamForm
+from academic_app.models import Course, Term
+
+
+class CourseCatalogueTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("ada", password="pw")
+        self.course = Course.objects.create(user=self.user, name="Algorithms", code="CS201")
+        Course.objects.create(user=self.user, name="Compilers", code="CS415")
+
+    def test_forms_sharing_a_catalogue_run_one_query(self):
+        catalogue = CourseCatalogue(self.user)
+        forms = [AssignmentForm(user=self.user, courses=catalogue), ExamForm(user=self.user, courses=catalogue)]
+        with self.assertNumQueries(1):
+            html = "".join(str(form["course"]) for form in forms)
+            self.assertEqual(len(catalogue), 2)
+        self.assertEqual(html.count("CS201"), 2)
+
+    def test_submitted_course_is_resolved_from_the_catalogue(self):
+        catalogue = CourseCatalogue(self.user)
+        list(catalogue)
+        form = AssignmentForm(
+            {"course": self.course.pk, "title": "Lab 1", "due_date": "2026-11-02T17:00", "priority": "medium",
+             "estimated_hours": 2},
+            user=self.user, courses=catalogue,
+        )
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertIs(form.cleaned_data["course"], catalogue.get(self.course.pk))
+
+    def test_other_users_courses_are_rejected(self):
+        other = User.objects.create_user("bob", password="pw")
+        theirs = Course.objects.create(user=other, name="Databases", code="CS340")
+        form = AssignmentForm(
+            {"course": theirs.pk, "title": "Lab 1", "due_date": "2026-11-02T17:00", "priority": "medium"},
+            user=self.user,
+        )
+        self.assertFalse(form.is_valid())
+        self.assertEqual(form.errors["course"][0].count("valid choice"), 1)
+
+    def test_courses_of_ended_terms_are_left_out(self):
+        today = timezone.localdate()
+        old = Term.objects.create(
+            user=self.user, name="Spring", start_date=today - timedelta(days=200), end_date=today - timedelta(days=90)
+        )
+        Course.objects.create(user=self.user, name="Old", code="CS100", term=old)
+        self.assertEqual(sorted(course.code for course in CourseCatalogue(self.user)), ["CS201", "CS415"])
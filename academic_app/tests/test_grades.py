@@ -0,0 +1,125 @@
+import json
+from types import SimpleNamespace
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from academic_app import grades
+from academic_app.grades import GradeItem
+from academic_app.models import Assignment, Course, Exam, GradeCategory
+
+
+def item(key, weight, score=None, max_score=100):
+    return GradeItem("assignment", key, f"Item {key}", "Work", weight, max_score, score)
+
+
+class GradeItemsTests(SimpleTestCase):
+    def test_categories_are_weighted_and_renormalised(self):
+        homework = SimpleNamespace(id=1, name="Homework", weight=40)
+        exams = SimpleNamespace(id=2, name="Exams", weight=40)
+        empty = SimpleNamespace(id=3, name="Participation", weight=20)
+        rows = [
+            ("assignment", SimpleNamespace(id=1, title="HW1", category_id=1, max_score=10, score=9)),
+            ("assignment", SimpleNamespace(id=2, title="HW2", category_id=1, max_score=30, score=None)),
+            ("exam", SimpleNamespace(id=3, title="Final", category_id=2, max_score=100, score=None)),
+            ("assignment", SimpleNamespace(id=4, title="Loose", category_id=None, max_score=10, score=10)),
+        ]
+        weights = {entry.key: entry.weight for entry in grades.grade_items([homework, exams, empty], rows)}
+        self.assertEqual(set(weights), {"assignment:1", "assignment:2", "exam:3"})
+        self.assertAlmostEqual(weights["assignment:1"], 0.125)
+        self.assertAlmostEqual(weights["assignment:2"], 0.375)
+        self.assertAlmostEqual(weights["exam:3"], 0.5)
+
+    def test_without_categories_items_count_by_points(self):
+        rows = [("assignment", SimpleNamespace(id=n, title="", category_id=None, max_score=n * 10, score=None)) for n in (1, 3)]
+        self.assertEqual([round(entry.weight, 2) for entry in grades.grade_items([], rows)], [0.25, 0.75])
+
+
+class ProjectTests(SimpleTestCase):
+    def setUp(self):
+        self.items = [item(1, 0.25, 80), item(2, 0.25, 100), item(3, 0.5)]
+
+    def test_current_grade_and_range(self):
+        projection = grades.project(self.items)
+        self.assertEqual(projection["current"], 90.0)
+        self.assertEqual(projection["current_letter"], "A")
+        self.assertEqual((projection["projected_min"], projection["projected_max"]), (45.0, 95.0))
+        self.assertEqual(projection["outlook"], {"A": "reachable", "B": "reachable", "C": "reachable", "D": "reachable"})
+        self.assertEqual(projection["needed_average"]["A"], 90.0)
+        self.assertEqual(projection["needed_average"]["D"], 30.0)
+
+    def test_needed_per_item_matches_recomputing_the_grade(self):
+        items = [item(1, 0.2, 70), item(2, 0.3), item(3, 0.5)]
+        projection = grades.project(items, assume=60, target=70)
+        for row in projection["remaining"]:
+            needed = row["needed"]["target"]
+            self.assertIsNotNone(needed)
+            overrides = {other.key: 60 for other in items[1:] if other.key != row["key"]}
+            overrides[row["key"]] = needed
+            final = grades.project(items, overrides=overrides)["current"]
+            self.assertAlmostEqual(final, 70, delta=0.1)
+
+    def test_secured_and_out_of_reach(self):
+        projection = grades.project([item(1, 0.7, 100), item(2, 0.3)])
+        self.assertEqual(projection["outlook"]["C"], "secured")
+        self.assertEqual(projection["needed_average"]["C"], 0.0)
+        self.assertEqual(projection["outlook"]["B"], "reachable")
+        projection = grades.project([item(1, 0.7, 20), item(2, 0.3)])
+        self.assertEqual(projection["outlook"]["A"], "out of reach")
+        self.assertIsNone(projection["needed_average"]["A"])
+
+    def test_overrides_count_as_graded(self):
+        projection = grades.project(self.items, overrides={"assignment:3": 50})
+        self.assertEqual((projection["current"], projection["remaining"]), (70.0, []))
+
+    def test_rejects_non_finite_and_out_of_range_inputs(self):
+        for kwargs in (
+            {"target": float("nan")}, {"target": "inf"}, {"target": 150}, {"target": "Z"},
+            {"assume": -1}, {"overrides": {"assignment:3": float("inf")}},
+        ):
+            with self.subTest(kwargs=kwargs):
+                with self.assertRaises(ValueError):
+                    grades.project(self.items, **kwargs)
+
+    def test_large_courses_stay_cheap(self):
+        items = [item(n, 1 / 500) for n in range(500)]
+        projection = grades.project(items, assume=80, target="B")
+        self.assertEqual(len(projection["remaining"]), 500)
+        self.assertEqual(projection["remaining"][0]["needed"]["target"], 80.0)
+
+
+class GradeViewTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("ada", password="pw")
+        self.client.force_login(self.user)
+        self.course = Course.objects.create(user=self.user, name="Algorithms", code="CS201")
+        category = GradeCategory.objects.create(course=self.course, name="Exams", weight=100)
+        Exam.objects.create(
+            course=self.course, title="Midterm", exam_date=timezone.now(), category=category, score=45, max_score=50,
+        )
+        self.final = Exam.objects.create(
+            course=self.course, title="Final", exam_date=timezone.now(), category=category, max_score=50,
+        )
+
+    def test_projection_endpoint(self):
+        response = self.client.get(f"/api/grades/{self.course.pk}/", {"target": "A"})
+        self.assertEqual(response.json()["current"], 90.0)
+        response = self.client.post(
+            f"/api/grades/{self.course.pk}/", json.dumps({"scores": {f"exam:{self.final.pk}": 70}}),
+            content_type="application/json",
+        )
+        self.assertEqual(response.json()["current"], 80.0)
+
+    def test_bad_inputs_are_a_400(self):
+        url = f"/api/grades/{self.course.pk}/"
+        for params in ({"target": "nan"}, {"target": "inf"}, {"target": "150"}, {"assume": "x"}):
+            with self.subTest(params=params):
+                self.assertEqual(self.client.get(url, params).status_code, 400)
+        self.assertEqual(self.client.post(url, "[1]", content_type="application/json").status_code, 400)
+
+    def test_summaries_skip_courses_without_work(self):
+        Course.objects.create(user=self.user, name="Empty", code="CS100")
+        Assignment.objects.create(course=self.course, title="Ungraded", due_date=timezone.now())
+        summaries = self.client.get("/api/grades/").json()["courses"]
+        self.assertEqual([summary["code"] for summary in summaries], ["CS201"])
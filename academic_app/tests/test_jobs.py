@@ -0,0 +1,121 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from academic_app import jobs
+from academic_app.models import Job
+
+calls = []
+
+
+@jobs.task("test.echo")
+def echo(payload, job):
+    calls.append(payload)
+    return payload
+
+
+@jobs.task("test.flaky", max_attempts=2)
+def flaky(payload, job):
+    raise RuntimeError("boom")
+
+
+class JobTestCase(TestCase):
+    def setUp(self):
+        calls.clear()
+
+
+class ClaimTests(JobTestCase):
+    def test_claims_by_priority_then_age(self):
+        low = jobs.enqueue("test.echo", {"n": 1})
+        high = jobs.enqueue("test.echo", {"n": 2}, priority=10)
+        later = jobs.enqueue("test.echo", {"n": 3}, priority=10, delay=timedelta(hours=1))
+        first, second = jobs.claim("w1"), jobs.claim("w2")
+        self.assertEqual((first.pk, second.pk), (high.pk, low.pk))
+        self.assertIsNone(jobs.claim("w3"))
+        jobs.execute(first, "w1")
+        jobs.execute(second, "w2")
+        self.assertEqual(jobs.claim("w3", now=timezone.now() + timedelta(hours=2)).pk, later.pk)
+
+    def test_expired_locks_are_taken_over(self):
+        job = jobs.enqueue("test.echo")
+        jobs.claim("dead")
+        self.assertIsNone(jobs.claim("w2"))
+        soon = timezone.now() + jobs.DEFAULT_TIMEOUT + timedelta(seconds=1)
+        claimed = jobs.claim("w2", now=soon)
+        self.assertEqual((claimed.pk, claimed.locked_by, claimed.attempts), (job.pk, "w2", 2))
+
+        # The first worker finishing late does not overwrite the takeover.
+        stale = Job.objects.get(pk=job.pk)
+        stale.locked_by = "dead"
+        self.assertTrue(jobs.execute(stale, "dead"))
+        self.assertEqual(Job.objects.get(pk=job.pk).status, "running")
+
+    def test_expired_last_attempt_fails_instead_of_rerunning(self):
+        job = jobs.enqueue("test.flaky")
+        Job.objects.filter(pk=job.pk).update(attempts=2, status="running", locked_until=timezone.now())
+        self.assertIsNone(jobs.claim("w1", now=timezone.now() + timedelta(seconds=1)))
+        job.refresh_from_db()
+        self.assertEqual(job.status, "failed")
+        self.assertIn("Timed out", job.error)
+
+
+class ExecuteTests(JobTestCase):
+    def test_success_records_the_result(self):
+        job = jobs.enqueue("test.echo", {"n": 1})
+        self.assertTrue(jobs.execute(jobs.claim("w1"), "w1"))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.result, job.locked_until), ("succeeded", {"n": 1}, None))
+
+    def test_failures_back_off_then_fail(self):
+        job = jobs.enqueue("test.flaky")
+        with self.assertLogs("academic_app.jobs", "WARNING"):
+            self.assertFalse(jobs.execute(jobs.claim("w1"), "w1"))
+        job.refresh_from_db()
+        self.assertEqual(job.status, "queued")
+        self.assertGreater(job.run_at, timezone.now() + jobs.RETRY_BASE_DELAY / 2)
+
+        with self.assertLogs("academic_app.jobs", "ERROR"):
+            self.assertFalse(jobs.execute(jobs.claim("w1", now=job.run_at), "w1"))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), ("failed", 2))
+        self.assertIn("RuntimeError: boom", job.error)
+
+    def test_unknown_tasks_fail(self):
+        with self.assertRaises(ValueError):
+            jobs.enqueue("test.missing")
+        job = Job.objects.create(task="test.missing")
+        with self.assertLogs("academic_app.jobs", "ERROR"):
+            self.assertFalse(jobs.execute(jobs.claim("w1"), "w1"))
+        self.assertEqual(Job.objects.get(pk=job.pk).status, "failed")
+
+
+class WorkerTests(JobTestCase):
+    def test_burst_drains_the_queue_and_purges_old_jobs(self):
+        for n in range(3):
+            jobs.enqueue("test.echo", {"n": n})
+        old = Job.objects.create(task="test.echo", status="succeeded", finished_at=timezone.now() - timedelta(days=30))
+        self.assertEqual(jobs.Worker("w1").run(burst=True), 3)
+        self.assertEqual(calls, [{"n": 0}, {"n": 1}, {"n": 2}])
+        self.assertFalse(Job.objects.filter(pk=old.pk).exists())
+
+    @override_settings(JOBS_EAGER=True)
+    def test_eager_mode_runs_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            job = jobs.enqueue("test.echo", {"n": 1})
+            self.assertEqual(calls, [])
+        self.assertEqual(Job.objects.get(pk=job.pk).status, "succeeded")
+        self.assertIsNone(jobs.run_job(job.pk, "again"))
+
+
+class JobStatusViewTests(JobTestCase):
+    def test_only_the_owner_sees_a_job(self):
+        user = User.objects.create_user("ada", password="pw")
+        job = jobs.enqueue("test.flaky", user=user)
+        Job.objects.filter(pk=job.pk).update(status="failed", error="Traceback...\nRuntimeError: boom\n")
+        self.client.force_login(user)
+        body = self.client.get(f"/jobs/{job.pk}/").json()["job"]
+        self.assertEqual((body["status"], body["error"]), ("failed", "RuntimeError: boom"))
+        self.client.force_login(User.objects.create_user("bob", password="pw"))
+        self.assertEqual(self.client.get(f"/jobs/{job.pk}/").status_code, 404)
@@ -0,0 +1,122 @@
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+
+from academic_app import recurrence
+from academic_app.forms import CalendarEventForm
+from academic_app.models import CalendarEvent
+
+START = datetime(2026, 9, 1, 10, 0, tzinfo=dt_timezone.utc)  # A Tuesday
+
+
+class ValidateRuleTests(SimpleTestCase):
+    def test_accepts_ordinary_rules(self):
+        for rule in (
+            "FREQ=WEEKLY;BYDAY=TU,TH;UNTIL=20261215T000000Z",
+            "FREQ=DAILY;COUNT=10",
+            "FREQ=MONTHLY;BYMONTHDAY=-1",
+            "FREQ=YEARLY;BYMONTH=2;BYMONTHDAY=29",
+            "FREQ=WEEKLY",
+            "FREQ=DAILY",
+        ):
+            with self.subTest(rule=rule):
+                recurrence.validate_rule(rule, START)
+
+    def test_rejects_rules_outside_the_limits(self):
+        for rule in (
+            "FREQ=MINUTELY;COUNT=2000000",
+            "FREQ=SECONDLY;UNTIL=20300101T000000Z",
+            "FREQ=DAILY;BYHOUR=1,2,3",
+            "FREQ=DAILY;COUNT=1001",
+            "FREQ=DAILY;UNTIL=20350101T000000Z",
+            "FREQ=YEARLY;BYMONTH=2;BYMONTHDAY=30",
+            "FREQ=MONTHLY;BYMONTHDAY=32",
+            "FREQ=MONTHLY;BYDAY=9MO",
+            "FREQ=DAILY;UNTIL=20300801T000000Z",  # Over 1000 occurrences
+            "nonsense",
+        ):
+            with self.subTest(rule=rule):
+                with self.assertRaises(ValueError):
+                    recurrence.validate_rule(rule, START)
+
+    def test_impossible_rules_fail_fast(self):
+        started = time.monotonic()
+        with self.assertRaises(ValueError):
+            recurrence.validate_rule("FREQ=YEARLY;BYMONTH=4;BYMONTHDAY=31", START)
+        self.assertLess(time.monotonic() - started, 1)
+
+
+class LastOccurrenceTests(SimpleTestCase):
+    def test_count_and_until(self):
+        self.assertEqual(recurrence.last_occurrence("FREQ=WEEKLY;COUNT=3", START), START + timedelta(weeks=2))
+        self.assertEqual(
+            recurrence.last_occurrence("FREQ=DAILY;UNTIL=20260905T235959Z", START), START + timedelta(days=4)
+        )
+
+    def test_open_ended_and_legacy_rules_have_no_end(self):
+        self.assertIsNone(recurrence.last_occurrence("FREQ=WEEKLY", START))
+        self.assertIsNone(recurrence.last_occurrence("FREQ=DAILY;COUNT=5000", START))
+        self.assertIsNone(recurrence.last_occurrence("FREQ=DAILY;UNTIL=20400101T000000Z", START))
+
+
+class OccurrenceTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("ada", password="pw")
+        self.event = CalendarEvent.objects.create(
+            user=self.user, title="Seminar", event_date=START, end_date=START + timedelta(hours=1),
+            recurrence_rule="FREQ=WEEKLY;BYDAY=TU,TH;COUNT=6",
+        )
+
+    def test_recurrence_end_is_stored_on_save(self):
+        self.assertEqual(self.event.recurrence_end, datetime(2026, 9, 17, 10, 0, tzinfo=dt_timezone.utc))
+
+    def test_window_expansion_and_skipped_occurrences(self):
+        window = (datetime(2026, 9, 7, tzinfo=dt_timezone.utc), datetime(2026, 9, 12, tzinfo=dt_timezone.utc))
+        starts = [start for start, _ in self.event.occurrences(*window)]
+        self.assertEqual([start.day for start in starts], [8, 10])
+
+        self.event.skip_occurrence(starts[0])
+        self.event.refresh_from_db()
+        self.assertEqual([start.day for start, _ in self.event.occurrences(*window)], [10])
+        self.assertEqual(self.event.next_occurrence(window[0]).day, 10)
+
+    def test_occurrences_carry_the_duration(self):
+        start, end = next(self.event.occurrences(START, START + timedelta(days=1)))
+        self.assertEqual(end - start, timedelta(hours=1))
+
+    def test_calendar_feed_expands_only_the_window(self):
+        self.client.force_login(self.user)
+        response = self.client.get("/calendar-data/", {"start": "2026-09-07T00:00:00Z", "end": "2026-09-12T00:00:00Z"})
+        events = [event for event in response.json() if str(event["id"]).startswith("event-")]
+        self.assertEqual(len(events), 2)
+
+    def test_api_rejects_rules_outside_the_limits(self):
+        self.client.force_login(self.user)
+        response = self.client.post("/api/events/", {
+            "title": "Spam", "event_date": "2026-09-01T10:00:00Z", "recurrence_rule": "FREQ=MINUTELY;COUNT=2000000",
+        }, content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+
+
+class EventFormTests(SimpleTestCase):
+    def form(self, **data):
+        return CalendarEventForm({
+            "title": "Standup", "event_date": "2026-09-01T09:00", "event_type": "personal", "color": "#3788d8", **data,
+        })
+
+    def test_presets_build_a_rule(self):
+        form = self.form(repeat="daily")
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.cleaned_data["recurrence_rule"], "FREQ=DAILY")
+
+        form = self.form(repeat="biweekly", repeat_until="2026-12-01")
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(
+            recurrence.rule_parts(form.cleaned_data["recurrence_rule"]),
+            {"FREQ": "WEEKLY", "INTERVAL": "2", "UNTIL": "20261201T235959Z"},
+        )
+
+    def test_repeat_until_before_start_is_rejected(self):
+        self.assertFalse(self.form(repeat="weekly", repeat_until="2026-08-01").is_valid())
@@ -0,0 +1,135 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core import mail
+from django.test import TestCase
+from django.utils import timezone
+
+from academic_app import reminders
+from academic_app.models import Assignment, Course, Exam, Reminder, UserPreferences
+from academic_app.reminders import ReminderWorker
+
+
+class FailingConnection:
+    def send_messages(self, messages):
+        raise OSError("SMTP is down")
+
+    def close(self):
+        pass
+
+
+class ReminderTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("ada", email="ada@example.com", password="pw")
+        self.course = Course.objects.create(user=self.user, name="Algorithms", code="CS201")
+        self.now = timezone.now()
+
+    def assignment(self, title="Essay", hours=2, **kwargs):
+        return Assignment.objects.create(
+            course=self.course, title=title, due_date=self.now + timedelta(hours=hours), **kwargs
+        )
+
+    def worker(self, connection=None):
+        return ReminderWorker(connection=connection or mail.get_connection())
+
+
+class SyncReminderTests(ReminderTestCase):
+    def test_rows_follow_their_items(self):
+        assignment = self.assignment(hours=48)
+        exam = Exam.objects.create(course=self.course, title="Final", exam_date=self.now + timedelta(days=5))
+        self.assertEqual(Reminder.objects.get(kind="assignment").fire_at, assignment.due_date - timedelta(hours=24))
+        self.assertEqual(Reminder.objects.get(kind="exam").fire_at, exam.exam_date - timedelta(hours=48))
+
+        assignment.completed = True
+        assignment.save()
+        exam.delete()
+        self.assertFalse(Reminder.objects.exists())
+
+    def test_unrelated_update_fields_skip_the_sync(self):
+        assignment = self.assignment(hours=48)
+        with mock.patch.object(reminders, "sync_reminder") as sync:
+            assignment.save(update_fields=["priority"])
+            sync.assert_not_called()
+            assignment.save(update_fields=["due_date"])
+            sync.assert_called_once()
+
+    def test_reminders_can_be_turned_off(self):
+        self.assignment(hours=48)
+        UserPreferences.objects.create(user=self.user, email_reminders=False)
+        self.assertFalse(Reminder.objects.exists())
+
+
+class ScheduleAllTests(ReminderTestCase):
+    def test_sent_reminders_stay_sent_unless_the_item_moved(self):
+        kept, moved = self.assignment("Kept", hours=48), self.assignment("Moved", hours=48)
+        Reminder.objects.update(sent_at=self.now)
+        Assignment.objects.filter(pk=moved.pk).update(due_date=self.now + timedelta(days=4))
+
+        self.assertEqual(reminders.schedule_all(), 2)
+        sent = dict(Reminder.objects.values_list("object_id", "sent_at"))
+        self.assertEqual(sent, {kept.pk: self.now, moved.pk: None})
+
+    def test_stale_rows_are_deleted_in_batches(self):
+        items = [self.assignment(f"A{n}", hours=48) for n in range(5)]
+        Assignment.objects.filter(pk__in=[item.pk for item in items[1:]]).update(completed=True)
+        with mock.patch.object(reminders, "DELETE_BATCH_SIZE", 2):
+            self.assertEqual(reminders.schedule_all(user_ids=[self.user.id]), 1)
+        self.assertEqual(list(Reminder.objects.values_list("object_id", flat=True)), [items[0].pk])
+
+
+class ReminderWorkerTests(ReminderTestCase):
+    def test_due_reminders_are_sent_once(self):
+        self.assignment("Essay", hours=2)
+        self.assignment("Later", hours=72)
+        worker = self.worker()
+        self.assertEqual(worker.tick(), 1)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn("Essay", mail.outbox[0].body)
+        self.assertEqual(worker.tick(), 0)
+        self.assertEqual(Reminder.objects.filter(sent_at__isnull=False).count(), 1)
+
+    def test_idle_tick_is_cheap(self):
+        self.assignment("Later", hours=72)
+        worker = self.worker()
+        worker.tick()
+        with self.assertNumQueries(1):
+            self.assertEqual(worker.tick(), 0)
+
+    def test_reminders_changed_elsewhere_are_picked_up(self):
+        worker = self.worker()
+        worker.tick()
+        self.assignment("New", hours=2)  # Its on_commit notification never runs here
+        self.assertEqual(worker.tick(self.now + timedelta(seconds=1)), 1)
+
+    def test_items_changed_behind_the_signals_are_dropped(self):
+        assignment = self.assignment(hours=2)
+        Assignment.objects.filter(pk=assignment.pk).update(completed=True)
+        self.assertEqual(self.worker().tick(), 0)
+        self.assertEqual(mail.outbox, [])
+        self.assertFalse(Reminder.objects.exists())
+
+    def test_reminders_are_claimed_before_sending(self):
+        self.assignment(hours=2)
+        claimed = []
+        connection = mail.get_connection()
+        send_messages = connection.send_messages
+
+        def send(messages):
+            claimed.append(Reminder.objects.get().sent_at)
+            return send_messages(messages)
+
+        with mock.patch.object(connection, "send_messages", side_effect=send):
+            self.assertEqual(self.worker(connection).tick(self.now), 1)
+        self.assertEqual(claimed, [self.now])
+
+    def test_failed_sends_are_released_and_retried(self):
+        self.assignment(hours=2)
+        worker = self.worker(FailingConnection())
+        with self.assertLogs("academic_app.reminders", "ERROR"):
+            self.assertEqual(worker.tick(), 0)
+        self.assertIsNone(Reminder.objects.get().sent_at)
+
+        worker.connection = mail.get_connection()
+        self.assertEqual(worker.tick(), 1)
+        self.assertEqual(len(mail.outbox), 1)
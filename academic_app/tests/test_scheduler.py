@@ -0,0 +1,97 @@
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+
+from academic_app import scheduler
+from academic_app.models import Assignment, ClassMeeting, Course, Exam, UserPreferences
+from academic_app.scheduler import StudyTask
+
+UTC = dt_timezone.utc
+MONDAY = datetime(2026, 10, 5, tzinfo=UTC)
+
+
+def at(day, hour, minute=0):
+    return MONDAY + timedelta(days=day, hours=hour, minutes=minute)
+
+
+def task(task_id, due, minutes, priority="medium"):
+    return StudyTask(task_id, f"Task {task_id}", "CS201", "#000", due, priority, minutes)
+
+
+class IntervalTests(SimpleTestCase):
+    def test_merge_intervals(self):
+        self.assertEqual(
+            scheduler.merge_intervals([(5, 7), (1, 3), (2, 4), (7, 8), (10, 11)]),
+            [(1, 4), (5, 8), (10, 11)],
+        )
+
+    def test_free_slots(self):
+        windows = [(0, 10), (20, 30)]
+        busy = [(2, 4), (8, 22), (25, 26)]
+        self.assertEqual(scheduler.free_slots(windows, busy), [(0, 2), (4, 8), (22, 25), (26, 30)])
+        self.assertEqual(scheduler.free_slots(windows, []), windows)
+
+
+class PlanTests(SimpleTestCase):
+    def windows(self, days):
+        return [(at(day, 9), at(day, 17)) for day in range(days)]
+
+    def test_earliest_deadline_goes_first(self):
+        plan = scheduler.plan_study_blocks(
+            [task(1, at(3, 0), 120), task(2, at(1, 0), 120)], [], self.windows(3), tz=UTC,
+        )
+        self.assertEqual([block.task_id for block in plan.blocks][:2], [2, 2])
+        self.assertEqual(plan.unscheduled, {})
+        for block in plan.blocks:
+            due = at(3, 0) if block.task_id == 1 else at(1, 0)
+            self.assertLessEqual(block.end, due)
+
+    def test_priority_breaks_ties(self):
+        plan = scheduler.plan_study_blocks(
+            [task(1, at(2, 0), 60, "low"), task(2, at(2, 0), 60, "urgent")], [], self.windows(2), tz=UTC,
+        )
+        self.assertEqual(plan.blocks[0].task_id, 2)
+
+    def test_blocks_avoid_busy_time_and_respect_limits(self):
+        busy = [(at(0, 10), at(0, 12))]
+        plan = scheduler.plan_study_blocks(
+            [task(1, at(5, 0), 600)], busy, self.windows(5), max_block_minutes=90, max_minutes_per_day=180, tz=UTC,
+        )
+        per_day = {}
+        for block in plan.blocks:
+            self.assertLessEqual(block.end - block.start, timedelta(minutes=90))
+            self.assertFalse(block.start < busy[0][1] and block.end > busy[0][0])
+            per_day[block.start.date()] = per_day.get(block.start.date(), 0) + (block.end - block.start).seconds // 60
+        self.assertTrue(all(minutes <= 180 for minutes in per_day.values()))
+        self.assertEqual(sum(per_day.values()), 600)
+
+    def test_work_that_cannot_fit_is_reported(self):
+        plan = scheduler.plan_study_blocks([task(1, at(0, 11), 300)], [], self.windows(1), tz=UTC)
+        self.assertEqual(sum((block.end - block.start).seconds // 60 for block in plan.blocks), 120)
+        self.assertEqual(plan.unscheduled, {1: 180})
+
+
+class BuildStudyPlanTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("ada", password="pw")
+        UserPreferences.objects.create(
+            user=self.user, study_start_time=time(9), study_end_time=time(12),
+            max_study_hours_per_day=3, study_block_minutes=60,
+        )
+        self.course = Course.objects.create(user=self.user, name="Algorithms", code="CS201")
+
+    def test_plans_around_exams_and_classes(self):
+        Assignment.objects.create(course=self.course, title="Essay", due_date=at(2, 0), estimated_hours=3)
+        Assignment.objects.create(course=self.course, title="Done", due_date=at(2, 0), estimated_hours=3, completed=True)
+        Exam.objects.create(course=self.course, title="Quiz", exam_date=at(0, 9), duration=60)
+        ClassMeeting.objects.create(course=self.course, weekday=0, start_time=time(11), end_time=time(12))
+
+        plan = scheduler.build_study_plan(self.user, now=at(0, 0))
+        self.assertEqual({block.title for block in plan.blocks}, {"Essay"})
+        monday = [block for block in plan.blocks if block.start.date() == MONDAY.date()]
+        self.assertEqual([(block.start, block.end) for block in monday], [(at(0, 10), at(0, 11))])
+        self.assertEqual(sum((block.end - block.start).seconds for block in plan.blocks), 3 * 3600)
+
+    def test_no_pending_work_means_an_empty_plan(self):
+        self.assertEqual(scheduler.build_study_plan(self.user, now=at(0, 0)).blocks, [])
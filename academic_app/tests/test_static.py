@@ -0,0 +1,46 @@
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+
+
+class CollectStaticTests(SimpleTestCase):
+    """collectstatic writes hashed, precompressed copies that WhiteNoise serves as immutable."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.root = Path(tempfile.mkdtemp())
+        cls.settings_override = override_settings(STATIC_ROOT=cls.root, WHITENOISE_USE_FINDERS=False)
+        cls.settings_override.enable()
+        call_command("collectstatic", interactive=False, verbosity=0)
+        cls.manifest = json.loads((cls.root / "staticfiles.json").read_text())["paths"]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.settings_override.disable()
+        shutil.rmtree(cls.root)
+        super().tearDownClass()
+
+    def test_writes_hashed_and_compressed_copies(self):
+        hashed = self.manifest["css/dashboard.css"]
+        self.assertRegex(hashed, r"^css/dashboard\.[0-9a-f]{12}\.css$")
+        for suffix in ("", ".gz", ".br"):
+            self.assertTrue((self.root / (hashed + suffix)).exists(), hashed + suffix)
+
+    def test_hashed_file_is_served_immutable_and_compressed(self):
+        response = self.client.get("/static/" + self.manifest["css/dashboard.css"], HTTP_ACCEPT_ENCODING="gzip, br")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("immutable", response["Cache-Control"])
+        self.assertIn("max-age=315360000", response["Cache-Control"])
+        self.assertEqual(response["Content-Encoding"], "br")
+        response.close()
+
+    def test_unhashed_name_is_not_immutable(self):
+        response = self.client.get("/static/css/dashboard.css")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("immutable", response.get("Cache-Control", ""))
+        response.close()
@@ -0,0 +1,56 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+
+from academic_app.models import Assignment, Course, Exam, Term
+from academic_app.stats import compute_dashboard_stats
+
+
+class DashboardStatsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("ada", password="pw")
+        self.client.force_login(self.user)
+        now = timezone.now()
+        course = Course.objects.create(user=self.user, name="Algorithms", code="CS201")
+        Course.objects.create(user=self.user, name="Compilers", code="CS415")
+        Assignment.objects.create(course=course, title="Lab 1", due_date=now + timedelta(days=1))
+        Assignment.objects.create(course=course, title="Lab 2", due_date=now - timedelta(days=1), completed=True)
+        Exam.objects.create(course=course, title="Midterm", exam_date=now + timedelta(days=3))
+        Exam.objects.create(course=course, title="Quiz", exam_date=now - timedelta(days=3))
+
+    def test_counts(self):
+        self.assertEqual(compute_dashboard_stats(self.user.id), {
+            "total_assignments": 2, "pending_assignments": 1, "upcoming_exams": 1, "total_courses": 2,
+        })
+
+    def test_counts_take_one_query(self):
+        with self.assertNumQueries(1):
+            compute_dashboard_stats(self.user.id)
+
+    def test_endpoint_is_cached_until_a_write(self):
+        with mock.patch("academic_app.stats.compute_dashboard_stats", wraps=compute_dashboard_stats) as compute:
+            for _ in range(2):
+                self.assertEqual(self.client.get("/api/stats/").json()["stats"]["total_courses"], 2)
+            self.assertEqual(compute.call_count, 1)
+
+            with self.captureOnCommitCallbacks(execute=True):
+                Course.objects.create(user=self.user, name="Databases", code="CS340")
+            self.assertEqual(self.client.get("/api/stats/").json()["stats"]["total_courses"], 3)
+            self.assertEqual(compute.call_count, 2)
+
+    def test_ended_terms_are_left_out(self):
+        today = timezone.localdate()
+        old = Term.objects.create(
+            user=self.user, name="Spring", start_date=today - timedelta(days=200), end_date=today - timedelta(days=90)
+        )
+        course = Course.objects.create(user=self.user, name="Old", code="CS100", term=old)
+        Assignment.objects.create(course=course, title="Old lab", due_date=timezone.now() + timedelta(days=1))
+        stats = compute_dashboard_stats(self.user.id)
+        self.assertEqual((stats["total_courses"], stats["total_assignments"]), (2, 2))
+
+    def test_other_users_are_not_counted(self):
+        other = User.objects.create_user("bob", password="pw")
+        self.assertEqual(compute_dashboard_stats(other.id)["total_courses"], 0)
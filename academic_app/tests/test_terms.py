@@ -0,0 +1,123 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from academic_app import terms
+from academic_app.caching import get_data_version
+from academic_app.models import Assignment, Attendance, Course, Exam, Reminder, Term, TermArchive
+
+
+class TermTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("ada", password="pw")
+        self.client.force_login(self.user)
+        today = timezone.localdate()
+        self.ended = Term.objects.create(
+            user=self.user, name="Spring", start_date=today - timedelta(days=200), end_date=today - timedelta(days=60),
+        )
+        self.current = Term.objects.create(
+            user=self.user, name="Fall", start_date=today - timedelta(days=30), end_date=today + timedelta(days=60),
+        )
+        self.old = Course.objects.create(user=self.user, name="History", code="HIST110", term=self.ended)
+        self.live = Course.objects.create(user=self.user, name="Algorithms", code="CS201", term=self.current)
+        self.loose = Course.objects.create(user=self.user, name="Choir", code="MUS100")
+
+
+class ActiveTermTests(TermTestCase):
+    def test_active_term_covers_today(self):
+        self.assertEqual(terms.active_term(self.user), self.current)
+        self.assertEqual(terms.active_term(self.user, today=self.ended.end_date), self.ended)
+        self.assertIsNone(terms.active_term(self.user, today=self.current.end_date + timedelta(days=1)))
+
+    def test_new_courses_join_the_active_term(self):
+        response = self.client.post("/api/courses/", {"name": "Compilers", "code": "CS415"}, content_type="application/json")
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(Course.objects.get(code="CS415").term, self.current)
+
+    def test_codes_are_unique_within_a_term(self):
+        # Retaking a course in a later term is fine; two copies in one term are not.
+        response = self.client.post("/api/courses/", {"name": "History", "code": "HIST110"}, content_type="application/json")
+        self.assertEqual(response.status_code, 201, response.content)
+        for code in ("HIST110", "CS201"):
+            with self.subTest(code=code):
+                response = self.client.post("/api/courses/", {"name": "Again", "code": code}, content_type="application/json")
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("code", response.json())
+
+    def test_term_names_are_unique_per_user(self):
+        response = self.client.post("/api/terms/", {
+            "name": "Fall", "start_date": "2027-09-01", "end_date": "2027-12-20",
+        }, content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("name", response.json())
+
+
+class TermScopingTests(TermTestCase):
+    def codes(self, url, params=None):
+        response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, 200, response.content)
+        return sorted(row["code"] for row in response.json()["results"])
+
+    def test_lists_default_to_the_current_term(self):
+        self.assertEqual(Course.objects.current().count(), 2)
+        self.assertEqual(self.codes("/api/courses/"), ["CS201", "MUS100"])
+        self.assertEqual(self.codes("/api/courses/", {"term": "all"}), ["CS201", "HIST110", "MUS100"])
+        self.assertEqual(self.codes("/api/courses/", {"term": self.ended.pk}), ["HIST110"])
+        self.assertEqual(self.client.get("/api/courses/", {"term": "spring"}).status_code, 400)
+
+    def test_items_follow_their_course(self):
+        Assignment.objects.create(course=self.old, title="Old essay", due_date=timezone.now())
+        Assignment.objects.create(course=self.live, title="Lab", due_date=timezone.now())
+        response = self.client.get("/api/assignments/")
+        self.assertEqual([row["title"] for row in response.json()["results"]], ["Lab"])
+
+
+class ArchiveTests(TermTestCase):
+    def setUp(self):
+        super().setUp()
+        Assignment.objects.create(course=self.old, title="Essay", due_date=timezone.now() + timedelta(days=3))
+        Exam.objects.create(course=self.old, title="Final", exam_date=timezone.now() - timedelta(days=70))
+        Attendance.objects.create(course=self.old, date=self.ended.start_date, present=True)
+
+    def test_archive_moves_rows_out_and_back_in_on_demand(self):
+        self.assertEqual(list(terms.closed_terms(after_days=30)), [self.ended])
+        self.assertEqual(Reminder.objects.count(), 1)
+        archive = terms.archive_term(self.ended)
+        self.assertEqual(archive.counts, {
+            "courses": 1, "grade_categories": 0, "meetings": 0, "assignments": 1, "exams": 1, "attendance": 1,
+        })
+        self.assertFalse(Course.objects.filter(term=self.ended).exists())
+        self.assertEqual((Assignment.objects.count(), Reminder.objects.count()), (0, 0))
+        self.assertIsNone(terms.archive_term(self.ended))
+        self.assertEqual(list(terms.closed_terms(after_days=30)), [])
+
+        snapshot = terms.load_archive(self.ended)
+        self.assertEqual(snapshot["courses"][0]["code"], "HIST110")
+        self.assertEqual(snapshot["assignments"][0]["title"], "Essay")
+        self.assertEqual(self.client.get(f"/api/terms/{self.ended.pk}/archive/").json()["term"]["name"], "Spring")
+        self.assertEqual(self.client.get(f"/api/terms/{self.current.pk}/archive/").status_code, 404)
+
+    def test_archiving_bumps_the_data_version_once(self):
+        before = get_data_version(self.user.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            terms.archive_term(self.ended)
+        self.assertEqual(get_data_version(self.user.id), before + 1)
+
+    def test_term_writes_bump_the_data_version(self):
+        before = get_data_version(self.user.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            Term.objects.filter(pk=self.current.pk).get().save()
+        self.assertNotEqual(get_data_version(self.user.id), before)
+
+    def test_command(self):
+        out = StringIO()
+        call_command("archive_terms", "--dry-run", stdout=out)
+        self.assertIn("Would archive ada: Spring", out.getvalue())
+        self.assertFalse(TermArchive.objects.exists())
+        call_command("archive_terms", stdout=out)
+        self.assertIn("Archived 1 term(s)", out.getvalue())
+        self.assertIsNotNone(Term.objects.get(pk=self.ended.pk).archived_at)
@@ -0,0 +1,35 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from academic_app import warmup
+
+
+class WarmupTests(TestCase):
+    def test_hooks_from_every_app_are_registered_in_order(self):
+        self.assertEqual(warmup.registered(), ["database", "urls", "templates", "caches", "gemini_sdk"])
+
+    def test_project_templates_are_found(self):
+        names = warmup.project_templates()
+        self.assertIn("index.html", names)
+        self.assertIn("chat_ui.html", names)
+        self.assertFalse(any(name.startswith("admin/") for name in names))
+
+    def test_every_template_compiles(self):
+        with self.assertNoLogs("academic_app.warmup", "WARNING"):
+            self.assertEqual([name for name, _ in warmup.run(["templates"])], ["templates"])
+
+    def test_failures_and_unknown_hooks_never_stop_the_worker(self):
+        with mock.patch.dict(warmup._hooks, {"broken": mock.Mock(side_effect=RuntimeError)}):
+            with self.assertLogs("academic_app.warmup", "WARNING") as logs:
+                timings = warmup.run(["broken", "missing", "caches"])
+        self.assertEqual([name for name, _ in timings], ["broken", "caches"])
+        self.assertEqual(len([line for line in logs.output if "broken" in line or "missing" in line]), 2)
+
+    @override_settings(WARMUP_HOOKS=["database", "urls"])
+    def test_command_runs_the_configured_hooks(self):
+        out = StringIO()
+        call_command("warmup", stdout=out)
+        self.assertEqual([line.split()[0] for line in out.getvalue().splitlines()], ["database", "urls"])
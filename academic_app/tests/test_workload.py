@@ -0,0 +1,71 @@
+import json
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from academic_app import workload
+from academic_app.models import Assignment, Course, Exam, UserPreferences
+
+NEW_YORK = ZoneInfo("America/New_York")
+MONDAY = date(2026, 10, 5)
+
+
+def local(day, hour, minute=0):
+    return datetime(2026, 10, day, hour, minute, tzinfo=NEW_YORK)
+
+
+class LoadLevelTests(SimpleTestCase):
+    def test_levels(self):
+        self.assertEqual([workload.load_level(hours, 20) for hours in (0, 5, 12, 17, 20, 21)], [0, 1, 2, 3, 3, 4])
+
+    def test_week_start(self):
+        self.assertEqual(workload.week_start(date(2026, 10, 11)), MONDAY)
+        self.assertEqual(workload.week_start(MONDAY), MONDAY)
+
+
+class ComputeWorkloadTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("ada", password="pw")
+        self.course = Course.objects.create(user=self.user, name="Algorithms", code="CS201")
+
+    def test_buckets_by_local_iso_week(self):
+        Assignment.objects.create(course=self.course, title="Sunday night", due_date=local(11, 23, 30), estimated_hours=3)
+        Assignment.objects.create(course=self.course, title="Monday", due_date=local(12, 0, 30), estimated_hours=5)
+        Assignment.objects.create(
+            course=self.course, title="Done", due_date=local(12, 9), estimated_hours=50, completed=True,
+        )
+        Exam.objects.create(course=self.course, title="Final", exam_type="final", exam_date=local(14, 9))
+        Exam.objects.create(course=self.course, title="Quiz", exam_type="quiz", exam_date=local(15, 9))
+
+        with timezone.override(NEW_YORK):
+            weeks = workload.compute_workload(self.user, MONDAY, 3, threshold=12)
+
+        self.assertEqual([week["week"] for week in weeks], ["2026-W41", "2026-W42", "2026-W43"])
+        first, second, third = weeks
+        self.assertEqual((first["assignment_hours"], first["assignments"], first["total_hours"]), (3, 1, 3))
+        self.assertEqual((second["assignment_hours"], second["exam_hours"], second["exams"]), (5, 12, 2))
+        self.assertTrue(second["overloaded"])
+        self.assertEqual((third["total_hours"], third["level"], third["overloaded"]), (0, 0, False))
+
+
+class WorkloadEndpointTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("ada", password="pw")
+        self.client.force_login(self.user)
+
+    def test_threshold_update_and_validation(self):
+        response = self.client.post("/api/workload/", json.dumps({"threshold": 25}), content_type="application/json")
+        self.assertEqual(response.json()["threshold"], 25)
+        self.assertEqual(UserPreferences.objects.get(user=self.user).weekly_workload_hours, 25)
+        for body in ({"threshold": 0}, {"threshold": "many"}, {}):
+            with self.subTest(body=body):
+                response = self.client.post("/api/workload/", json.dumps(body), content_type="application/json")
+                self.assertEqual(response.status_code, 400)
+
+    def test_weeks_are_clamped(self):
+        response = self.client.get("/api/workload/", {"start": "2026-10-05", "weeks": 500})
+        self.assertEqual(len(response.json()["weeks"]), workload.MAX_WEEKS)
+        self.assertEqual(self.client.get("/api/workload/", {"weeks": "x"}).status_code, 400)
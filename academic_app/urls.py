@@ -1,5 +1,5 @@
-from django.urls import path
-from . import views
+from django.urls import include, path
+from . import api, views
 from django.contrib.auth import views as auth_views
 
 urlpatterns = [
@@ -14,6 +14,17 @@ urlpatterns = [
     path("assignment/<int:assignment_id>/edit/", views.edit_assignment, name="edit_assignment"),
     path("assignment/<int:assignment_id>/delete/", views.delete_assignment, name="delete_assignment"),
     path("assignment/<int:assignment_id>/toggle/", views.toggle_assignment_completion, name="toggle_assignment"),
+    path("bulk/", views.bulk_update_items, name="bulk_update_items"),
+    path("attendance/grid/", views.attendance_grid, name="attendance_grid"),
+    path("conflicts/", views.schedule_conflicts, name="schedule_conflicts"),
+    path("jobs/<int:job_id>/", views.job_status, name="job_status"),
     path("calendar-data/", views.calendar_data, name="calendar_data"),
     path("debug-forms/", views.debug_forms, name="debug_forms"),
+
+    # REST API (see academic_app/api.py)
+    path("api/stats/", views.dashboard_stats, name="dashboard_stats"),
+    path("api/workload/", views.workload_forecast, name="workload_forecast"),
+    path("api/grades/", views.grade_summaries, name="grade_summaries"),
+    path("api/grades/<int:course_id>/", views.grade_projection, name="grade_projection"),
+    path("api/", include(api.router.urls)),
 ]
\ No newline at end of file
@@ -6,9 +6,16 @@ from django.contrib.auth import login
 from django.http import JsonResponse
 from django.views.decorators.http import require_POST
 from django.utils import timezone
-from django.db.models import Q
-from .models import Course, Assignment, Exam, Attendance, CalendarEvent
-from .forms import CourseForm, AssignmentForm, ExamForm, AttendanceForm, CalendarEventForm, AssignmentEditForm
+from django.utils.dateparse import parse_date, parse_datetime
+from django.db import transaction
+from django.db.models import Count, Q
+from .models import Course, Assignment, Exam, Attendance, CalendarEvent, Job, UserPreferences, in_current_term
+from .forms import CourseForm, AssignmentForm, ExamForm, AttendanceForm, CalendarEventForm, AssignmentEditForm, CourseCatalogue
+from .caching import FRAGMENT_CACHE_TIMEOUT, deferred_invalidation, get_data_version
+from .stats import get_dashboard_stats
+from . import attendance, conflicts, grades, reminders, terms, workload
+from .scheduler import get_study_plan
+from datetime import datetime, timedelta
 import json
 
 
@@ -29,13 +36,12 @@ def signup(request):
 
 @login_required
 def dashboard(request):
-    user_courses = Course.objects.filter(user=request.user)
-    
-    # Initialize all forms here, so they are always defined for both GET and POST requests
-    course_form = CourseForm(user=request.user)
-    assignment_form = AssignmentForm(user=request.user)
-    exam_form = ExamForm(user=request.user)
-    event_form = CalendarEventForm(user=request.user)
+    # One course query per request, shared by every form and the template.
+    user_courses = CourseCatalogue(request.user)
+
+    # Forms that failed validation are re-assigned below; the rest are built
+    # unbound after POST handling, so AJAX posts never construct them.
+    course_form = assignment_form = exam_form = event_form = None
 
     # Handle form submissions
     if request.method == "POST":
@@ -47,10 +53,11 @@ def dashboard(request):
         # Use a hidden field in the form to determine which form was submitted.
         # This is a robust way to handle multiple forms on one page.
         if "course-submit" in request.POST:
-            form = CourseForm(request.POST, user=request.user)
+            form = CourseForm(request.POST, user=request.user, courses=user_courses)
             if form.is_valid():
                 course = form.save(commit=False)
                 course.user = request.user
+                course.term = terms.active_term(request.user)
                 course.save()
                 messages.success(request, f"Course '{course.name}' added successfully!")
                 
@@ -79,8 +86,8 @@ def dashboard(request):
         elif "assignment-submit" in request.POST:
             print("Processing assignment submission...")
             print(f"Course ID from POST: {request.POST.get('course')}")
-            print(f"User courses: {list(Course.objects.filter(user=request.user).values_list('id', 'name'))}")
-            form = AssignmentForm(request.POST, user=request.user)
+            print(f"User courses: {[(course.id, course.name) for course in user_courses]}")
+            form = AssignmentForm(request.POST, user=request.user, courses=user_courses)
             print(f"Form is valid: {form.is_valid()}")
             if not form.is_valid():
                 print(f"Form errors: {form.errors}")
@@ -92,12 +99,16 @@ def dashboard(request):
                 assignment.save()
                 print(f"Assignment saved: {assignment.title}")
                 messages.success(request, f"Assignment '{assignment.title}' added successfully!")
+                found = conflicts.conflicts_for(assignment)
+                if found:
+                    messages.warning(request, conflicts.describe(found))
                 
                 # Handle AJAX requests
                 if is_ajax:
                     return JsonResponse({
                         'success': True,
-                        'message': f"Assignment '{assignment.title}' added successfully!"
+                        'message': f"Assignment '{assignment.title}' added successfully!",
+                        'conflicts': [conflict.as_dict() for conflict in found]
                     })
                 
                 return redirect("dashboard")
@@ -116,16 +127,20 @@ def dashboard(request):
                 assignment_form = form # Re-assign the form with errors
 
         elif "exam-submit" in request.POST:
-            form = ExamForm(request.POST, user=request.user)
+            form = ExamForm(request.POST, user=request.user, courses=user_courses)
             if form.is_valid():
                 exam = form.save()
                 messages.success(request, f"Exam '{exam.title}' added successfully!")
+                found = conflicts.conflicts_for(exam)
+                if found:
+                    messages.warning(request, conflicts.describe(found))
                 
                 # Handle AJAX requests
                 if is_ajax:
                     return JsonResponse({
                         'success': True,
-                        'message': f"Exam '{exam.title}' added successfully!"
+                        'message': f"Exam '{exam.title}' added successfully!",
+                        'conflicts': [conflict.as_dict() for conflict in found]
                     })
                 
                 return redirect("dashboard")
@@ -144,18 +159,22 @@ def dashboard(request):
                 exam_form = form # Re-assign the form with errors
 
         elif "event-submit" in request.POST:
-            form = CalendarEventForm(request.POST, user=request.user)
+            form = CalendarEventForm(request.POST, user=request.user, courses=user_courses)
             if form.is_valid():
                 event = form.save(commit=False)
                 event.user = request.user
                 event.save()
                 messages.success(request, f"Event '{event.title}' added successfully!")
+                found = conflicts.conflicts_for(event)
+                if found:
+                    messages.warning(request, conflicts.describe(found))
                 
                 # Handle AJAX requests
                 if is_ajax:
                     return JsonResponse({
                         'success': True,
-                        'message': f"Event '{event.title}' added successfully!"
+                        'message': f"Event '{event.title}' added successfully!",
+                        'conflicts': [conflict.as_dict() for conflict in found]
                     })
                 
                 return redirect("dashboard")
@@ -180,28 +199,52 @@ def dashboard(request):
                 'message': 'An unexpected error occurred. Please try again.'
             })
 
-    # Get all necessary data for the dashboard view
+    if course_form is None:
+        course_form = CourseForm(user=request.user, courses=user_courses)
+    if assignment_form is None:
+        assignment_form = AssignmentForm(user=request.user, courses=user_courses)
+    if exam_form is None:
+        exam_form = ExamForm(user=request.user, courses=user_courses)
+    if event_form is None:
+        event_form = CalendarEventForm(user=request.user, courses=user_courses)
+
+    # Get all necessary data for the dashboard view, for the current term
+    current_term = in_current_term("course__")
     upcoming_assignments = Assignment.objects.filter(
+        current_term,
         course__user=request.user,
         due_date__gte=timezone.now(),
         completed=False
-    ).order_by("due_date")
+    ).select_related("course").order_by("due_date")
 
     overdue_assignments = Assignment.objects.filter(
+        current_term,
         course__user=request.user,
         due_date__lt=timezone.now(),
         completed=False
-    ).order_by("due_date")
+    ).select_related("course").order_by("due_date")
 
     upcoming_exams = Exam.objects.filter(
+        current_term,
         course__user=request.user,
         exam_date__gte=timezone.now()
-    ).order_by("exam_date")
-
-    upcoming_events = CalendarEvent.objects.filter(
+    ).select_related("course").order_by("exam_date")
+
+    # Evaluated once here: the template renders both a sliced and a full list.
+    # Recurring events are listed at their next occurrence.
+    now = timezone.now()
+    upcoming_events = []
+    for event in CalendarEvent.objects.filter(
+        Q(recurrence_rule="", event_date__gte=now)
+        | (~Q(recurrence_rule="") & (Q(recurrence_end__isnull=True) | Q(recurrence_end__gte=now))),
         user=request.user,
-        event_date__gte=timezone.now()
-    ).order_by("event_date")
+    ).order_by("event_date"):
+        if event.is_recurring:
+            event.event_date = event.next_occurrence(now)
+            if event.event_date is None:
+                continue
+        upcoming_events.append(event)
+    upcoming_events.sort(key=lambda event: event.event_date)
 
     context = {
         "courses": user_courses,
@@ -209,10 +252,16 @@ def dashboard(request):
         "overdue_assignments": overdue_assignments,
         "upcoming_exams": upcoming_exams,
         "upcoming_events": upcoming_events,
+        "workload": workload.get_workload(request.user),
+        "grade_summaries": grades.get_grade_summaries(request.user),
         "course_form": course_form,
         "assignment_form": assignment_form,
         "exam_form": exam_form,
         "event_form": event_form,
+        # Stable fragments (course list, unbound form markup) are cached per user
+        # and keyed on this version, which any write to the user's data bumps.
+        "data_version": get_data_version(request.user.id),
+        "fragment_cache_timeout": FRAGMENT_CACHE_TIMEOUT,
     }
 
     return render(request, "index.html", context)
@@ -254,9 +303,15 @@ def delete_assignment(request, assignment_id):
 @login_required
 @require_POST
 def toggle_assignment_completion(request, assignment_id):
-    assignment = get_object_or_404(Assignment, id=assignment_id, course__user=request.user)
-    assignment.completed = not assignment.completed
-    assignment.save()
+    # Lock the row so concurrent toggles serialise, and write only the flag.
+    with transaction.atomic():
+        assignment = get_object_or_404(
+            Assignment.objects.select_for_update(of=("self",)).select_related("course"),
+            id=assignment_id,
+            course__user=request.user,
+        )
+        assignment.completed = not assignment.completed
+        assignment.save(update_fields=["completed", "updated_at"])
 
     status = "completed" if assignment.completed else "marked as incomplete"
     return JsonResponse({
@@ -266,6 +321,82 @@ def toggle_assignment_completion(request, assignment_id):
     })
 
 
+# Item types the bulk endpoint can act on, and the actions each one supports.
+BULK_ACTIONS = {
+    "assignment": {"complete", "incomplete", "delete", "priority", "reassign"},
+    "exam": {"delete", "reassign"},
+    "event": {"delete"},
+}
+
+
+def _bulk_queryset(item_type, user):
+    if item_type == "assignment":
+        return Assignment.objects.filter(course__user=user)
+    if item_type == "exam":
+        return Exam.objects.filter(course__user=user)
+    return CalendarEvent.objects.filter(user=user)
+
+
+@login_required
+@require_POST
+def bulk_update_items(request):
+    """
+    Applies one action to many assignments, exams or events at once.
+
+    Expects a JSON body like
+    ``{"type": "assignment", "action": "priority", "ids": [1, 2], "priority": "high"}``.
+    Every action is a single set-based UPDATE or DELETE scoped to the user's
+    rows, run in one transaction.
+    """
+    try:
+        data = json.loads(request.body)
+        item_type = data["type"]
+        action = data["action"]
+        ids = [int(pk) for pk in data["ids"]]
+    except (ValueError, KeyError, TypeError):
+        return JsonResponse({"success": False, "message": "Expected JSON with type, action and ids."}, status=400)
+
+    if action not in BULK_ACTIONS.get(item_type, ()):
+        return JsonResponse({"success": False, "message": f"Unsupported action '{action}' for {item_type}s."}, status=400)
+
+    changes = {}
+    if action in ("complete", "incomplete"):
+        changes = {"completed": action == "complete"}
+    elif action == "priority":
+        priority = data.get("priority")
+        if priority not in dict(Assignment.PRIORITY_CHOICES):
+            return JsonResponse({"success": False, "message": "Invalid priority."}, status=400)
+        changes = {"priority": priority}
+    elif action == "reassign":
+        try:
+            course_id = int(data.get("course"))
+        except (TypeError, ValueError):
+            return JsonResponse({"success": False, "message": "Expected a course id."}, status=400)
+        course = Course.objects.filter(in_current_term(), user=request.user, id=course_id).first()
+        if course is None:
+            return JsonResponse({"success": False, "message": "Course not found."}, status=400)
+        changes = {"course": course}
+
+    items = _bulk_queryset(item_type, request.user).filter(id__in=ids)
+    with transaction.atomic(), deferred_invalidation(request.user.id):
+        if action == "delete":
+            count = items.delete()[1].get(items.model._meta.label, 0)
+        else:
+            # update() bypasses save(), so auto_now has to be set by hand.
+            count = items.update(updated_at=timezone.now(), **changes)
+            # ...and post_save, so reminders are resynced here: completion
+            # and the course decide whether and how an item is reminded.
+            if count and reminders.REMINDER_FIELDS & set(changes):
+                reminders.schedule_all(user_ids=[request.user.id])
+
+    verb = "deleted" if action == "delete" else "updated"
+    return JsonResponse({
+        "success": True,
+        "message": f"{count} {item_type}(s) {verb}",
+        "count": count,
+    })
+
+
 @login_required
 def course_detail(request, course_id):
     course = get_object_or_404(Course, id=course_id, user=request.user)
@@ -274,9 +405,13 @@ def course_detail(request, course_id):
     exams = course.exams.all().order_by("exam_date")
     attendance_records = course.attendance_records.all().order_by("-date")
 
-    # Calculate attendance percentage
-    total_classes = attendance_records.count()
-    present_classes = attendance_records.filter(present=True).count()
+    # Calculate attendance percentage (both counts in one aggregate query)
+    counts = course.attendance_records.aggregate(
+        total=Count("id"),
+        present=Count("id", filter=Q(present=True)),
+    )
+    total_classes = counts["total"]
+    present_classes = counts["present"]
     attendance_percentage = (present_classes / total_classes * 100) if total_classes > 0 else 0
 
     context = {
@@ -292,13 +427,55 @@ def course_detail(request, course_id):
     return render(request, "academic_app/course_detail.html", context)
 
 
+# Recurring events are expanded over this horizon when the client sends no window.
+DEFAULT_RECURRENCE_WINDOW = (timedelta(days=31), timedelta(days=366))
+
+
+def _parse_window_bound(value):
+    """Parses a FullCalendar start/end parameter (date or datetime) into an aware datetime."""
+    if not value:
+        return None
+    parsed = parse_datetime(value)
+    if parsed is None:
+        day = parse_date(value[:10])
+        if day is None:
+            return None
+        parsed = datetime.combine(day, datetime.min.time())
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
 @login_required
 def calendar_data(request):
-    """API endpoint to provide calendar data for FullCalendar"""
-    user_assignments = Assignment.objects.filter(course__user=request.user)
-    user_exams = Exam.objects.filter(course__user=request.user)
+    """
+    API endpoint to provide calendar data for FullCalendar.
+
+    FullCalendar passes the visible range as ``start``/``end``; only items in
+    that window are loaded, and recurring events are expanded just for it.
+    """
+    window_start = _parse_window_bound(request.GET.get("start"))
+    window_end = _parse_window_bound(request.GET.get("end"))
+    windowed = window_start is not None and window_end is not None
+
+    current_term = in_current_term("course__")
+    user_assignments = Assignment.objects.filter(current_term, course__user=request.user).select_related("course")
+    user_exams = Exam.objects.filter(current_term, course__user=request.user).select_related("course")
     user_events = CalendarEvent.objects.filter(user=request.user)
 
+    if windowed:
+        user_assignments = user_assignments.filter(due_date__range=(window_start, window_end))
+        user_exams = user_exams.filter(exam_date__range=(window_start, window_end))
+        user_events = user_events.filter(
+            Q(recurrence_rule="", event_date__range=(window_start, window_end))
+            | (~Q(recurrence_rule="") & Q(event_date__lte=window_end)
+               & (Q(recurrence_end__isnull=True) | Q(recurrence_end__gte=window_start)))
+        )
+    else:
+        now = timezone.now()
+        window_start = now - DEFAULT_RECURRENCE_WINDOW[0]
+        window_end = now + DEFAULT_RECURRENCE_WINDOW[1]
+
     events = []
 
     # Add assignments
@@ -332,22 +509,253 @@ def calendar_data(request):
 
     # Add events
     for event in user_events:
-        events.append({
-            "id": f"event-{event.id}",
-            "title": f"🎉 {event.title}",
-            "start": event.event_date.isoformat(),
-            "end": event.end_date.isoformat() if event.end_date else None,
-            "color": event.color,
-            "extendedProps": {
-                "type": "event",
-                "event_type": event.event_type,
-                "location": event.location
-            }
-        })
+        if not event.is_recurring:
+            events.append({
+                "id": f"event-{event.id}",
+                "title": f"🎉 {event.title}",
+                "start": event.event_date.isoformat(),
+                "end": event.end_date.isoformat() if event.end_date else None,
+                "color": event.color,
+                "extendedProps": {
+                    "type": "event",
+                    "event_type": event.event_type,
+                    "location": event.location
+                }
+            })
+            continue
+
+        for occurrence_start, occurrence_end in event.occurrences(window_start, window_end):
+            events.append({
+                "id": f"event-{event.id}-{occurrence_start.strftime('%Y%m%dT%H%M%S')}",
+                "groupId": f"event-{event.id}",
+                "title": f"🎉 {event.title}",
+                "start": occurrence_start.isoformat(),
+                "end": occurrence_end.isoformat() if occurrence_end else None,
+                "color": event.color,
+                "extendedProps": {
+                    "type": "event",
+                    "event_type": event.event_type,
+                    "location": event.location,
+                    "recurring": True,
+                    "event_id": event.id
+                }
+            })
+
+    # Add planned study blocks (only for an explicit window; the plan is cached)
+    if windowed:
+        for block in get_study_plan(request.user).blocks_between(window_start, window_end):
+            events.append({
+                "id": f"study-{block.task_id}-{block.start.strftime('%Y%m%dT%H%M')}",
+                "title": f"📚 Study: {block.title}",
+                "start": block.start.isoformat(),
+                "end": block.end.isoformat(),
+                "color": block.color,
+                "extendedProps": {
+                    "type": "study",
+                    "course": block.course,
+                    "assignment_id": block.task_id
+                }
+            })
 
     return JsonResponse(events, safe=False)
 
 
+def _parse_flag(value, default):
+    """A JSON boolean, or ``default`` when absent; anything else (e.g. the string "false") is a ValueError."""
+    if value is None:
+        return default
+    if not isinstance(value, bool):
+        raise ValueError(f"Expected true or false, got {value!r}")
+    return value
+
+
+@login_required
+def attendance_grid(request):
+    """
+    GET: scheduled class dates and recorded attendance for a date range
+    (``?start=&end=``, default this week) and optional ``?course=`` ids.
+
+    POST: marks attendance for that whole range in one transaction, e.g.
+    ``{"start": "2026-09-01", "end": "2026-12-15", "courses": [3, 4],
+    "present": true, "overrides": [{"course": 3, "date": "2026-10-06", "present": false}]}``.
+    """
+    if request.method == "POST":
+        try:
+            data = json.loads(request.body)
+        except ValueError:
+            return JsonResponse({"success": False, "message": "Invalid JSON."}, status=400)
+        if not isinstance(data, dict):
+            return JsonResponse({"success": False, "message": "Expected a JSON object."}, status=400)
+        params = data
+        course_ids = data.get("courses")
+        if course_ids is not None and not isinstance(course_ids, list):
+            return JsonResponse({"success": False, "message": "courses must be a list of ids."}, status=400)
+    else:
+        params = request.GET
+        course_ids = request.GET.getlist("course") or None
+
+    default_start, default_end = attendance.current_week(timezone.localdate())
+    try:
+        start = parse_date(str(params.get("start") or "")) or default_start
+        end = parse_date(str(params.get("end") or "")) or default_end
+        if course_ids is not None:
+            course_ids = [int(pk) for pk in course_ids]
+    except (ValueError, TypeError):
+        return JsonResponse({"success": False, "message": "Invalid dates or course ids."}, status=400)
+    if end < start or (end - start).days > attendance.MAX_GRID_DAYS:
+        return JsonResponse({
+            "success": False,
+            "message": f"The date range must be between 0 and {attendance.MAX_GRID_DAYS} days.",
+        }, status=400)
+
+    if request.method == "POST":
+        try:
+            present = _parse_flag(data.get("present"), True)
+        except ValueError:
+            return JsonResponse({"success": False, "message": "present must be true or false."}, status=400)
+        raw_overrides = data.get("overrides") or []
+        if not isinstance(raw_overrides, list) or not all(isinstance(item, dict) for item in raw_overrides):
+            return JsonResponse({"success": False, "message": "overrides must be a list of objects."}, status=400)
+        try:
+            overrides = [
+                (int(item["course"]), parse_date(str(item["date"])), _parse_flag(item.get("present"), True))
+                for item in raw_overrides
+            ]
+        except (KeyError, ValueError, TypeError):
+            return JsonResponse({"success": False, "message": "Invalid overrides."}, status=400)
+        if any(day is None for _, day, _ in overrides):
+            return JsonResponse({"success": False, "message": "Invalid override date."}, status=400)
+        count = attendance.mark_attendance(
+            request.user, start, end,
+            present=present,
+            course_ids=course_ids,
+            overrides=overrides,
+        )
+        return JsonResponse({
+            "success": True,
+            "message": f"Attendance recorded for {count} class(es)",
+            "count": count,
+        })
+
+    return JsonResponse({
+        "success": True,
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "grid": attendance.attendance_grid(request.user, start, end, course_ids),
+    })
+
+
+@login_required
+def schedule_conflicts(request):
+    """Every overlapping pair of exams, events and deadlines in ``?start=&end=`` (default: next 120 days)"""
+    start = _parse_window_bound(request.GET.get("start")) or timezone.now()
+    end = _parse_window_bound(request.GET.get("end")) or start + timedelta(days=120)
+    if end <= start:
+        return JsonResponse({"success": False, "message": "end must be after start."}, status=400)
+
+    pairs = conflicts.sweep_conflicts(conflicts.user_intervals(request.user, start, end))
+    return JsonResponse({
+        "success": True,
+        "conflicts": [[first.as_dict(), second.as_dict()] for first, second in pairs],
+    })
+
+
+@login_required
+def dashboard_stats(request):
+    """API endpoint for the dashboard stat cards (polled by dashboard.js)"""
+    return JsonResponse({
+        "success": True,
+        "stats": get_dashboard_stats(request.user.id),
+    })
+
+
+@login_required
+def workload_forecast(request):
+    """
+    Hours of pending work per ISO week (``?start=&weeks=``). POST
+    ``{"threshold": 25}`` to change the weekly overload threshold.
+    """
+    if request.method == "POST":
+        try:
+            threshold = int(json.loads(request.body)["threshold"])
+        except (ValueError, KeyError, TypeError):
+            return JsonResponse({"success": False, "message": "Expected JSON with a threshold."}, status=400)
+        if not 1 <= threshold <= 168:
+            return JsonResponse({"success": False, "message": "The threshold must be between 1 and 168 hours."}, status=400)
+        preferences = UserPreferences.for_user(request.user)
+        preferences.weekly_workload_hours = threshold
+        preferences.save()
+
+    try:
+        start = parse_date(request.GET.get("start") or "")
+        weeks = int(request.GET.get("weeks") or workload.DEFAULT_WEEKS)
+    except ValueError:
+        return JsonResponse({"success": False, "message": "Invalid start or weeks."}, status=400)
+
+    return JsonResponse({
+        "success": True,
+        **workload.get_workload(request.user, start, weeks),
+    })
+
+
+@login_required
+def grade_summaries(request):
+    """Current grade and projections for each of the user's courses"""
+    return JsonResponse({
+        "success": True,
+        "courses": grades.get_grade_summaries(request.user),
+    })
+
+
+@login_required
+def grade_projection(request, course_id):
+    """
+    What-if projection for one course. ``?target=A`` (or a percentage) adds
+    the scores needed for that grade and ``?assume=`` sets the score assumed
+    for the other remaining items; POST ``{"scores": {"exam:3": 72}}`` to
+    try hypothetical percentages for specific items.
+    """
+    course = get_object_or_404(Course, id=course_id, user=request.user)
+    try:
+        overrides = {}
+        if request.method == "POST":
+            data = json.loads(request.body or "{}")
+            overrides = {str(key): float(value) for key, value in data.get("scores", {}).items()}
+        assume = request.GET.get("assume")
+        assume = float(assume) if assume else None
+        target = request.GET.get("target") or None
+        projection = grades.course_projection(course, overrides=overrides, assume=assume, target=target)
+    except (ValueError, TypeError, AttributeError):
+        return JsonResponse({"success": False, "message": "Invalid scores, target or assume value."}, status=400)
+
+    return JsonResponse({
+        "success": True,
+        "course": course.name,
+        **projection,
+    })
+
+
+@login_required
+def job_status(request, job_id):
+    """Status (and, once finished, result) of one of the user's background jobs"""
+    job = get_object_or_404(Job, id=job_id, user=request.user)
+    return JsonResponse({
+        "success": True,
+        "job": {
+            "id": job.id,
+            "task": job.task,
+            "status": job.status,
+            "attempts": job.attempts,
+            "finished": job.is_finished,
+            "result": job.result,
+            # The traceback stays in the admin; clients only need the last line.
+            "error": job.error.strip().splitlines()[-1] if job.error else "",
+            "created_at": job.created_at.isoformat(),
+            "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+        },
+    })
+
+
 @login_required
 def debug_forms(request):
     """Debug page for testing form functionality"""
@@ -0,0 +1,115 @@
+# academic_app/warmup.py
+"""
+Warm-up for new worker processes.
+
+A fresh worker compiles each template, builds the URL resolver's lookup
+tables and opens its database connection on first use, so its first few
+requests are slow. ``run()`` does that work up front. Gunicorn calls it in
+each worker before it accepts traffic when ``WARMUP`` is set (see
+gunicorn.conf.py), and ``manage.py warmup`` runs it by hand.
+
+Hooks are plain functions registered with ``@hook("name")``. Apps add their
+own from ``AppConfig.ready``. ``WARMUP_HOOKS`` limits which of them run.
+"""
+import logging
+import time
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+_hooks = {}
+
+
+def hook(name):
+    """Registers ``func`` as the warm-up step ``name``; steps run in registration order."""
+    def register(func):
+        _hooks[name] = func
+        return func
+    return register
+
+
+def registered():
+    return list(_hooks)
+
+
+@hook("database")
+def open_connections():
+    for alias in connections:
+        connections[alias].ensure_connection()
+
+
+@hook("urls")
+def build_resolver():
+    from django.urls import get_resolver
+
+    resolver = get_resolver()
+    # Imports every urls module and view, and fills the reverse() lookup tables.
+    resolver.url_patterns
+    resolver.reverse_dict
+
+
+def project_templates():
+    """Names of the project's own templates, from the template dirs and this project's apps."""
+    base_dir = Path(settings.BASE_DIR).resolve()
+    dirs = [Path(directory) for engine in settings.TEMPLATES for directory in engine.get("DIRS", [])]
+    dirs += [
+        Path(config.path) / "templates" for config in apps.get_app_configs()
+        if Path(config.path).resolve().is_relative_to(base_dir)
+    ]
+    names = set()
+    for directory in dirs:
+        if directory.is_dir():
+            names.update(path.relative_to(directory).as_posix() for path in directory.rglob("*.html"))
+    return sorted(names)
+
+
+@hook("templates")
+def compile_templates():
+    """Compiles every project template into the cached template loader."""
+    from django.template import TemplateDoesNotExist, TemplateSyntaxError, engines
+
+    for name in project_templates():
+        for engine in engines.all():
+            try:
+                engine.get_template(name)
+                break
+            except TemplateDoesNotExist:
+                continue
+            except TemplateSyntaxError:
+                logger.warning("Template %s does not compile", name, exc_info=True)
+                break
+
+
+@hook("caches")
+def prime_caches():
+    """Fills the process-wide content type cache used by auth permissions and the admin."""
+    from django.contrib.contenttypes.models import ContentType
+
+    ContentType.objects.get_for_models(*apps.get_models())
+
+
+def run(names=None):
+    """
+    Runs the warm-up hooks (``names``, else ``WARMUP_HOOKS``, else all) and
+    returns ``[(name, milliseconds), ...]``. A failing hook is logged and
+    skipped; warm-up never stops a worker from starting.
+    """
+    names = names or getattr(settings, "WARMUP_HOOKS", None) or registered()
+    timings = []
+    for name in names:
+        func = _hooks.get(name)
+        if func is None:
+            logger.warning("Unknown warm-up hook: %s", name)
+            continue
+        started = time.perf_counter()
+        try:
+            func()
+        except Exception:
+            logger.exception("Warm-up hook %s failed", name)
+        timings.append((name, (time.perf_counter() - started) * 1000))
+    logger.info("Warm-up finished: %s", ", ".join(f"{name} {ms:.0f} ms" for name, ms in timings))
+    return timings
@@ -0,0 +1,137 @@
+# academic_app/workload.py
+"""
+Weekly workload forecast: pending assignment hours and exam preparation
+hours bucketed by ISO week (Monday start).
+
+Bucketing happens in the database with ``TruncWeek`` and ``GROUP BY``, one
+query per item type, restricted to the forecast window through the
+(course, due_date) and (course, exam_date) indexes, so cost follows the
+window rather than the length of the user's history.
+"""
+from datetime import datetime, timedelta
+
+from django.core.cache import cache
+from django.db.models import Case, Count, IntegerField, Sum, Value, When
+from django.db.models.functions import TruncWeek
+from django.utils import timezone
+
+from .caching import get_data_version
+from .models import Assignment, Exam, UserPreferences, in_current_term
+
+# Hours of preparation an exam adds to the week it falls in.
+EXAM_PREP_HOURS = {
+    'final': 10,
+    'midterm': 6,
+    'project': 6,
+    'presentation': 4,
+    'quiz': 2,
+}
+DEFAULT_EXAM_PREP_HOURS = 4
+
+DEFAULT_WEEKS = 12
+MAX_WEEKS = 52
+
+WORKLOAD_CACHE_TIMEOUT = 60 * 60
+WORKLOAD_CACHE_KEY = "academic:workload:{user_id}:{version}:{start}:{weeks}"
+
+
+def load_level(total, threshold):
+    """Heatmap shade from 0 (free) to 4 (over the threshold)."""
+    if total <= 0:
+        return 0
+    if total > threshold:
+        return 4
+    return 1 if total < threshold / 2 else 2 if total < threshold * 0.8 else 3
+
+
+def week_start(day):
+    """The Monday of ``day``'s ISO week."""
+    return day - timedelta(days=day.weekday())
+
+
+def _prep_hours():
+    return Case(
+        *[When(exam_type=exam_type, then=Value(hours)) for exam_type, hours in EXAM_PREP_HOURS.items()],
+        default=Value(DEFAULT_EXAM_PREP_HOURS),
+        output_field=IntegerField(),
+    )
+
+
+def _weekly(queryset, date_field, hours, tz):
+    """``{week_start_date: (hours, items)}`` for ``queryset``, grouped in SQL."""
+    rows = (
+        queryset.order_by()
+        .annotate(week=TruncWeek(date_field, tzinfo=tz))
+        .values("week")
+        .annotate(hours=Sum(hours), items=Count("id"))
+    )
+    return {
+        (row["week"].date() if isinstance(row["week"], datetime) else row["week"]): (row["hours"] or 0, row["items"])
+        for row in rows
+    }
+
+
+def compute_workload(user, start, weeks, threshold):
+    """
+    Returns one entry per week from the week containing ``start`` for
+    ``weeks`` weeks, including empty weeks, flagging those above
+    ``threshold`` hours.
+    """
+    tz = timezone.get_current_timezone()
+    first = week_start(start)
+    window_start = timezone.make_aware(datetime.combine(first, datetime.min.time()), tz)
+    window_end = window_start + timedelta(weeks=weeks)
+
+    assignments = _weekly(
+        Assignment.objects.filter(
+            in_current_term("course__"), course__user=user, completed=False,
+            due_date__gte=window_start, due_date__lt=window_end,
+        ),
+        "due_date", "estimated_hours", tz,
+    )
+    exams = _weekly(
+        Exam.objects.filter(
+            in_current_term("course__"), course__user=user, exam_date__gte=window_start, exam_date__lt=window_end
+        ),
+        "exam_date", _prep_hours(), tz,
+    )
+
+    result = []
+    for offset in range(weeks):
+        monday = first + timedelta(weeks=offset)
+        assignment_hours, assignment_count = assignments.get(monday, (0, 0))
+        exam_hours, exam_count = exams.get(monday, (0, 0))
+        total = assignment_hours + exam_hours
+        iso_year, iso_week, _ = monday.isocalendar()
+        result.append({
+            "week": f"{iso_year}-W{iso_week:02d}",
+            "week_start": monday.isoformat(),
+            "assignment_hours": assignment_hours,
+            "assignments": assignment_count,
+            "exam_hours": exam_hours,
+            "exams": exam_count,
+            "total_hours": total,
+            "level": load_level(total, threshold),
+            "overloaded": total > threshold,
+        })
+    return result
+
+
+def get_workload(user, start=None, weeks=DEFAULT_WEEKS):
+    """The user's forecast and threshold, cached until their data changes."""
+    start = start or timezone.localdate()
+    weeks = max(1, min(weeks, MAX_WEEKS))
+    key = WORKLOAD_CACHE_KEY.format(
+        user_id=user.id, version=get_data_version(user.id), start=week_start(start).isoformat(), weeks=weeks
+    )
+    workload = cache.get(key)
+    if workload is None:
+        threshold = UserPreferences.for_user(user).weekly_workload_hours
+        weeks_data = compute_workload(user, start, weeks, threshold)
+        workload = {
+            "threshold": threshold,
+            "weeks": weeks_data,
+            "overloaded_weeks": [week["week"] for week in weeks_data if week["overloaded"]],
+        }
+        cache.set(key, workload, WORKLOAD_CACHE_TIMEOUT)
+    return workload
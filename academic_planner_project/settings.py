@@ -55,6 +55,7 @@ INSTALLED_APPS = [
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
+    'whitenoise.runserver_nostatic',  # Serve static files through WhiteNoise in runserver too
     'django.contrib.staticfiles',
     'django.contrib.humanize',  # For better date/time formatting
     
@@ -68,6 +69,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -162,6 +164,22 @@ STATICFILES_DIRS = [
     BASE_DIR / 'static',
 ]
 
+# collectstatic writes content-hashed copies (dashboard.3f2a9c.js) plus .gz and
+# .br variants next to them; WhiteNoise serves the precompressed file matching
+# Accept-Encoding and marks hashed names as immutable for a year.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+
+WHITENOISE_USE_FINDERS = DEBUG
+WHITENOISE_AUTOREFRESH = DEBUG
+WHITENOISE_MAX_AGE = 0 if DEBUG else 3600  # Unhashed names only; hashed files are always immutable
+
 # Media files
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
@@ -179,10 +197,10 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'academic_app.pagination.StableCursorPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'academic_app.renderers.FastJSONRenderer',
     ],
 }
 
@@ -234,13 +252,27 @@ LOGGING = {
 # Create logs directory if it doesn't exist
 os.makedirs(BASE_DIR / 'logs', exist_ok=True)
 
-# Cache configuration (using local memory cache for development)
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'unique-snowflake',
+# Cache configuration. The cache holds each user's data version (see
+# academic_app/caching.py), so it must be shared by every gunicorn worker and
+# job runner: a per-process cache would keep serving fragments another
+# process has invalidated. Redis when REDIS_URL is set, else a database table
+# (created by migrations).
+REDIS_URL = os.getenv('REDIS_URL', '')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'academic_cache',
+            'OPTIONS': {'MAX_ENTRIES': 20000},
+        }
     }
-}
 
 # Email configuration (for production)
 EMAIL_BACKEND = os.getenv('EMAIL_BACKEND', 'django.core.mail.backends.console.EmailBackend')
@@ -251,9 +283,44 @@ EMAIL_HOST_USER = os.getenv('EMAIL_HOST_USER', '')
 EMAIL_HOST_PASSWORD = os.getenv('EMAIL_HOST_PASSWORD', '')
 DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL', 'noreply@academicplanner.com')
 
+# Background jobs (academic_app/jobs.py). Eager mode runs jobs inside the
+# request, so development works without a `manage.py run_jobs` worker.
+JOBS_EAGER = os.getenv('JOBS_EAGER', str(DEBUG)).lower() == 'true'
+
+# Worker warm-up (academic_app/warmup.py): with WARMUP=True each gunicorn
+# worker compiles templates, opens its database connection and so on before
+# it accepts traffic. WARMUP_HOOKS picks steps by name (default: all).
+WARMUP = os.getenv('WARMUP', 'False').lower() == 'true'
+WARMUP_HOOKS = [name for name in os.getenv('WARMUP_HOOKS', '').split(',') if name]
+
+# Terms (academic_app/terms.py): `manage.py archive_terms` moves a term's
+# courses into a compressed snapshot this many days after the term ends.
+TERM_ARCHIVE_AFTER_DAYS = int(os.getenv('TERM_ARCHIVE_AFTER_DAYS', '30'))
+
 # API Keys
 GOOGLE_API_KEY = os.getenv('GOOGLE_API_KEY', '')
 
+# Model client for the chat agent (gemini_agent_app/backends.py). Use
+# 'gemini_agent_app.backends.FakeClient' to run the agent offline against a
+# scripted stand-in configured by GEMINI_FAKE_OPTIONS (script_path, latency,
+# jitter, slow_rate, slow_latency, error_rate, error_codes, seed).
+GEMINI_CLIENT = os.getenv('GEMINI_CLIENT', 'gemini_agent_app.backends.GeminiClient')
+GEMINI_FAKE_OPTIONS = {}
+
+# The Gemini SDK is imported on first chat use. Set GEMINI_PRELOAD=True to
+# import it at startup instead, when workers are forked from a preloaded
+# master (GUNICORN_PRELOAD=True, `run_jobs --processes`) and share its pages.
+GEMINI_PRELOAD = os.getenv('GEMINI_PRELOAD', 'False').lower() == 'true'
+
+# Limits on outbound Gemini calls (gemini_agent_app/ratelimit.py). The rate
+# and burst are shared by every process; the rest apply per process.
+GEMINI_REQUESTS_PER_MINUTE = int(os.getenv('GEMINI_REQUESTS_PER_MINUTE', '60'))
+GEMINI_BURST = int(os.getenv('GEMINI_BURST', '10'))
+GEMINI_MAX_CONCURRENCY = int(os.getenv('GEMINI_MAX_CONCURRENCY', '4'))
+GEMINI_MAX_QUEUE = int(os.getenv('GEMINI_MAX_QUEUE', '16'))
+GEMINI_QUEUE_TIMEOUT = float(os.getenv('GEMINI_QUEUE_TIMEOUT', '20'))
+GEMINI_MAX_RETRIES = int(os.getenv('GEMINI_MAX_RETRIES', '3'))
+
 # Development vs Production settings
 if DEBUG:
     # Development settings
@@ -271,6 +338,15 @@ if DEBUG:
         pass
 else:
     # Production settings
+    # Compile each template once per process instead of on every render.
+    TEMPLATES[0]['APP_DIRS'] = False
+    TEMPLATES[0]['OPTIONS']['loaders'] = [
+        ('django.template.loaders.cached.Loader', [
+            'django.template.loaders.filesystem.Loader',
+            'django.template.loaders.app_directories.Loader',
+        ]),
+    ]
+
     SECURE_SSL_REDIRECT = True
     SECURE_HSTS_SECONDS = 31536000  # 1 year
     SECURE_HSTS_INCLUDE_SUBDOMAINS = True
@@ -1,55 +1,85 @@
 # gemini_agent_app/agent.py
-import google.generativeai as genai
-import os
-import json
-from . import tools 
-from django.db.models import F
+from . import history, tools 
+from .backends import get_client
+from .memo import ToolMemo
+from .ratelimit import RateLimited, get_limiter
+
+# Tool calls the model may chain before it has to answer in text.
+MAX_TOOL_ROUNDS = 5
+
+TOOLS = [
+    tools.add_new_course,
+    tools.add_calendar_event,
+    tools.add_assignment,
+    tools.add_exam,
+    tools.get_academic_summary, 
+    tools.get_study_plan,
+    tools.get_grade_projection,
+]
+
+SYSTEM_INSTRUCTION = (
+    "You are an AI academic planner assistant. You have access to tools that can get "
+    "and modify the user's academic data. Do NOT ask for the user's ID; "
+    "it is handled automatically by your tool calls. \n\n"
+    "Available tools:\n"
+    "- get_academic_summary: Get overview of courses, assignments, exams, and events\n"
+    "- add_new_course: Add a new course with name, code, and instructor\n"
+    "- add_calendar_event: Add events to the calendar\n"
+    "- add_assignment: Add assignments to specific courses\n"
+    "- add_exam: Add exams to specific courses\n"
+    "- get_study_plan: Suggest study blocks for pending assignments around the user's schedule\n"
+    "- get_grade_projection: Show a course grade and the scores needed for a target grade\n\n"
+    "Always use the get_academic_summary tool when users ask about their academic data. "
+    "Be helpful, friendly, and use emojis in your responses to make them engaging. "
+    "When adding items, provide clear confirmation messages with details."
+)
 
 class StudyPlanAgent:
-    def __init__(self, user):
+    def __init__(self, user, client=None):
         self.user = user
-        genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
-        
-        self.chat_model = genai.GenerativeModel(
-            'gemini-1.5-pro',
-            tools=[
-                tools.add_new_course,
-                tools.add_calendar_event,
-                tools.add_assignment,
-                tools.add_exam,
-                tools.get_academic_summary, 
-            ]
-        )
+        self.tool_memo = ToolMemo(user.id)
+        # The user and their courses, looked up once for every tool call in the session.
+        self.tool_context = tools.ToolContext(user)
+        # The model client comes from settings.GEMINI_CLIENT unless one is passed in.
+        self.client = client or get_client()
+        # Earlier turns: the latest verbatim, older ones as a running summary.
+        summary, messages = history.build_context(user)
+        instruction = SYSTEM_INSTRUCTION
+        if summary:
+            instruction += f"\n\nSummary of your earlier conversation with this user:\n{summary}"
+        self.chat_session = self.client.start_chat(TOOLS, instruction, messages)
+
+    def call_tool(self, tool_name, tool_kwargs):
+        """Runs one tool for this user, reusing read-only results within the session."""
+        # Automatically add the user_id
+        tool_kwargs = {**tool_kwargs, 'user_id': self.user.id}
+        tool_function = getattr(tools, tool_name)
+        with tools.using(self.tool_context):
+            return self.tool_memo.call(tool_name, tool_function, tool_kwargs)
 
-        system_instruction = (
-            "You are an AI academic planner assistant. You have access to tools that can get "
-            "and modify the user's academic data. Do NOT ask for the user's ID; "
-            "it is handled automatically by your tool calls. \n\n"
-            "Available tools:\n"
-            "- get_academic_summary: Get overview of courses, assignments, exams, and events\n"
-            "- add_new_course: Add a new course with name, code, and instructor\n"
-            "- add_calendar_event: Add events to the calendar\n"
-            "- add_assignment: Add assignments to specific courses\n"
-            "- add_exam: Add exams to specific courses\n\n"
-            "Always use the get_academic_summary tool when users ask about their academic data. "
-            "Be helpful, friendly, and use emojis in your responses to make them engaging. "
-            "When adding items, provide clear confirmation messages with details."
-        )
-        self.chat_session = self.chat_model.start_chat(history=[
-            {"role": "user", "parts": [system_instruction]}
-        ])
+    def send(self, content):
+        """Sends one message to the model, within the shared rate and concurrency limits."""
+        return get_limiter().call(self.chat_session.send_message, content)
 
     def generate_response(self, query):
         try:
             # 1. Send the query to the model.
-            response = self.chat_session.send_message(query)
+            response = self.send(query)
 
-            # 2. Iterate through all parts of the response
-            response_parts = response.candidates[0].content.parts
-            
-            for part in response_parts:
-                if part.function_call:
-                    tool_call = part.function_call
+            # 2. Run the tools the model asks for, feeding each result back,
+            # until it answers in text.
+            for _ in range(MAX_TOOL_ROUNDS):
+                response_parts = response.candidates[0].content.parts
+                tool_calls = [part.function_call for part in response_parts if part.function_call]
+
+                if not tool_calls:
+                    text = "".join(part.text for part in response_parts if part.text)
+                    # Fallback if no parts are found (shouldn't happen with valid input)
+                    return text or "I'm sorry, I couldn't process that request."
+
+                # The model can ask for several tools at once; run them in order.
+                tool_results = []
+                for tool_call in tool_calls:
                     tool_name = tool_call.name
                     tool_kwargs = {arg: tool_call.args[arg] for arg in tool_call.args}
 
@@ -60,25 +90,15 @@ class StudyPlanAgent:
                         if missing_args:
                             return f"I need the {', '.join(missing_args)} to add the course. Can you provide it?"
 
-                    # Automatically add the user_id
-                    tool_kwargs['user_id'] = self.user.id
-                    
-                    # Execute the tool
-                    tool_function = getattr(tools, tool_name)
-                    tool_result = tool_function(**tool_kwargs)
-                    
-                    # Send the tool's result back to the model for a final, natural response.
-                    # This is the correct way to handle a function call result in the new API.
-                    final_response = self.chat_session.send_message(tool_result)
-                    return final_response.text
+                    tool_results.append(self.call_tool(tool_name, tool_kwargs))
+
+                # Send the tools' results back to the model for a natural response.
+                response = self.send("\n\n".join(tool_results))
 
-                elif part.text:
-                    # If the part is text, just return it directly.
-                    return part.text
-            
-            # Fallback if no parts are found (shouldn't happen with valid input)
-            return "I'm sorry, I couldn't process that request."
+            return "I'm sorry, that needed too many steps. Could you break it into smaller requests?"
                 
+        except RateLimited:
+            return "I'm sorry, I'm handling a lot of requests right now. Please try again in a minute. ⏳"
         except Exception as e:
             print(f"Error generating response: {e}")
-            return "I'm sorry, an error occurred. Please try again later."
\ No newline at end of file
+            return "I'm sorry, an error occurred. Please try again later."
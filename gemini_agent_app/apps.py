@@ -1,6 +1,18 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class GeminiAgentAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'gemini_agent_app'
+
+    def ready(self):
+        from . import tasks  # noqa: F401  (registers the background job tasks)
+
+        from academic_app import warmup
+        from .backends import load_sdk
+
+        # Importing the SDK during warm-up spares a worker's first chat request.
+        warmup.hook("gemini_sdk")(load_sdk)
+        if settings.GEMINI_PRELOAD:
+            load_sdk()
@@ -0,0 +1,196 @@
+# gemini_agent_app/backends.py
+"""
+Model clients for ``StudyPlanAgent``.
+
+A client has one method, ``start_chat(tools, system_instruction, history)``,
+which returns a chat session with ``send_message(content)``. Responses have the
+shape the agent reads from the Gemini SDK:
+``response.candidates[0].content.parts``, where each part has ``text``
+and ``function_call`` (``name`` and ``args``).
+
+``GEMINI_CLIENT`` picks the client by dotted path. ``GeminiClient`` talks
+to the Google API. ``FakeClient`` replays a script locally, optionally
+with latency and injected errors, so the chat path can be benchmarked and
+load tested offline (``manage.py benchmark_agent``).
+"""
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+def opening_history(system_instruction, history=()):
+    """The system instruction followed by earlier turns, keeping user and model turns alternating."""
+    opening = [{"role": "user", "parts": [system_instruction]}]
+    if history:
+        opening.append({"role": "model", "parts": ["Understood! Let's pick up where we left off. 👋"]})
+    return opening + list(history)
+
+
+def load_sdk():
+    """
+    Imports the Gemini SDK. It pulls in gRPC and protobuf, so it is only
+    loaded on first chat use, or once at startup with ``GEMINI_PRELOAD``
+    for servers that fork workers from a preloaded master.
+    """
+    import google.generativeai as genai
+    return genai
+
+
+class GeminiClient:
+    """The real Gemini API."""
+
+    model_name = "gemini-1.5-pro"
+
+    def start_chat(self, tools, system_instruction, history=()):
+        genai = load_sdk()
+        genai.configure(api_key=settings.GOOGLE_API_KEY)
+        model = genai.GenerativeModel(self.model_name, tools=tools)
+        return model.start_chat(history=opening_history(system_instruction, history))
+
+
+@dataclass
+class FunctionCall:
+    name: str
+    args: dict = field(default_factory=dict)
+
+
+@dataclass
+class Part:
+    text: str = ""
+    function_call: Optional[FunctionCall] = None
+
+
+@dataclass
+class Content:
+    parts: list
+
+
+@dataclass
+class Candidate:
+    content: Content
+
+
+@dataclass
+class Response:
+    candidates: list
+
+    @property
+    def text(self):
+        return "".join(part.text for part in self.candidates[0].content.parts)
+
+
+def make_response(step):
+    """
+    Builds a response from one script step: a string (a text reply), or a
+    dict with ``"text"`` and/or ``"tool_calls"`` (a list of ``{"name",
+    "args"}``, all returned in one response).
+    """
+    if isinstance(step, str):
+        step = {"text": step}
+    parts = [Part(function_call=FunctionCall(call["name"], dict(call.get("args", {}))))
+             for call in step.get("tool_calls", [])]
+    if step.get("text"):
+        parts.append(Part(text=step["text"]))
+    return Response([Candidate(Content(parts))])
+
+
+# Looks the user's data up, then answers: one round of the tool loop.
+DEFAULT_SCRIPT = [
+    {"tool_calls": [{"name": "get_academic_summary"}]},
+    "Here's your academic overview! 📚 You're on track this week.",
+]
+
+
+class FakeAPIError(Exception):
+    """An injected API failure; ``code`` is the HTTP status, like Google API errors."""
+
+    def __init__(self, code):
+        super().__init__(f"Injected API error ({code})")
+        self.code = code
+
+
+class FakeChatSession:
+    def __init__(self, client, history):
+        self.client = client
+        self.history = list(history)
+        self.position = 0
+
+    def send_message(self, content):
+        self.history.append({"role": "user", "parts": [content]})
+        response = self.client.respond(self.position)
+        self.position += 1
+        self.history.append({"role": "model", "parts": response.candidates[0].content.parts})
+        return response
+
+
+class FakeClient:
+    """
+    Replays ``script`` in order for every chat session, starting over when it
+    runs out. Each call waits ``latency`` seconds plus up to ``jitter``; a
+    ``slow_rate`` share of calls wait ``slow_latency`` instead, for tail
+    latency. An ``error_rate`` share of calls raise ``FakeAPIError`` with a
+    code drawn from ``error_codes``. ``seed`` makes a run repeatable.
+    """
+
+    def __init__(self, script=None, latency=0.0, jitter=0.0, slow_rate=0.0, slow_latency=0.0,
+                 error_rate=0.0, error_codes=(429,), seed=None):
+        self.script = list(script or DEFAULT_SCRIPT)
+        self.latency, self.jitter = latency, jitter
+        self.slow_rate, self.slow_latency = slow_rate, slow_latency
+        self.error_rate, self.error_codes = error_rate, tuple(error_codes)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()  # Sessions run on many threads during load tests
+        self.sessions = self.calls = self.errors = 0
+
+    @classmethod
+    def from_settings(cls):
+        options = dict(getattr(settings, "GEMINI_FAKE_OPTIONS", {}))
+        script_path = options.pop("script_path", None)
+        if script_path:
+            with open(script_path) as handle:
+                options["script"] = json.load(handle)
+        return cls(**options)
+
+    def _draw(self):
+        with self._lock:
+            self.calls += 1
+            return self._random.random(), self._random.random(), self._random.random()
+
+    def respond(self, position):
+        """The response to a session's ``position``-th message, after the simulated latency."""
+        slow, spread, fail = self._draw()
+        delay = self.slow_latency if slow < self.slow_rate else self.latency + spread * self.jitter
+        if delay > 0:
+            time.sleep(delay)
+        if fail < self.error_rate:
+            with self._lock:
+                self.errors += 1
+            # Reuses the latency draw to pick the code, keeping a seeded run repeatable.
+            raise FakeAPIError(self.error_codes[int(spread * len(self.error_codes))])
+        return make_response(self.script[position % len(self.script)])
+
+    def start_chat(self, tools, system_instruction, history=()):
+        with self._lock:
+            self.sessions += 1
+        return FakeChatSession(self, opening_history(system_instruction, history))
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """The client named by ``GEMINI_CLIENT``, shared by every agent in this process."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            client_class = import_string(settings.GEMINI_CLIENT)
+            from_settings = getattr(client_class, "from_settings", None)
+            _client = from_settings() if from_settings else client_class()
+        return _client
@@ -0,0 +1,127 @@
+# gemini_agent_app/history.py
+"""
+Persistent chat history with a bounded context window.
+
+Each completed turn is stored as two ``ChatMessage`` rows holding only the
+user's text and the final reply. Intermediate tool calls are not kept. A
+new chat session gets the last ``RECENT_TURNS`` turns verbatim (each
+clipped to ``MAX_MESSAGE_CHARS``). Older turns are folded into the user's
+``ChatSummary``, one line per turn, trimmed from the oldest end to
+``SUMMARY_MAX_CHARS``. The prompt therefore stays about the same size
+however long the conversation runs.
+
+The summary is built locally from the first sentence or two of each
+message rather than by asking the model, so rolling it up costs no API
+calls or quota.
+"""
+import re
+
+from django.db import transaction
+
+from .models import ChatMessage, ChatSummary
+
+RECENT_TURNS = 6
+MAX_MESSAGE_CHARS = 2000
+SUMMARY_MAX_CHARS = 2000
+
+# Characters of each side of a turn kept in its summary line.
+SUMMARY_QUERY_CHARS = 120
+SUMMARY_REPLY_CHARS = 200
+
+# Messages shown when the chat page is opened.
+DISPLAY_MESSAGES = 20
+
+
+def clip(text, limit):
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[:limit - 1].rstrip() + "…"
+
+
+def gist(text, limit):
+    """The opening of ``text`` without markdown, cut at a sentence end where possible."""
+    text = clip(re.sub(r"[*_`#>|]+", "", text), limit)
+    end = max(text.rfind(mark, 0, limit) for mark in (". ", "! ", "? "))
+    return text[:end + 1] if end > limit // 3 else text
+
+
+def summary_line(query, reply):
+    line = f"- User: {gist(query, SUMMARY_QUERY_CHARS)}"
+    if reply is not None:
+        line += f" / You: {gist(reply, SUMMARY_REPLY_CHARS)}"
+    return line
+
+
+def merge_summary(summary, lines):
+    """Appends ``lines`` and drops the oldest lines until it fits ``SUMMARY_MAX_CHARS``."""
+    merged = [line for line in summary.splitlines() if line] + lines
+    while len(merged) > 1 and sum(len(line) + 1 for line in merged) > SUMMARY_MAX_CHARS:
+        merged.pop(0)
+    return "\n".join(merged)
+
+
+def roll_up(user):
+    """Folds everything older than the last ``RECENT_TURNS`` turns into the user's summary."""
+    with transaction.atomic():
+        summary, _ = ChatSummary.objects.select_for_update().get_or_create(user=user)
+        boundary = (
+            ChatMessage.objects.filter(user=user).order_by("-id").values_list("id", flat=True)[RECENT_TURNS * 2 - 1:]
+        ).first()
+        if boundary is None:
+            return summary
+        older = list(
+            ChatMessage.objects.filter(user=user, id__gt=summary.summarised_until, id__lt=boundary)
+            .order_by("id").values_list("id", "role", "content")
+        )
+        if not older:
+            return summary
+
+        lines, pending = [], None
+        for _, role, content in older:
+            if role == "user":
+                if pending is not None:
+                    lines.append(summary_line(pending, None))
+                pending = content
+            else:
+                lines.append(summary_line(pending or "", content))
+                pending = None
+        if pending is not None:
+            lines.append(summary_line(pending, None))
+
+        summary.content = merge_summary(summary.content, lines)
+        summary.summarised_until = older[-1][0]
+        summary.save()
+    return summary
+
+
+def record(user, query, reply):
+    """Stores one completed turn and rolls older turns into the summary."""
+    ChatMessage.objects.bulk_create([
+        ChatMessage(user=user, role="user", content=query),
+        ChatMessage(user=user, role="model", content=reply),
+    ])
+    roll_up(user)
+
+
+def build_context(user):
+    """
+    ``(summary, messages)`` for a new chat session: the running summary text
+    and the recent turns as ``{"role", "parts"}`` history entries.
+    """
+    summary, summarised_until = ChatSummary.objects.filter(user=user).values_list(
+        "content", "summarised_until"
+    ).first() or ("", 0)
+    recent = ChatMessage.objects.filter(user=user, id__gt=summarised_until).order_by("-id").values_list(
+        "role", "content"
+    )[:RECENT_TURNS * 2]
+    messages = [
+        {"role": role, "parts": [clip(content, MAX_MESSAGE_CHARS)]} for role, content in list(recent)[::-1]
+    ]
+    # Sessions must start on a user turn.
+    while messages and messages[0]["role"] != "user":
+        messages.pop(0)
+    return summary, messages
+
+
+def recent_messages(user, limit=DISPLAY_MESSAGES):
+    """The latest messages, oldest first, for showing in the chat page."""
+    return list(ChatMessage.objects.filter(user=user).order_by("-id")[:limit])[::-1]
@@ -0,0 +1,483 @@
+# gemini_agent_app/intents.py
+"""
+A local fast path for formulaic chat messages.
+
+Messages like "add assignment Lab 3 to CS101 due Friday 5pm" or "show my
+exams" map straight onto one tool call. ``parse`` recognises them with
+anchored patterns. It returns an ``Intent`` only when the whole message
+is accounted for: the pattern matches end to end, any date parses
+completely, and any course code is one of the user's. Anything else
+returns None and goes to the model as before. ``route`` runs a parsed
+intent's tool directly, with no Gemini round trip.
+
+Dates understood by ``parse_when`` (case-insensitive, date and time in
+either order):
+
+* today, tonight, tomorrow;
+* weekdays. "friday" is the next Friday after today, "this friday" the
+  one in the next seven days counting today, and "next friday" the one in
+  next week (Monday to Sunday);
+* "in 3 days", "in 2 weeks";
+* 2026-10-23, 10/23, 10/23/2026, "Oct 23", "October 23rd, 2026", "23 Oct".
+  Dates without a year that have already passed are taken as next year;
+* times: 5pm, 5:30 pm, 17:00, noon, midnight / end of day (23:59),
+  morning (9am), afternoon (2pm), evening (6pm).
+
+gemini_agent_app/data/intent_corpus.json is a labelled corpus of messages,
+scored by ``manage.py evaluate_intents`` for coverage and accuracy.
+"""
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+
+from django.utils import timezone
+
+from academic_app.models import Exam
+
+from . import metrics, tools
+
+WEEKDAYS = {
+    "mon": 0, "monday": 0, "tue": 1, "tues": 1, "tuesday": 1, "wed": 2, "weds": 2, "wednesday": 2,
+    "thu": 3, "thur": 3, "thurs": 3, "thursday": 3, "fri": 4, "friday": 4,
+    "sat": 5, "saturday": 5, "sun": 6, "sunday": 6,
+}
+MONTHS = {
+    "jan": 1, "january": 1, "feb": 2, "february": 2, "mar": 3, "march": 3, "apr": 4, "april": 4,
+    "may": 5, "jun": 6, "june": 6, "jul": 7, "july": 7, "aug": 8, "august": 8,
+    "sep": 9, "sept": 9, "september": 9, "oct": 10, "october": 10, "nov": 11, "november": 11,
+    "dec": 12, "december": 12,
+}
+NAMED_TIMES = {
+    "noon": time(12, 0), "midday": time(12, 0), "midnight": time(23, 59), "end of day": time(23, 59),
+    "eod": time(23, 59), "morning": time(9, 0), "afternoon": time(14, 0), "evening": time(18, 0),
+}
+NUMBER_WORDS = {"a": 1, "an": 1, "one": 1, "two": 2, "three": 3}
+
+# "in N days/weeks" further out than this, or an exam longer than
+# Exam.MAX_DURATION_MINUTES, is left to the model rather than taken literally.
+MAX_OFFSET_DAYS = 4 * 366
+
+# Time of day used when a message gives only a date.
+DEFAULT_TIMES = {"add_assignment": time(23, 59), "add_exam": time(9, 0), "add_calendar_event": time(9, 0)}
+
+EXAM_TYPES = {
+    "midterm": "midterm", "final": "final", "quiz": "quiz", "exam": "midterm", "test": "midterm",
+    "presentation": "presentation",
+}
+
+ROUTABLE_TOOLS = (
+    "get_academic_summary", "get_study_plan", "get_grade_projection",
+    "add_assignment", "add_exam", "add_new_course", "add_calendar_event",
+)
+COUNTERS = ("intent_routed", "intent_fallbacks") + tuple(f"intent_routed:{tool}" for tool in ROUTABLE_TOOLS)
+
+
+def _alternatives(words):
+    return "|".join(sorted(words, key=len, reverse=True))
+
+
+_WEEKDAY = _alternatives(WEEKDAYS)
+_MONTH = _alternatives(MONTHS)
+_DAY = r"(\d{1,2})(?:st|nd|rd|th)?"
+
+DATE_PATTERNS = [
+    ("relative", re.compile(r"(today|tonight|tomorrow|tmrw|tmr)")),
+    ("weekday", re.compile(rf"(?:(this|next) )?({_WEEKDAY})")),
+    ("offset", re.compile(r"in (a|an|one|two|three|\d{1,4}) (days?|weeks?)")),
+    ("iso", re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")),
+    ("numeric", re.compile(r"(\d{1,2})/(\d{1,2})(?:/(\d{4}|\d{2}))?")),
+    ("month_day", re.compile(rf"({_MONTH})\.? {_DAY}(?: (\d{{4}}))?")),
+    ("day_month", re.compile(rf"{_DAY} (?:of )?({_MONTH})(?: (\d{{4}}))?")),
+]
+TIME_PATTERNS = [
+    ("clock", re.compile(r"(\d{1,2})(?::(\d{2}))? ?([ap])\.?m\.?")),
+    ("24h", re.compile(r"(\d{1,2}):(\d{2})")),
+    ("named", re.compile(rf"(?:in the )?({_alternatives(NAMED_TIMES)})")),
+]
+
+# A course code as people type it: "CS101", "cs 101", "MATH-201", "PHYS150L".
+CODE = r"(?P<code>[a-z]{2,5}[ -]?\d{2,4}[a-z]?)"
+VERB = r"(?:add|create|new|log|schedule|set up|put)"
+NAMED = r"(?: called| named| titled|:)?"
+
+
+@dataclass(frozen=True)
+class Intent:
+    tool: str
+    args: dict = field(default_factory=dict)
+
+
+def _date(kind, match, today):
+    if kind == "relative":
+        word = match.group(1)
+        return today + timedelta(days=0 if word in ("today", "tonight") else 1)
+    if kind == "weekday":
+        qualifier, weekday = match.group(1), WEEKDAYS[match.group(2)]
+        ahead = (weekday - today.weekday()) % 7
+        if qualifier == "this":
+            return today + timedelta(days=ahead)
+        if qualifier == "next":
+            next_monday = today + timedelta(days=7 - today.weekday())
+            return next_monday + timedelta(days=weekday)
+        return today + timedelta(days=ahead or 7)
+    if kind == "offset":
+        count = NUMBER_WORDS.get(match.group(1)) or int(match.group(1))
+        days = count * (7 if match.group(2).startswith("week") else 1)
+        return today + timedelta(days=days) if days <= MAX_OFFSET_DAYS else None
+
+    if kind == "iso":
+        year, month, day = (int(part) for part in match.groups())
+    elif kind == "numeric":
+        month, day = int(match.group(1)), int(match.group(2))
+        year = match.group(3) and int(match.group(3))
+        if year and year < 100:
+            year += 2000
+    elif kind == "month_day":
+        month, day, year = MONTHS[match.group(1)], int(match.group(2)), match.group(3) and int(match.group(3))
+    else:
+        day, month, year = int(match.group(1)), MONTHS[match.group(2)], match.group(3) and int(match.group(3))
+    try:
+        result = date(year or today.year, month, day)
+    except ValueError:
+        return None
+    if not year and result < today:
+        result = result.replace(year=today.year + 1)
+    return result
+
+
+def _time(kind, match):
+    if kind == "named":
+        return NAMED_TIMES[match.group(1)]
+    hour, minute = int(match.group(1)), int(match.group(2) or 0)
+    if kind == "clock":
+        if not 1 <= hour <= 12:
+            return None
+        hour = hour % 12 + (12 if match.group(3) == "p" else 0)
+    if hour > 23 or minute > 59:
+        return None
+    return time(hour, minute)
+
+
+def _consume(text, patterns):
+    """Matches one of ``patterns`` at the start of ``text``: ``(kind, match, rest)`` or None."""
+    for kind, pattern in patterns:
+        match = pattern.match(text)
+        if match and (match.end() == len(text) or text[match.end()] == " "):
+            return kind, match, text[match.end():].strip()
+    return None
+
+
+def parse_when(text, now, default_time=time(9, 0)):
+    """
+    Parses a date and/or time phrase, all of it, into an aware datetime in
+    ``now``'s time zone. Returns None unless every word is understood.
+    """
+    text = re.sub(r"[,]", " ", text.lower())
+    text = " ".join(text.split())
+    today = now.date()
+    found_date = found_time = None
+    tonight = False
+    while text:
+        text = re.sub(r"^(?:on|at|by|the|of|before|around|@)\s+", "", text)
+        date_part = None if found_date else _consume(text, DATE_PATTERNS)
+        if date_part:
+            kind, match, text = date_part
+            found_date = _date(kind, match, today)
+            tonight = match.group(0) == "tonight"
+            if found_date is None:
+                return None
+            continue
+        time_part = None if found_time else _consume(text, TIME_PATTERNS)
+        if time_part:
+            kind, match, text = time_part
+            found_time = _time(kind, match)
+            if found_time is None:
+                return None
+            continue
+        return None
+
+    if found_date is None and found_time is None:
+        return None
+    if found_time is None:
+        found_time = time(20, 0) if tonight else default_time
+    if found_date is None:
+        # A bare time means its next occurrence.
+        found_date = today if found_time > now.time() else today + timedelta(days=1)
+    return timezone.make_aware(datetime.combine(found_date, found_time), now.tzinfo)
+
+
+def normalise_code(code):
+    return re.sub(r"[\s-]", "", code).upper()
+
+
+def _course(code, course_codes):
+    """The user's course code matching ``code`` as typed, or None."""
+    known = {normalise_code(known): known for known in course_codes if known}
+    return known.get(normalise_code(code))
+
+
+def _clean(message):
+    text = " ".join(message.strip().split())
+    text = text.rstrip(".!?").strip()
+    text = re.sub(r"^(?:hey|hi|ok|okay)[,!]?\s+", "", text, flags=re.I)
+    text = re.sub(r"^(?:please|pls|can you|could you|would you|can u)\s+", "", text, flags=re.I)
+    text = re.sub(r"\s+please$", "", text, flags=re.I)
+    return text
+
+
+def _split_when(text, now, default_time, allow_empty_title=False):
+    """
+    Splits "<title> <when>" at the leftmost point where the rest is a date,
+    so titles may contain words like "on". Returns ``(title, datetime)``.
+    """
+    words = text.split(" ")
+    for index in range(0 if allow_empty_title else 1, len(words)):
+        when = parse_when(" ".join(words[index:]), now, default_time)
+        if when is not None:
+            title = " ".join(words[:index]).strip(" ,-:")
+            title = re.sub(r"\s+(?:on|at|for|due|by)$", "", title, flags=re.I)
+            if title or allow_empty_title:
+                return title, when
+    return None
+
+
+def _full(pattern):
+    return re.compile(rf"^{pattern}$", re.I)
+
+
+SUMMARY_PATTERNS = [_full(pattern) for pattern in (
+    r"(?:show|list|view|display|get|see|give)(?: me)?(?: all)?(?: of)? my(?: upcoming)? (?:courses|classes|assignments|homework|exams|tests|deadlines|schedule|events|calendar|academic (?:summary|data)|summary|overview|stuff)",
+    r"what(?:'s| is| are| do i have) (?:due|coming up|on my plate)(?: this week| today| tomorrow| soon| next)?",
+    r"what (?:assignments|homework|exams|tests|courses|classes|deadlines) do i have",
+    r"what are my (?:courses|classes|assignments|exams|deadlines)",
+    r"(?:my )?academic (?:summary|overview)",
+    r"(?:summary|overview)",
+)]
+STUDY_PLAN_PATTERNS = [_full(pattern) for pattern in (
+    r"(?:(?:show|make|build|give|create|get)(?: me)? )?(?:(?:a|my) )?study (?:plan|schedule)(?P<span> for (?:the )?(?:next )?(?:\d+ days?|(?:this |the )?week|today|tomorrow))?",
+    r"plan my (?:week|studying|study time)",
+    r"when should i study",
+)]
+GRADE_PATTERNS = [_full(pattern) for pattern in (
+    rf"(?:what(?:'s| is) |show(?: me)? |how(?:'s| is) )?my grade (?:in|for) {CODE}",
+    rf"what do i need (?:in|on|for) {CODE} (?:to get|for) (?:an? )?(?P<target>[abcd]|\d{{1,3}}%?)",
+    rf"(?:can|could) i (?:still )?get (?:an? )?(?P<target>[abcd]|\d{{1,3}}%?) in {CODE}",
+    rf"grade projection (?:for|in) {CODE}",
+    rf"how am i doing in {CODE}",
+)]
+
+_PRIORITY_SUFFIX = re.compile(
+    r"(?:,|\s)\s*(?:(?:with |at )?(?P<a>low|medium|high|urgent)(?:[- ]priority)?|priority:? (?P<b>low|medium|high|urgent)|(?P<c>asap))$",
+    re.I,
+)
+_DURATION_SUFFIX = re.compile(
+    r",?\s+(?:for|lasting) (?P<amount>\d{1,4}(?:\.\d{1,2})?) ?(?P<unit>minutes|mins|min|hours|hour|hrs|hr|h)$", re.I
+)
+_LOCATION_SUFFIX = re.compile(
+    r",?\s+(?:in|at|location:?) (?P<location>(?:room|rm|hall|building|bldg|auditorium|gym|lab) .+|[a-z]+ hall(?: \w+)?)$", re.I
+)
+ASSIGNMENT_PATTERNS = [_full(pattern) for pattern in (
+    rf"{VERB}(?: an?| new| the)? (?:assignment|homework|hw){NAMED} (?P<title>.+?) (?:to|for|in) {CODE},? (?:(?:which is |that's |it's )?due|by) (?P<when>.+)",
+    rf"{VERB}(?: an?| new| the)? {CODE} (?:assignment|homework|hw){NAMED} (?P<title>.+?),? (?:due|by) (?P<when>.+)",
+    rf"{VERB}(?: an?| new| the)? (?:assignment|homework|hw) (?:to|for|in) {CODE}{NAMED} (?P<title>.+?),? (?:due|by) (?P<when>.+)",
+    rf"{VERB} (?P<title>.+?) (?:to|for|in) {CODE},? due (?P<when>.+)",
+)]
+EXAM_PATTERNS = [_full(pattern) for pattern in (
+    rf"{VERB}(?: an?| my| the)? {CODE} (?P<type>midterm|final|quiz|exam|test|presentation)(?: exam)?(?P<rest> .+)",
+    rf"{VERB}(?: an?| my| the)? (?P<type>midterm|final|quiz|exam|test|presentation)(?: exam)?(?P<title>{NAMED} .+?)? (?:for|in|to) {CODE},?(?: on| at)? (?P<when>.+)",
+    rf"(?:my |the )?{CODE} (?P<type>midterm|final|quiz|exam|test|presentation)(?: exam)? is (?P<when>.+)",
+)]
+EVENT_PATTERNS = [_full(pattern) for pattern in (
+    rf"{VERB}(?: an?| new)? (?P<kind>event|meeting|appointment){NAMED} (?P<rest>.+)",
+    r"(?:add|put) (?P<title>.+?) (?:to|on|in) my calendar,? (?P<when>.+)",
+    r"(?:add|put) (?P<rest>.+?) (?:to|on|in) my calendar",
+)]
+COURSE_PATTERNS = [_full(pattern) for pattern in (
+    rf"{VERB}(?: a| the)?(?: new)? (?:course|class){NAMED} (?P<name>.+?),? \(?{CODE}\)?,? (?:taught by|with|instructor:?) (?P<instructor>.+)",
+    rf"{VERB}(?: a| the)?(?: new)? (?:course|class) {CODE}{NAMED} (?P<name>.+?),? (?:taught by|with|instructor:?) (?P<instructor>.+)",
+)]
+
+
+def _strip_suffix(pattern, text):
+    match = pattern.search(text)
+    if not match:
+        return text, None
+    return text[:match.start()].rstrip(" ,"), match
+
+
+def _study_plan(text):
+    for pattern in STUDY_PLAN_PATTERNS:
+        match = pattern.match(text)
+        if match:
+            span = (match.groupdict().get("span") or "").lower()
+            days = re.search(r"\d+", span)
+            if days:
+                return Intent("get_study_plan", {"days": int(days.group())})
+            if "today" in span:
+                return Intent("get_study_plan", {"days": 1})
+            if "tomorrow" in span:
+                return Intent("get_study_plan", {"days": 2})
+            return Intent("get_study_plan", {"days": 7})
+    return None
+
+
+def _grade(text, course_codes):
+    for pattern in GRADE_PATTERNS:
+        match = pattern.match(text)
+        if match:
+            code = _course(match.group("code"), course_codes)
+            if code is None:
+                return None
+            target = (match.groupdict().get("target") or "A").upper().rstrip("%")
+            return Intent("get_grade_projection", {"course_code": code, "target": target})
+    return None
+
+
+def _assignment(text, course_codes, now):
+    body, priority_match = _strip_suffix(_PRIORITY_SUFFIX, text)
+    priority = "medium"
+    if priority_match:
+        priority = (priority_match.group("a") or priority_match.group("b") or "urgent").lower()
+    for candidate in ((body, priority), (text, "medium")) if priority_match else ((text, "medium"),):
+        for pattern in ASSIGNMENT_PATTERNS:
+            match = pattern.match(candidate[0])
+            if not match:
+                continue
+            code = _course(match.group("code"), course_codes)
+            when = parse_when(match.group("when"), now, DEFAULT_TIMES["add_assignment"])
+            title = match.group("title").strip(" ,:'\"")
+            if code and when and title:
+                return Intent("add_assignment", {
+                    "course_code": code, "title": title, "due_date": when.isoformat(), "priority": candidate[1],
+                })
+    return None
+
+
+def _exam(text, course_codes, now):
+    body, duration_match, location_match = text, None, None
+    # Either may come last ("for 2 hours in Hall B", "in Hall B for 2 hours").
+    for _ in range(2):
+        if duration_match is None:
+            body, duration_match = _strip_suffix(_DURATION_SUFFIX, body)
+        if location_match is None:
+            body, location_match = _strip_suffix(_LOCATION_SUFFIX, body)
+    for pattern in EXAM_PATTERNS:
+        match = pattern.match(body)
+        if not match:
+            continue
+        code = _course(match.group("code"), course_codes)
+        if code is None:
+            return None
+        exam_type = EXAM_TYPES[match.group("type").lower()]
+        groups = match.groupdict()
+        if groups.get("rest") is not None:
+            rest = re.sub(r"^(?:called|named|titled|:)\s*", "", groups["rest"].strip(), flags=re.I)
+            rest = re.sub(r"^(?:is|on|at)\s+", "", rest, flags=re.I)
+            split = _split_when(rest, now, DEFAULT_TIMES["add_exam"], allow_empty_title=True)
+            if split is None:
+                return None
+            title, when = split
+        else:
+            title = re.sub(r"^(?:called|named|titled|:)\s*", "", (groups.get("title") or "").strip(), flags=re.I)
+            when = parse_when(groups["when"], now, DEFAULT_TIMES["add_exam"])
+            if when is None:
+                return None
+        args = {
+            "course_code": code,
+            "title": title.strip(" ,:'\"") or f"{code} {exam_type.title()}",
+            "exam_date": when.isoformat(),
+            "exam_type": exam_type,
+        }
+        if duration_match:
+            amount = float(duration_match.group("amount"))
+            minutes = int(amount * 60 if duration_match.group("unit").lower().startswith("h") else amount)
+            if not 0 < minutes <= Exam.MAX_DURATION_MINUTES:
+                return None
+            args["duration"] = minutes
+        if location_match:
+            args["location"] = location_match.group("location").strip()
+        return Intent("add_exam", args)
+    return None
+
+
+def _event(text, now):
+    for pattern in EVENT_PATTERNS:
+        match = pattern.match(text)
+        if not match:
+            continue
+        groups = match.groupdict()
+        if groups.get("rest") is not None:
+            split = _split_when(groups["rest"], now, DEFAULT_TIMES["add_calendar_event"])
+            if split is None:
+                continue
+            title, when = split
+            if groups.get("kind", "event").lower() != "event" and title.lower().startswith("with "):
+                title = f"{groups['kind'].title()} {title}"  # "meeting with advisor"
+        else:
+            title = groups["title"]
+            when = parse_when(groups["when"], now, DEFAULT_TIMES["add_calendar_event"])
+            if when is None:
+                continue
+        title = title.strip(" ,:'\"")
+        if title:
+            return Intent("add_calendar_event", {"title": title, "event_date": when.isoformat()})
+    return None
+
+
+def _new_course(text, course_codes):
+    for pattern in COURSE_PATTERNS:
+        match = pattern.match(text)
+        if match:
+            code = normalise_code(match.group("code"))
+            if _course(code, course_codes):
+                return None  # Let the model explain the clash
+            return Intent("add_new_course", {
+                "name": match.group("name").strip(" ,:'\""),
+                "code": code,
+                "instructor": match.group("instructor").strip(" ,:'\""),
+            })
+    return None
+
+
+def parse(message, course_codes, now=None):
+    """The tool call ``message`` asks for, or None if it isn't a confident match."""
+    now = timezone.localtime(now or timezone.now())
+    text = _clean(message)
+    if not text:
+        return None
+    for attempt in (
+        lambda: Intent("get_academic_summary") if any(p.match(text) for p in SUMMARY_PATTERNS) else None,
+        lambda: _study_plan(text),
+        lambda: _grade(text, course_codes),
+        lambda: _assignment(text, course_codes, now),
+        lambda: _exam(text, course_codes, now),
+        lambda: _new_course(text, course_codes),
+        lambda: _event(text, now),
+    ):
+        intent = attempt()
+        if intent is not None:
+            return intent
+    return None
+
+
+def route(user, message, now=None):
+    """Answers ``message`` with a direct tool call if it parses; None to fall back to the model."""
+    # The course list loaded for parsing is the one the tool resolves codes against.
+    with tools.using(tools.ToolContext(user)) as context:
+        intent = parse(message, list(context.courses), now)
+        if intent is None:
+            metrics.incr("intent_fallbacks")
+            return None
+        metrics.incr("intent_routed")
+        metrics.incr(f"intent_routed:{intent.tool}")
+        return getattr(tools, intent.tool)(user_id=user.id, **intent.args)
+
+
+def totals():
+    counts = metrics.snapshot(COUNTERS)
+    return {
+        "routed": counts["intent_routed"],
+        "fell_back": counts["intent_fallbacks"],
+        "routed_rate": metrics.ratio(counts["intent_routed"], counts["intent_fallbacks"]),
+        "by_tool": {tool: counts[f"intent_routed:{tool}"] for tool in ROUTABLE_TOOLS},
+    }
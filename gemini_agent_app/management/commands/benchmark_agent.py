@@ -0,0 +1,114 @@
+# gemini_agent_app/management/commands/benchmark_agent.py
+import json
+import statistics
+import threading
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from academic_app.benchmarking import seed_user
+from gemini_agent_app import ratelimit
+from gemini_agent_app.agent import StudyPlanAgent
+from gemini_agent_app.backends import FakeClient
+
+USERNAME_PREFIX = "__benchmark_agent_"
+
+
+def percentile(ordered, share):
+    return ordered[min(len(ordered) - 1, int(len(ordered) * share))]
+
+
+class Command(BaseCommand):
+    help = (
+        "Load tests the chat agent offline: concurrent users send messages through "
+        "StudyPlanAgent backed by the scripted FakeClient, running the real tools, "
+        "rate limiter and tool loop. Reports throughput and latency percentiles."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=8, help="Concurrent simulated users")
+        parser.add_argument("--messages", type=int, default=10, help="Messages per user")
+        parser.add_argument("--script", help="JSON file with the model's scripted responses")
+        parser.add_argument("--latency", type=float, default=0.2, help="Seconds per model call")
+        parser.add_argument("--jitter", type=float, default=0.1)
+        parser.add_argument("--slow-rate", type=float, default=0.02, help="Share of calls that are slow")
+        parser.add_argument("--slow-latency", type=float, default=2.0)
+        parser.add_argument("--error-rate", type=float, default=0.0, help="Share of calls that fail")
+        parser.add_argument("--error-codes", default="429,503")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--rate", type=int, default=6000, help="Model calls per minute for the limiter")
+        parser.add_argument("--concurrency", type=int, default=8, help="Limiter concurrency slots")
+        parser.add_argument("--queue", type=int, default=32, help="Limiter wait queue size")
+
+    def handle(self, *args, **options):
+        script = None
+        if options["script"]:
+            with open(options["script"]) as handle:
+                script = json.load(handle)
+        client = FakeClient(
+            script=script,
+            latency=options["latency"],
+            jitter=options["jitter"],
+            slow_rate=options["slow_rate"],
+            slow_latency=options["slow_latency"],
+            error_rate=options["error_rate"],
+            error_codes=[int(code) for code in options["error_codes"].split(",")],
+            seed=options["seed"],
+        )
+        # A separate bucket, so a benchmark never spends the real quota's tokens.
+        previous = ratelimit.reset_limiter(ratelimit.Limiter(
+            ratelimit.TokenBucket("benchmark", options["rate"], options["concurrency"]),
+            max_concurrency=options["concurrency"],
+            max_queue=options["queue"],
+            queue_timeout=30,
+            max_retries=3,
+        ))
+
+        # Worker threads use their own connections, so the seed data has to be committed.
+        users = [seed_user(f"{USERNAME_PREFIX}{i}__", courses=5, items_per_course=20) for i in range(options["users"])]
+        latencies, failures, tool_calls = [], [], []
+        lock = threading.Lock()
+
+        def converse(user):
+            agent = StudyPlanAgent(user, client=client)
+            try:
+                for index in range(options["messages"]):
+                    started = time.perf_counter()
+                    reply = agent.generate_response(f"What's due for me this week? ({index})")
+                    elapsed = (time.perf_counter() - started) * 1000
+                    with lock:
+                        latencies.append(elapsed)
+                        if reply.startswith("I'm sorry"):
+                            failures.append(reply)
+                with lock:
+                    tool_calls.append(agent.tool_memo.hits + agent.tool_memo.misses)
+            finally:
+                connection.close()
+
+        try:
+            threads = [threading.Thread(target=converse, args=(user,)) for user in users]
+            started = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            wall = time.perf_counter() - started
+        finally:
+            User.objects.filter(username__startswith=USERNAME_PREFIX).delete()
+            ratelimit.reset_limiter(previous)
+
+        ordered = sorted(latencies)
+        self.stdout.write(
+            f"{len(ordered)} messages from {len(users)} users in {wall:.2f} s "
+            f"({len(ordered) / wall:.1f} messages/s)"
+        )
+        self.stdout.write(
+            f"latency  median {statistics.median(ordered):8.1f} ms   p95 {percentile(ordered, 0.95):8.1f} ms   "
+            f"p99 {percentile(ordered, 0.99):8.1f} ms   max {ordered[-1]:8.1f} ms"
+        )
+        self.stdout.write(
+            f"model calls {client.calls}, injected errors {client.errors}, "
+            f"tool calls {sum(tool_calls)}, failed replies {len(failures)}"
+        )
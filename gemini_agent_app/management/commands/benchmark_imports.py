@@ -0,0 +1,79 @@
+# gemini_agent_app/management/commands/benchmark_imports.py
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Runs in a fresh interpreter, so nothing is already imported.
+PROBE = """
+import json, os, resource, sys, time
+started = time.perf_counter()
+import django
+django.setup()
+setup_done = time.perf_counter()
+from django.urls import get_resolver, resolve
+get_resolver().url_patterns  # Imports every app's urls and views
+for path in ("/", "/agent/chat/", "/agent/chat/api/"):
+    resolve(path)
+urls_done = time.perf_counter()
+if os.environ.get("PROBE_FIRST_CHAT"):
+    from gemini_agent_app.agent import StudyPlanAgent
+    from gemini_agent_app.backends import load_sdk
+    load_sdk()
+finished = time.perf_counter()
+
+rss_kb = None
+try:
+    with open("/proc/self/status") as status:
+        rss_kb = next(int(line.split()[1]) for line in status if line.startswith("VmRSS:"))
+except OSError:
+    rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # Peak, in KB on Linux
+print(json.dumps({
+    "setup_ms": (setup_done - started) * 1000,
+    "urls_ms": (urls_done - setup_done) * 1000,
+    "total_ms": (finished - started) * 1000,
+    "rss_mb": rss_kb / 1024,
+    "sdk_loaded": "google.generativeai" in sys.modules,
+    "modules": len(sys.modules),
+}))
+"""
+
+SCENARIOS = [
+    ("lazy SDK (default)", {"GEMINI_PRELOAD": "False"}),
+    ("lazy SDK, first chat", {"GEMINI_PRELOAD": "False", "PROBE_FIRST_CHAT": "1"}),
+    ("preloaded SDK", {"GEMINI_PRELOAD": "True"}),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures django.setup() plus URL resolution in fresh interpreters, with the "
+        "Gemini SDK loaded lazily and preloaded: import time and resident memory."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per scenario")
+
+    def probe(self, extra_env):
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": os.environ.get("DJANGO_SETTINGS_MODULE", settings.SETTINGS_MODULE)}
+        env.update(extra_env)
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE], env=env, cwd=settings.BASE_DIR,
+            capture_output=True, text=True, check=True,
+        )
+        return json.loads(result.stdout.strip().splitlines()[-1])
+
+    def handle(self, *args, **options):
+        for label, extra_env in SCENARIOS:
+            runs = [self.probe(extra_env) for _ in range(options["runs"])]
+            median = {key: statistics.median(run[key] for run in runs)
+                      for key in ("setup_ms", "urls_ms", "total_ms", "rss_mb", "modules")}
+            self.stdout.write(
+                f"{label:<24} setup {median['setup_ms']:7.1f} ms   urls {median['urls_ms']:7.1f} ms   "
+                f"total {median['total_ms']:7.1f} ms   rss {median['rss_mb']:6.1f} MB   "
+                f"modules {median['modules']:5.0f}   sdk {'loaded' if runs[0]['sdk_loaded'] else 'not loaded'}"
+            )
@@ -0,0 +1,90 @@
+# gemini_agent_app/management/commands/evaluate_intents.py
+import json
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from gemini_agent_app import intents
+
+DEFAULT_CORPUS = Path(intents.__file__).resolve().parent / "data" / "intent_corpus.json"
+DATE_ARGS = ("due_date", "exam_date", "event_date")
+
+
+def comparable(args):
+    """Args with dates cut to local minutes, as the corpus writes them."""
+    result = dict(args or {})
+    for key in DATE_ARGS:
+        if key in result:
+            result[key] = datetime.fromisoformat(result[key]).replace(tzinfo=None).isoformat(timespec="minutes")
+    return result
+
+
+class Command(BaseCommand):
+    help = (
+        "Scores the local intent parser against a labelled corpus: coverage of the "
+        "messages it should route, accuracy of what it routes, and false routes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--corpus", default=str(DEFAULT_CORPUS))
+        parser.add_argument("--verbose", action="store_true", help="List every mismatch")
+
+    def handle(self, *args, **options):
+        with open(options["corpus"]) as handle:
+            corpus = json.load(handle)
+        now = timezone.make_aware(datetime.fromisoformat(corpus["now"]))
+        courses = corpus["courses"]
+
+        outcomes = Counter()
+        per_tool = Counter()
+        per_tool_correct = Counter()
+        mismatches = []
+        elapsed = []
+        for case in corpus["cases"]:
+            started = time.perf_counter()
+            intent = intents.parse(case["message"], courses, now)
+            elapsed.append((time.perf_counter() - started) * 1000)
+            expected = case["tool"]
+            if expected:
+                per_tool[expected] += 1
+            if intent is None:
+                outcome = "correct fallback" if expected is None else "missed"
+            elif expected is None:
+                outcome = "false route"
+            elif intent.tool == expected and comparable(intent.args) == comparable(case["args"]):
+                outcome = "correct route"
+                per_tool_correct[expected] += 1
+            else:
+                outcome = "wrong route"
+            outcomes[outcome] += 1
+            if outcome in ("missed", "false route", "wrong route"):
+                got = None if intent is None else {"tool": intent.tool, "args": comparable(intent.args)}
+                mismatches.append((outcome, case, got))
+
+        routable = sum(1 for case in corpus["cases"] if case["tool"])
+        routed = outcomes["correct route"] + outcomes["wrong route"] + outcomes["false route"]
+        self.stdout.write(f"{len(corpus['cases'])} messages, {routable} routable")
+        self.stdout.write(
+            f"coverage  {outcomes['correct route'] / routable:6.1%}  (routable messages routed correctly)"
+        )
+        if routed:
+            self.stdout.write(f"accuracy  {outcomes['correct route'] / routed:6.1%}  (routed messages that were right)")
+        self.stdout.write(
+            f"false routes {outcomes['false route']}, wrong routes {outcomes['wrong route']}, "
+            f"missed {outcomes['missed']}, correct fallbacks {outcomes['correct fallback']}"
+        )
+        for tool in sorted(per_tool):
+            self.stdout.write(f"  {tool:<22} {per_tool_correct[tool]:3d}/{per_tool[tool]:<3d}")
+        ordered = sorted(elapsed)
+        self.stdout.write(
+            f"parse time  median {ordered[len(ordered) // 2]:.3f} ms   max {ordered[-1]:.3f} ms"
+        )
+
+        if options["verbose"]:
+            for outcome, case, got in mismatches:
+                expected = case["tool"] and {"tool": case["tool"], "args": comparable(case["args"])}
+                self.stdout.write(f"\n[{outcome}] {case['message']}\n  expected {expected}\n  got      {got}")
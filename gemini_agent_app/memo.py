@@ -0,0 +1,77 @@
+# gemini_agent_app/memo.py
+"""
+Memoisation of read-only agent tools for the length of a chat session.
+
+The model often calls ``get_academic_summary`` (or another read tool)
+several times while working through one request. Results are reused while
+the arguments match and the user's data version is unchanged; calling any
+write tool clears the memo, as does any other write to the user's data,
+because that bumps the data version.
+"""
+import json
+
+from academic_app.caching import get_data_version
+
+from . import metrics
+
+READ_ONLY_TOOLS = frozenset({"get_academic_summary", "get_study_plan", "get_grade_projection"})
+WRITE_TOOLS = frozenset({"add_new_course", "add_calendar_event", "add_assignment", "add_exam"})
+
+COUNTERS = ("tool_memo_hits", "tool_memo_misses", "tool_memo_invalidations")
+
+
+class ToolMemo:
+    def __init__(self, user_id):
+        self.user_id = user_id
+        self.entries = {}
+        self.hits = self.misses = self.invalidations = 0
+        self.writes = 0  # Write tool calls, which make a reply unsafe to replay
+
+    def call(self, name, func, kwargs):
+        """Runs tool ``name`` as ``func(**kwargs)``, from the memo when possible."""
+        if name in WRITE_TOOLS:
+            self.writes += 1
+            try:
+                return func(**kwargs)
+            finally:
+                self.invalidate()
+        if name not in READ_ONLY_TOOLS:
+            return func(**kwargs)
+
+        key = (name, json.dumps(kwargs, sort_keys=True, default=str), get_data_version(self.user_id))
+        if key in self.entries:
+            self.hits += 1
+            metrics.incr("tool_memo_hits")
+            return self.entries[key]
+
+        self.misses += 1
+        metrics.incr("tool_memo_misses")
+        result = func(**kwargs)
+        if not str(result).startswith("❌"):  # Errors may be transient; don't pin them
+            self.entries[key] = result
+        return result
+
+    def invalidate(self):
+        if self.entries:
+            self.entries.clear()
+            self.invalidations += 1
+            metrics.incr("tool_memo_invalidations")
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": metrics.ratio(self.hits, self.misses),
+        }
+
+
+def totals():
+    """Memo counters across every session in this process."""
+    counts = metrics.snapshot(COUNTERS)
+    return {
+        "hits": counts["tool_memo_hits"],
+        "misses": counts["tool_memo_misses"],
+        "invalidations": counts["tool_memo_invalidations"],
+        "hit_rate": metrics.ratio(counts["tool_memo_hits"], counts["tool_memo_misses"]),
+    }
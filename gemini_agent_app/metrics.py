@@ -0,0 +1,40 @@
+# gemini_agent_app/metrics.py
+"""
+Counters for the agent (tool memo hits, cache hits, ...), kept in memory,
+so each process (web server, job worker) reports its own totals. They are
+not kept in the Django cache: the database cache's ``incr`` is a read
+followed by a write, which loses concurrent increments and makes every
+one a write contending for SQLite's lock.
+"""
+import threading
+from collections import Counter
+
+_counts = Counter()
+_lock = threading.Lock()
+
+
+def incr(name, amount=1):
+    with _lock:
+        _counts[name] += amount
+        return _counts[name]
+
+
+def get(name):
+    with _lock:
+        return _counts[name]
+
+
+def snapshot(names):
+    with _lock:
+        return {name: _counts[name] for name in names}
+
+
+def reset():
+    """Zeroes every counter (used by tests)."""
+    with _lock:
+        _counts.clear()
+
+
+def ratio(hits, misses):
+    total = hits + misses
+    return round(hits / total, 3) if total else None
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.24 on 2026-10-19 16:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gemini_agent_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RateLimitBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('tokens', models.FloatField()),
+                ('refilled_at', models.DateTimeField()),
+                ('version', models.PositiveBigIntegerField(default=0, help_text='Bumped on every update, for compare-and-swap')),
+            ],
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.24 on 2026-10-19 16:27
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('gemini_agent_app', '0003_chat_history'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CachedResponse',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('data_version', models.BigIntegerField(help_text="The user's data version when the reply was given")),
+                ('text', models.TextField(help_text='The question, normalised')),
+                ('anchors', models.CharField(help_text='Words that must match exactly, sorted and space-separated', max_length=255)),
+                ('vector', models.BinaryField(help_text='float32 embedding of the normalised question')),
+                ('response', models.TextField()),
+                ('latency_ms', models.FloatField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='cached_responses', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'data_version', 'anchors'], name='gemini_agen_user_id_9c4cfd_idx')],
+            },
+        ),
+    ]
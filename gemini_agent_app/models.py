@@ -11,4 +11,63 @@ class DocumentChunk(models.Model):
     # embedding = VectorField(dimensions=768) # Example for a specific model
     
     def __str__(self):
-        return f"Chunk from {self.source_file}"
\ No newline at end of file
+        return f"Chunk from {self.source_file}"
+
+class RateLimitBucket(models.Model):
+    """Token bucket shared by every process (see gemini_agent_app/ratelimit.py)."""
+    name = models.CharField(max_length=50, unique=True)
+    tokens = models.FloatField()
+    refilled_at = models.DateTimeField()
+    version = models.PositiveBigIntegerField(default=0, help_text="Bumped on every update, for compare-and-swap")
+
+    def __str__(self):
+        return f"{self.name}: {self.tokens:.1f} tokens"
+
+
+class ChatMessage(models.Model):
+    """One side of a chat turn, stored as plain text (tool calls and their results are not kept)."""
+    ROLE_CHOICES = [
+        ('user', 'User'),
+        ('model', 'Assistant'),
+    ]
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='chat_messages')
+    role = models.CharField(max_length=5, choices=ROLE_CHOICES)
+    content = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['id']
+        indexes = [models.Index(fields=['user', 'id'])]
+
+    def __str__(self):
+        return f"{self.user.username} ({self.role}): {self.content[:50]}"
+
+
+class ChatSummary(models.Model):
+    """Running summary of a user's older chat turns (see gemini_agent_app/history.py)."""
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='chat_summary')
+    content = models.TextField(blank=True, default="")
+    summarised_until = models.BigIntegerField(default=0, help_text="Id of the last ChatMessage rolled into the summary")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Chat summary for {self.user.username}"
+
+
+class CachedResponse(models.Model):
+    """A chat reply kept for answering repeated questions (see gemini_agent_app/response_cache.py)."""
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='cached_responses')
+    data_version = models.BigIntegerField(help_text="The user's data version when the reply was given")
+    text = models.TextField(help_text="The question, normalised")
+    anchors = models.CharField(max_length=255, help_text="Words that must match exactly, sorted and space-separated")
+    vector = models.BinaryField(help_text="float32 embedding of the normalised question")
+    response = models.TextField()
+    latency_ms = models.FloatField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['user', 'data_version', 'anchors'])]
+
+    def __str__(self):
+        return f"{self.user.username}: {self.text[:50]}"
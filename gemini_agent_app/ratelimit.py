@@ -0,0 +1,236 @@
+# gemini_agent_app/ratelimit.py
+"""
+Rate and concurrency limits for outbound Gemini calls.
+
+Every call needs two things:
+
+* a slot in this process, of which there are ``GEMINI_MAX_CONCURRENCY``.
+  Callers without one wait in a FIFO queue of at most ``GEMINI_MAX_QUEUE``
+  entries, and a full queue rejects new callers straight away;
+* a token from the ``RateLimitBucket`` row, which every process shares.
+  The bucket refills at ``GEMINI_REQUESTS_PER_MINUTE`` up to
+  ``GEMINI_BURST`` tokens and is updated by compare-and-swap, so it is
+  safe on any database without locks.
+
+Each call has a deadline of ``GEMINI_QUEUE_TIMEOUT`` seconds to start. A
+caller that cannot get a token in time is rejected at once rather than
+sleeping until the deadline. Quota (429) and unavailable (503) errors from
+the API are retried with full-jitter exponential backoff inside the same
+deadline.
+"""
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import IntegrityError
+from django.utils import timezone
+
+from . import metrics
+from .models import RateLimitBucket
+
+BUCKET_NAME = "gemini"
+
+# HTTP statuses on API errors (``exc.code``) that mean "slow down and retry".
+RETRYABLE_STATUS = frozenset({429, 503})
+RETRY_BASE_DELAY = 1.0
+MAX_RETRY_DELAY = 30.0
+
+# Compare-and-swap attempts before treating the bucket as contended.
+CAS_ATTEMPTS = 5
+
+COUNTERS = (
+    "gemini_calls", "gemini_rejected_queue_full", "gemini_rejected_timeout",
+    "gemini_quota_retries", "gemini_quota_errors", "gemini_waits", "gemini_wait_ms",
+)
+
+
+class RateLimited(Exception):
+    """A model call was rejected because the limiter is overloaded."""
+
+    def __init__(self, reason):
+        super().__init__(reason)
+        self.reason = reason
+
+
+def is_retryable(exc):
+    return getattr(exc, "code", None) in RETRYABLE_STATUS
+
+
+class TokenBucket:
+    """A token bucket stored in one ``RateLimitBucket`` row."""
+
+    def __init__(self, name, rate_per_minute, burst):
+        self.name = name
+        self.rate = rate_per_minute / 60.0
+        self.burst = float(burst)
+
+    def try_acquire(self, now=None):
+        """
+        Takes a token and returns 0, or returns how many seconds until one
+        is available without taking anything.
+        """
+        for _ in range(CAS_ATTEMPTS):
+            now = now or timezone.now()
+            row = RateLimitBucket.objects.filter(name=self.name).values_list(
+                "tokens", "refilled_at", "version"
+            ).first()
+            if row is None:
+                try:
+                    RateLimitBucket.objects.create(name=self.name, tokens=self.burst, refilled_at=now)
+                except IntegrityError:  # Another process created it first
+                    pass
+                continue
+            tokens, refilled_at, version = row
+            elapsed = max((now - refilled_at).total_seconds(), 0.0)  # Clocks can disagree slightly
+            tokens = min(self.burst, tokens + elapsed * self.rate)
+            if tokens < 1:
+                return (1 - tokens) / self.rate
+            if RateLimitBucket.objects.filter(name=self.name, version=version).update(
+                tokens=tokens - 1, refilled_at=max(now, refilled_at), version=version + 1,
+            ):
+                return 0.0
+            now = None  # Lost the race; re-read with a fresh clock
+        return 0.05
+
+
+class Limiter:
+    """Process-wide gate for model calls: FIFO concurrency slots plus the shared token bucket."""
+
+    def __init__(self, bucket, max_concurrency, max_queue, queue_timeout, max_retries):
+        self.bucket = bucket
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.max_retries = max_retries
+        self._lock = threading.Lock()
+        self._queue = deque()  # threading.Event per waiting caller, oldest first
+        self.active = 0
+        self.peak_waiting = 0
+        self.max_wait_ms = 0.0
+
+    def _reject(self, reason):
+        metrics.incr(f"gemini_rejected_{reason}")
+        raise RateLimited(reason)
+
+    def _acquire_slot(self, deadline):
+        with self._lock:
+            if self.active < self.max_concurrency and not self._queue:
+                self.active += 1
+                return
+            if len(self._queue) >= self.max_queue:
+                self._reject("queue_full")
+            ticket = threading.Event()
+            self._queue.append(ticket)
+            self.peak_waiting = max(self.peak_waiting, len(self._queue))
+        if ticket.wait(max(deadline - time.monotonic(), 0.0)):
+            return
+        with self._lock:
+            if ticket.is_set():  # Handed a slot just as the wait timed out
+                return
+            self._queue.remove(ticket)
+        self._reject("timeout")
+
+    def _release_slot(self):
+        with self._lock:
+            if self._queue:
+                self._queue.popleft().set()  # The slot passes straight to the next waiter
+            else:
+                self.active -= 1
+
+    def _acquire_token(self, deadline):
+        while True:
+            wait = self.bucket.try_acquire()
+            if not wait:
+                return
+            if time.monotonic() + wait > deadline:
+                self._reject("timeout")
+            time.sleep(wait)
+
+    @contextmanager
+    def slot(self, deadline=None):
+        """Holds a concurrency slot and one token, or raises RateLimited."""
+        deadline = deadline or time.monotonic() + self.queue_timeout
+        started = time.monotonic()
+        self._acquire_slot(deadline)
+        try:
+            self._acquire_token(deadline)
+            waited_ms = (time.monotonic() - started) * 1000
+            self.max_wait_ms = max(self.max_wait_ms, waited_ms)
+            metrics.incr("gemini_waits")
+            metrics.incr("gemini_wait_ms", int(waited_ms))
+            yield
+        finally:
+            self._release_slot()
+
+    def call(self, func, *args, **kwargs):
+        """Calls ``func`` under the limits, retrying quota errors with jittered backoff."""
+        deadline = time.monotonic() + self.queue_timeout
+        for attempt in range(self.max_retries + 1):
+            with self.slot(deadline):
+                metrics.incr("gemini_calls")
+                try:
+                    return func(*args, **kwargs)
+                except Exception as exc:
+                    if not is_retryable(exc):
+                        raise
+                    metrics.incr("gemini_quota_errors")
+                    error = exc
+            delay = random.uniform(0, min(MAX_RETRY_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+            if attempt == self.max_retries or time.monotonic() + delay > deadline:
+                break
+            metrics.incr("gemini_quota_retries")
+            time.sleep(delay)
+        raise error
+
+    def stats(self):
+        with self._lock:
+            return {
+                "active": self.active,
+                "waiting": len(self._queue),
+                "peak_waiting": self.peak_waiting,
+                "max_wait_ms": round(self.max_wait_ms, 1),
+            }
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_limiter():
+    """The limiter for this process, built from settings on first use."""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = Limiter(
+                TokenBucket(BUCKET_NAME, settings.GEMINI_REQUESTS_PER_MINUTE, settings.GEMINI_BURST),
+                max_concurrency=settings.GEMINI_MAX_CONCURRENCY,
+                max_queue=settings.GEMINI_MAX_QUEUE,
+                queue_timeout=settings.GEMINI_QUEUE_TIMEOUT,
+                max_retries=settings.GEMINI_MAX_RETRIES,
+            )
+        return _limiter
+
+
+def reset_limiter(limiter=None):
+    """Replaces this process's limiter (None rebuilds it from settings on next use); returns the old one."""
+    global _limiter
+    with _limiter_lock:
+        previous, _limiter = _limiter, limiter
+    return previous
+
+
+def totals():
+    counts = metrics.snapshot(COUNTERS)
+    limiter = get_limiter().stats()
+    return {
+        "calls": counts["gemini_calls"],
+        "queue_depth": limiter["waiting"],
+        "average_wait_ms": round(counts["gemini_wait_ms"] / counts["gemini_waits"], 1) if counts["gemini_waits"] else None,
+        "rejected": {"queue_full": counts["gemini_rejected_queue_full"], "timeout": counts["gemini_rejected_timeout"]},
+        "quota_errors": counts["gemini_quota_errors"],
+        "quota_retries": counts["gemini_quota_retries"],
+        "this_process": limiter,
+    }
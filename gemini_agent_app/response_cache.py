@@ -0,0 +1,166 @@
+# gemini_agent_app/response_cache.py
+"""
+Per-user cache of chat replies for repeated questions.
+
+Messages are normalised (case, punctuation, common contractions) and
+embedded locally by feature hashing word unigrams, word bigrams and
+character trigrams into a fixed-size unit vector, so "What's due this
+week?" and "what is due this week" land on the same entry without a
+model call. A lookup is an exact match on the normalised text, then the
+best cosine similarity over the user's entries above ``SIMILARITY_THRESHOLD``.
+Time words, numbers and single letters (grades) must match exactly, so
+"this week" never answers "next week".
+
+Entries are ``CachedResponse`` rows, so the job worker that stores a reply
+and the web process that looks it up share them. Each is tagged with the
+user's data version, so any write to their data starts a fresh cache. They
+expire after ``CACHE_TIMEOUT`` because answers like "what's due today" also
+go stale with the clock. Replies from turns that changed data are never
+stored.
+"""
+import re
+import unicodedata
+import zlib
+from datetime import timedelta
+
+import numpy as np
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from academic_app.caching import get_data_version
+
+from . import metrics
+from .models import CachedResponse
+
+EMBEDDING_DIM = 1024
+SIMILARITY_THRESHOLD = 0.9
+MAX_ENTRIES = 50
+CACHE_TIMEOUT = 60 * 60
+
+# Shorter messages ("yes", "do it") depend on the conversation, not just their text.
+MIN_TOKENS = 3
+
+CONTRACTIONS = {
+    "whats": "what is", "whens": "when is", "wheres": "where is", "hows": "how is",
+    "whos": "who is", "thats": "that is", "its": "it is", "im": "i am", "ive": "i have",
+    "dont": "do not", "doesnt": "does not", "didnt": "did not", "cant": "can not",
+    "wont": "will not", "isnt": "is not", "arent": "are not",
+}
+
+ANCHOR_WORDS = frozenset({
+    "today", "tonight", "tomorrow", "yesterday", "this", "next", "last", "week", "weeks",
+    "month", "months", "day", "days", "weekend", "monday", "tuesday", "wednesday",
+    "thursday", "friday", "saturday", "sunday", "overdue", "past", "upcoming",
+})
+
+COUNTERS = ("response_cache_hits", "response_cache_misses", "response_cache_saved_ms")
+
+
+def normalise(text):
+    text = unicodedata.normalize("NFKC", text).lower().replace("'", "").replace("’", "")
+    words = re.findall(r"[a-z0-9]+", text)
+    return " ".join(CONTRACTIONS.get(word, word) for word in words)
+
+
+def anchors(normalised):
+    """Words that change what a question means however similar the rest is."""
+    return frozenset(
+        word for word in normalised.split()
+        # Single letters are usually grades ("an A" vs "a B")
+        if word in ANCHOR_WORDS or len(word) == 1 or any(ch.isdigit() for ch in word)
+    )
+
+
+def _features(normalised):
+    words = normalised.split()
+    yield from words
+    yield from (f"{a} {b}" for a, b in zip(words, words[1:]))
+    padded = f" {normalised} "
+    yield from (f"#{padded[i:i + 3]}" for i in range(len(padded) - 2))
+
+
+def embed(normalised):
+    """Signed feature-hashed bag of n-grams, L2-normalised."""
+    vector = np.zeros(EMBEDDING_DIM, dtype=np.float32)
+    for feature in _features(normalised):
+        digest = zlib.crc32(feature.encode())
+        vector[digest % EMBEDDING_DIM] += 1.0 if digest & 0x80000000 else -1.0
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def _anchor_key(normalised):
+    return " ".join(sorted(anchors(normalised)))[:255]
+
+
+def _live(user_id):
+    """The user's entries for their current data version that have not expired."""
+    return CachedResponse.objects.filter(
+        user_id=user_id,
+        data_version=get_data_version(user_id),
+        created_at__gte=timezone.now() - timedelta(seconds=CACHE_TIMEOUT),
+    )
+
+
+def cacheable(message):
+    return len(normalise(message).split()) >= MIN_TOKENS
+
+
+def lookup(user_id, message):
+    """Returns ``(response, similarity)`` for a cached answer to ``message``, or None."""
+    if not cacheable(message):
+        return None
+    text = normalise(message)
+    # Only entries with the same anchors can match, exact repeats included.
+    entries = list(
+        _live(user_id).filter(anchors=_anchor_key(text)).order_by("-created_at", "-id")
+        .values_list("text", "vector", "response", "latency_ms")[:MAX_ENTRIES]
+    )
+    match = next(((entry, 1.0) for entry in entries if entry[0] == text), None)
+    if match is None and entries:
+        vectors = np.stack([np.frombuffer(bytes(entry[1]), dtype=np.float32) for entry in entries])
+        scores = vectors @ embed(text)
+        best = int(np.argmax(scores))
+        if scores[best] >= SIMILARITY_THRESHOLD:
+            match = (entries[best], float(scores[best]))
+
+    if match is None:
+        metrics.incr("response_cache_misses")
+        return None
+    (_, _, response, latency_ms), similarity = match
+    metrics.incr("response_cache_hits")
+    metrics.incr("response_cache_saved_ms", int(latency_ms))
+    return response, similarity
+
+
+def store(user_id, message, response, latency_ms):
+    """Remembers a reply, keeping at most ``MAX_ENTRIES`` live entries per user."""
+    if not cacheable(message):
+        return
+    text = normalise(message)
+    version = get_data_version(user_id)
+    cutoff = timezone.now() - timedelta(seconds=CACHE_TIMEOUT)
+    with transaction.atomic():
+        user_entries = CachedResponse.objects.filter(user_id=user_id)
+        # Replaced, expired, and earlier data versions' entries go.
+        user_entries.filter(
+            Q(data_version=version, text=text) | ~Q(data_version=version) | Q(created_at__lt=cutoff)
+        ).delete()
+        CachedResponse.objects.create(
+            user_id=user_id, data_version=version, text=text, anchors=_anchor_key(text),
+            vector=embed(text).astype(np.float32).tobytes(), response=response, latency_ms=latency_ms,
+        )
+        surplus = list(user_entries.order_by("-created_at", "-id").values_list("id", flat=True)[MAX_ENTRIES:])
+        if surplus:
+            user_entries.filter(id__in=surplus).delete()
+
+
+def totals():
+    counts = metrics.snapshot(COUNTERS)
+    return {
+        "hits": counts["response_cache_hits"],
+        "misses": counts["response_cache_misses"],
+        "hit_rate": metrics.ratio(counts["response_cache_hits"], counts["response_cache_misses"]),
+        "latency_saved_ms": counts["response_cache_saved_ms"],
+    }
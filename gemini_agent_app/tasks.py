@@ -0,0 +1,26 @@
+# gemini_agent_app/tasks.py
+import time
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+
+from academic_app.jobs import task
+from . import history, response_cache
+
+
+# One attempt only: a retry could repeat tool calls that already wrote data.
+@task("chat.reply", max_attempts=1, timeout=timedelta(minutes=2))
+def chat_reply(payload, job):
+    """Runs one chat message through the agent; the reply is the job's result."""
+    from .agent import StudyPlanAgent  # Loads the model client on first chat use, not at startup
+
+    user = User.objects.get(pk=payload["user_id"])
+    agent = StudyPlanAgent(user)
+    started = time.perf_counter()
+    response = agent.generate_response(payload["message"])
+    latency_ms = (time.perf_counter() - started) * 1000
+    if not response.startswith("I'm sorry"):
+        history.record(user, payload["message"], response)
+        if not agent.tool_memo.writes:
+            response_cache.store(user.id, payload["message"], response, latency_ms)
+    return {"response": response, "tool_memo": agent.tool_memo.stats()}
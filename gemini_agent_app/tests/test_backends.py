@@ -0,0 +1,78 @@
+import json
+import tempfile
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from gemini_agent_app import ratelimit
+from gemini_agent_app.agent import StudyPlanAgent
+from gemini_agent_app.backends import FakeAPIError, FakeClient, make_response, opening_history
+from gemini_agent_app.ratelimit import Limiter
+
+SCRIPT = [{"tool_calls": [{"name": "get_academic_summary"}, {"name": "get_study_plan"}], "text": "One moment"}, "Done!"]
+
+
+class OpenBucket:
+    def try_acquire(self, now=None):
+        return 0.0
+
+
+class FakeClientTests(SimpleTestCase):
+    def test_make_response(self):
+        parts = make_response(SCRIPT[0]).candidates[0].content.parts
+        self.assertEqual([part.function_call.name for part in parts[:2]], ["get_academic_summary", "get_study_plan"])
+        self.assertEqual((parts[2].text, parts[2].function_call), ("One moment", None))
+        self.assertEqual(make_response("Hi").text, "Hi")
+
+    def test_opening_history_alternates_roles(self):
+        earlier = [{"role": "user", "parts": ["hi"]}, {"role": "model", "parts": ["hello"]}]
+        self.assertEqual([turn["role"] for turn in opening_history("Be nice", earlier)], ["user", "model", "user", "model"])
+        self.assertEqual(len(opening_history("Be nice")), 1)
+
+    def test_sessions_replay_the_script_from_the_start(self):
+        client = FakeClient(script=SCRIPT)
+        for _ in range(2):
+            session = client.start_chat([], "Be nice")
+            self.assertEqual([session.send_message(m).text for m in ("a", "b", "c")], ["One moment", "Done!", "One moment"])
+        self.assertEqual((client.sessions, client.calls, client.errors), (2, 6, 0))
+        self.assertEqual(len(session.history), 7)
+
+    def test_seeded_errors_are_repeatable(self):
+        def outcomes():
+            client = FakeClient(error_rate=0.5, error_codes=(429, 503), seed=7)
+            session, seen = client.start_chat([], ""), []
+            for _ in range(20):
+                try:
+                    session.send_message("x")
+                    seen.append(None)
+                except FakeAPIError as exc:
+                    seen.append(exc.code)
+            return seen
+
+        first = outcomes()
+        self.assertEqual(first, outcomes())
+        self.assertTrue({429, 503} <= set(first) and None in first)
+
+    def test_from_settings_loads_a_script_file(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".json") as handle:
+            json.dump(["Scripted"], handle)
+            handle.flush()
+            with override_settings(GEMINI_FAKE_OPTIONS={"script_path": handle.name, "seed": 1}):
+                client = FakeClient.from_settings()
+        self.assertEqual(client.start_chat([], "").send_message("hi").text, "Scripted")
+
+
+class AgentWithFakeClientTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("ada", password="pw")
+        limiter = Limiter(OpenBucket(), max_concurrency=4, max_queue=4, queue_timeout=5, max_retries=0)
+        self.addCleanup(ratelimit.reset_limiter, ratelimit.reset_limiter(limiter))
+
+    def test_tool_loop_runs_every_requested_tool(self):
+        agent = StudyPlanAgent(self.user, client=FakeClient(script=SCRIPT))
+        self.assertEqual(agent.generate_response("What should I do?"), "Done!")
+        self.assertEqual(agent.tool_memo.misses, 2)
+
+    def test_api_errors_become_an_apology(self):
+        agent = StudyPlanAgent(self.user, client=FakeClient(error_rate=1.0, seed=1))
+        self.assertTrue(agent.generate_response("What should I do?").startswith("I'm sorry"))
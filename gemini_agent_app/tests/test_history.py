@@ -0,0 +1,51 @@
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+
+from gemini_agent_app import history
+from gemini_agent_app.models import ChatMessage, ChatSummary
+
+
+class SummaryLineTests(SimpleTestCase):
+    def test_gist_strips_markdown_and_cuts_at_a_sentence(self):
+        text = "**Great news!** You have three essays due. " + "Details follow. " * 30
+        self.assertEqual(history.gist(text, 50), "Great news! You have three essays due.")
+
+    def test_merge_drops_the_oldest_lines(self):
+        line = "x" * 1200
+        self.assertEqual(history.merge_summary(f"old\n{line}", [line, "newest"]).splitlines(), [line, "newest"])
+        self.assertEqual(history.merge_summary("", ["y" * 3000]), "y" * 3000)  # The newest line always stays
+
+
+class HistoryTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("ada", password="pw")
+
+    def record(self, turns):
+        for n in range(turns):
+            history.record(self.user, f"Question {n}?", f"Answer {n}.")
+
+    def test_short_conversations_are_kept_verbatim(self):
+        self.record(2)
+        summary, messages = history.build_context(self.user)
+        self.assertEqual(summary, "")
+        self.assertEqual([m["parts"][0] for m in messages], ["Question 0?", "Answer 0.", "Question 1?", "Answer 1."])
+
+    def test_older_turns_are_summarised(self):
+        self.record(history.RECENT_TURNS + 3)
+        summary, messages = history.build_context(self.user)
+        self.assertEqual(summary.splitlines(), [f"- User: Question {n}? / You: Answer {n}." for n in range(3)])
+        self.assertEqual(len(messages), history.RECENT_TURNS * 2)
+        self.assertEqual(messages[0], {"role": "user", "parts": ["Question 3?"]})
+
+        # Recording more only summarises the turns that newly fell out of the window.
+        self.record(1)
+        self.assertEqual(len(ChatSummary.objects.get(user=self.user).content.splitlines()), 4)
+
+    def test_context_size_is_bounded(self):
+        long_reply = "Sure. " + "word " * 2000
+        for _ in range(40):
+            history.record(self.user, "Tell me everything about my courses please", long_reply)
+        summary, messages = history.build_context(self.user)
+        self.assertLessEqual(len(summary), history.SUMMARY_MAX_CHARS)
+        self.assertTrue(all(len(m["parts"][0]) <= history.MAX_MESSAGE_CHARS for m in messages))
+        self.assertEqual(ChatMessage.objects.filter(user=self.user).count(), 80)
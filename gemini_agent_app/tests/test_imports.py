@@ -0,0 +1,13 @@
+from django.test import SimpleTestCase
+
+from gemini_agent_app.management.commands.benchmark_imports import Command
+
+
+class LazySdkTests(SimpleTestCase):
+    """Each probe runs django.setup() and URL resolution in a fresh interpreter."""
+
+    def test_sdk_is_not_imported_at_startup(self):
+        self.assertFalse(Command().probe({"GEMINI_PRELOAD": "False"})["sdk_loaded"])
+
+    def test_preload_imports_it_in_ready(self):
+        self.assertTrue(Command().probe({"GEMINI_PRELOAD": "True"})["sdk_loaded"])
@@ -0,0 +1,79 @@
+import json
+from datetime import datetime, time
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from academic_app.models import Assignment, Course, Exam
+from gemini_agent_app import intents, metrics
+from gemini_agent_app.management.commands.evaluate_intents import DEFAULT_CORPUS, comparable
+
+# A Monday morning.
+NOW = timezone.make_aware(datetime(2026, 10, 19, 10, 0))
+COURSES = ["CS101", "MATH201", "ENG 105"]
+
+
+def when(text, default_time=time(9, 0)):
+    result = intents.parse_when(text, NOW, default_time)
+    return result and result.replace(tzinfo=None).isoformat(timespec="minutes")
+
+
+class ParseWhenTests(SimpleTestCase):
+    def test_dates_and_times(self):
+        self.assertEqual(when("friday 5pm"), "2026-10-23T17:00")
+        self.assertEqual(when("next monday at noon"), "2026-10-26T12:00")
+        self.assertEqual(when("in 2 weeks", time(23, 59)), "2026-11-02T23:59")
+        self.assertEqual(when("tonight"), "2026-10-19T20:00")
+        self.assertEqual(when("jan 5"), "2027-01-05T09:00")  # Past dates without a year mean next year
+        self.assertEqual(when("9am"), "2026-10-20T09:00")  # A bare time that has passed means tomorrow
+
+    def test_anything_not_understood_is_none(self):
+        for text in ("13pm", "25:00", "feb 30", "in 9999 days", "in 99999 days", "friday maybe", ""):
+            with self.subTest(text=text):
+                self.assertIsNone(when(text))
+
+
+class ParseTests(SimpleTestCase):
+    def parse(self, message):
+        return intents.parse(message, COURSES, NOW)
+
+    def test_corpus_has_no_false_or_wrong_routes(self):
+        with open(DEFAULT_CORPUS) as handle:
+            corpus = json.load(handle)
+        now = timezone.make_aware(datetime.fromisoformat(corpus["now"]))
+        for case in corpus["cases"]:
+            intent = intents.parse(case["message"], corpus["courses"], now)
+            if intent is not None:
+                with self.subTest(message=case["message"]):
+                    self.assertEqual((intent.tool, comparable(intent.args)), (case["tool"], comparable(case["args"])))
+
+    def test_course_codes_match_as_the_user_saved_them(self):
+        intent = self.parse("add assignment Essay to eng-105 due friday")
+        self.assertEqual(intent.args["course_code"], "ENG 105")
+        self.assertIsNone(self.parse("add assignment Essay to BIO100 due friday"))
+
+    def test_out_of_bounds_values_fall_back_to_the_model(self):
+        for message in (
+            "add Lab 5 to CS101 due in 9999 days",
+            f"add midterm for MATH201 on 11/4 at 10am for {Exam.MAX_DURATION_MINUTES + 1} minutes",
+            "add midterm for MATH201 on 11/4 at 10am for 0 minutes",
+            "add a course called Compilers (CS101) taught by Dr. Knuth",  # Already exists
+        ):
+            with self.subTest(message=message):
+                self.assertIsNone(self.parse(message))
+
+
+class RouteTests(TestCase):
+    def setUp(self):
+        metrics.reset()
+        self.user = User.objects.create_user("ada", password="pw")
+        Course.objects.create(user=self.user, name="Intro to CS", code="CS101")
+
+    def test_routed_messages_run_the_tool(self):
+        reply = intents.route(self.user, "add assignment Lab 3 to CS101 due Friday 5pm", now=NOW)
+        self.assertIn("Lab 3", reply)
+        self.assertTrue(Assignment.objects.filter(title="Lab 3", course__user=self.user).exists())
+        self.assertIsNone(intents.route(self.user, "how should I prepare for finals?", now=NOW))
+        totals = intents.totals()
+        self.assertEqual((totals["routed"], totals["fell_back"], totals["by_tool"]["add_assignment"]), (1, 1, 1))
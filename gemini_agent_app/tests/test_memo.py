@@ -0,0 +1,44 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from academic_app.caching import bump_data_version
+from gemini_agent_app.memo import ToolMemo
+
+
+class ToolMemoTests(TestCase):
+    def setUp(self):
+        self.memo = ToolMemo(user_id=1)
+        self.summary = mock.Mock(return_value="Courses: 2")
+
+    def read(self, **kwargs):
+        return self.memo.call("get_academic_summary", self.summary, kwargs)
+
+    def test_read_tools_are_reused_while_arguments_match(self):
+        self.assertEqual(self.read(), "Courses: 2")
+        self.read()
+        self.read(days=7)
+        self.assertEqual(self.summary.call_count, 2)
+        self.assertEqual(self.memo.stats(), {"hits": 1, "misses": 2, "invalidations": 0, "hit_rate": 0.333})
+
+    def test_write_tools_clear_the_memo(self):
+        self.read()
+        self.memo.call("add_assignment", mock.Mock(return_value="✅ Added"), {"title": "Lab"})
+        self.read()
+        self.assertEqual(self.summary.call_count, 2)
+        self.assertEqual((self.memo.writes, self.memo.invalidations), (1, 1))
+
+    def test_other_writes_to_the_users_data_are_seen(self):
+        self.read()
+        bump_data_version(1)
+        self.read()
+        self.assertEqual(self.summary.call_count, 2)
+
+    def test_errors_and_unknown_tools_are_not_memoised(self):
+        self.summary.return_value = "❌ Database is busy"
+        self.read()
+        self.read()
+        other = mock.Mock(return_value="ok")
+        self.memo.call("search_web", other, {})
+        self.memo.call("search_web", other, {})
+        self.assertEqual((self.summary.call_count, other.call_count), (2, 2))
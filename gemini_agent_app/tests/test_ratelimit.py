@@ -0,0 +1,111 @@
+import threading
+import time
+from datetime import timedelta
+
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from gemini_agent_app import metrics, ratelimit
+from gemini_agent_app.ratelimit import Limiter, RateLimited, TokenBucket
+
+
+class OpenBucket:
+    def try_acquire(self, now=None):
+        return 0.0
+
+
+class QuotaError(Exception):
+    code = 429
+
+
+class MetricsTests(SimpleTestCase):
+    def setUp(self):
+        metrics.reset()
+
+    def test_concurrent_increments_are_not_lost(self):
+        # SimpleTestCase forbids queries, so this also checks no cache backend is involved.
+        def bump():
+            for _ in range(1000):
+                metrics.incr("test_counter")
+
+        threads = [threading.Thread(target=bump) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(metrics.snapshot(["test_counter", "unused"]), {"test_counter": 8000, "unused": 0})
+
+
+class LimiterTests(SimpleTestCase):
+    def setUp(self):
+        metrics.reset()
+        self.limiter = Limiter(OpenBucket(), max_concurrency=1, max_queue=1, queue_timeout=5, max_retries=2)
+        self.previous = ratelimit.reset_limiter(self.limiter)
+        self.addCleanup(ratelimit.reset_limiter, self.previous)
+
+    def hold_slot(self):
+        """Occupies the only slot from another thread until the returned event is set."""
+        entered, release = threading.Event(), threading.Event()
+
+        def hold():
+            with self.limiter.slot():
+                entered.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        entered.wait(5)
+        self.addCleanup(thread.join)
+        self.addCleanup(release.set)
+        return release
+
+    def test_waiters_are_counted_and_rejected_when_the_queue_is_full(self):
+        release = self.hold_slot()
+        waiter = threading.Thread(target=lambda: self.limiter.call(lambda: None))
+        waiter.start()
+        while not self.limiter.stats()["waiting"]:
+            time.sleep(0.001)
+        self.assertEqual(ratelimit.totals()["queue_depth"], 1)
+
+        with self.assertRaises(RateLimited) as raised:
+            self.limiter.call(lambda: None)
+        self.assertEqual(raised.exception.reason, "queue_full")
+
+        release.set()
+        waiter.join(5)
+        totals = ratelimit.totals()
+        self.assertEqual((totals["queue_depth"], totals["calls"]), (0, 1))
+        self.assertEqual(totals["rejected"], {"queue_full": 1, "timeout": 0})
+
+    def test_waiting_past_the_deadline_is_rejected(self):
+        self.hold_slot()
+        with self.assertRaises(RateLimited) as raised:
+            with self.limiter.slot(deadline=time.monotonic() + 0.05):
+                pass
+        self.assertEqual(raised.exception.reason, "timeout")
+        self.assertEqual(self.limiter.stats()["waiting"], 0)
+
+    def test_quota_errors_are_retried(self):
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) < 2:
+                raise QuotaError()
+            return "ok"
+
+        ratelimit.RETRY_BASE_DELAY, previous = 0.001, ratelimit.RETRY_BASE_DELAY
+        self.addCleanup(setattr, ratelimit, "RETRY_BASE_DELAY", previous)
+        self.assertEqual(self.limiter.call(flaky), "ok")
+        self.assertEqual(ratelimit.totals()["quota_retries"], 1)
+        with self.assertRaises(ValueError):
+            self.limiter.call(lambda: int("x"))
+
+
+class TokenBucketTests(TestCase):
+    def test_burst_then_refill(self):
+        bucket = TokenBucket("test", rate_per_minute=60, burst=2)
+        now = timezone.now()
+        self.assertEqual([bucket.try_acquire(now), bucket.try_acquire(now)], [0.0, 0.0])
+        self.assertAlmostEqual(bucket.try_acquire(now), 1.0)
+        self.assertEqual(bucket.try_acquire(now + timedelta(seconds=1)), 0.0)
@@ -0,0 +1,65 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from academic_app.caching import bump_data_version
+from gemini_agent_app import response_cache
+from gemini_agent_app.models import CachedResponse
+
+
+class NormaliseTests(SimpleTestCase):
+    def test_contractions_case_and_punctuation(self):
+        self.assertEqual(response_cache.normalise("What's due THIS week?"), "what is due this week")
+        self.assertEqual(response_cache.normalise("I’m behind, aren't I"), "i am behind are not i")
+
+    def test_anchors(self):
+        self.assertEqual(
+            response_cache.anchors("can i still get an a in cs201 next week"),
+            {"i", "a", "cs201", "next", "week"},
+        )
+
+    def test_embeddings_are_unit_vectors_and_close_for_rephrasings(self):
+        first = response_cache.embed("what is due this week")
+        second = response_cache.embed("so what is due this week")
+        self.assertAlmostEqual(float(first @ first), 1.0, places=5)
+        self.assertGreater(float(first @ second), response_cache.SIMILARITY_THRESHOLD)
+
+
+class LookupTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("ada", password="pw")
+        response_cache.store(self.user.id, "What's due this week?", "Two essays.", 1200)
+
+    def lookup(self, message, user=None):
+        return response_cache.lookup((user or self.user).id, message)
+
+    def test_exact_and_similar_messages_hit(self):
+        self.assertEqual(self.lookup("what is due this week"), ("Two essays.", 1.0))
+        response, similarity = self.lookup("So what's due this week?")
+        self.assertEqual(response, "Two essays.")
+        self.assertGreaterEqual(similarity, response_cache.SIMILARITY_THRESHOLD)
+
+    def test_different_anchors_short_messages_and_other_users_miss(self):
+        self.assertIsNone(self.lookup("What's due next week?"))
+        self.assertIsNone(self.lookup("yes"))
+        self.assertIsNone(self.lookup("What's due this week?", User.objects.create_user("bob", password="pw")))
+
+    def test_writes_and_age_expire_entries(self):
+        bump_data_version(self.user.id)
+        self.assertIsNone(self.lookup("What's due this week?"))
+
+        response_cache.store(self.user.id, "What's due this week?", "Three essays.", 900)
+        self.assertEqual(CachedResponse.objects.count(), 1)
+        CachedResponse.objects.update(created_at=timezone.now() - timedelta(seconds=response_cache.CACHE_TIMEOUT + 1))
+        self.assertIsNone(self.lookup("What's due this week?"))
+
+    def test_entries_are_capped_per_user(self):
+        with mock.patch.object(response_cache, "MAX_ENTRIES", 3):
+            for n in range(5):
+                response_cache.store(self.user.id, f"question number {n} please", str(n), 10)
+        self.assertEqual(
+            sorted(CachedResponse.objects.values_list("response", flat=True)), ["2", "3", "4"],
+        )
@@ -0,0 +1,47 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+
+from academic_app.models import Assignment, Attendance, CalendarEvent, Course, Exam
+from gemini_agent_app import tools
+
+
+class ToolQueryTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("ada", password="pw")
+        self.now = timezone.now()
+        CalendarEvent.objects.create(user=self.user, title="Gym", event_date=self.now + timedelta(days=1))
+        self.add_course("CS101")
+
+    def add_course(self, code, items=1):
+        course = Course.objects.create(user=self.user, name=f"Course {code}", code=code)
+        for n in range(items):
+            Assignment.objects.create(course=course, title=f"Lab {n}", due_date=self.now + timedelta(days=n + 1))
+            Exam.objects.create(course=course, title=f"Quiz {n}", exam_date=self.now + timedelta(days=n + 2))
+            Attendance.objects.create(course=course, date=(self.now - timedelta(days=n)).date(), present=True)
+
+    def test_summary_queries_do_not_grow_with_the_data(self):
+        # User, then an existence check and a fetch each for courses,
+        # assignments, exams, attendance and events.
+        with self.assertNumQueries(11):
+            summary = tools.get_academic_summary(self.user.id)
+        self.assertIn("Course CS101", summary)
+        self.add_course("CS102", items=5)
+        self.add_course("CS103", items=5)
+        with self.assertNumQueries(11):
+            self.assertIn("Quiz 4", tools.get_academic_summary(self.user.id))
+
+    def test_adding_items_within_a_session(self):
+        with tools.using(tools.ToolContext(self.user)) as context:
+            context.courses  # Loaded once per chat session
+            # Insert, then the reminder sync: preferences, reminder lookup and
+            # its insert in a savepoint.
+            with self.assertNumQueries(6):
+                reply = tools.add_assignment(self.user.id, "CS101", "Essay", (self.now + timedelta(days=3)).isoformat())
+            self.assertTrue(reply.startswith("✅"), reply)
+            # The same, plus one query per item kind for the overlap check.
+            with self.assertNumQueries(9):
+                reply = tools.add_exam(self.user.id, "CS101", "Final", (self.now + timedelta(days=4)).isoformat())
+            self.assertTrue(reply.startswith("✅"), reply)
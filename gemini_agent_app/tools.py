@@ -1,21 +1,90 @@
 # gemini_agent_app/tools.py
-from academic_app.models import Course, Assignment, Exam, CalendarEvent, Attendance
+from academic_app.models import Course, Assignment, Exam, CalendarEvent, Attendance, in_current_term
+from academic_app import conflicts, grades, scheduler, terms
+from django.db import IntegrityError, transaction
 from django.db.models import F
 from django.contrib.auth.models import User
-from datetime import datetime
+from django.utils import timezone
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta
 import json
 
+
+class ToolContext:
+    """
+    The user and their current-term courses by code, resolved once for a
+    chat session instead of once per tool call. Install it with
+    ``using(context)``.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self._courses = None
+
+    @property
+    def courses(self):
+        if self._courses is None:
+            # Through the related manager, so each course has its user cached.
+            # Ended terms are left out so codes never resolve to a course that
+            # is hidden from the dashboard and due to be archived; where a
+            # term-less course shares a code, the latest term's course wins.
+            courses = self.user.courses.current().order_by(F("term__start_date").asc(nulls_first=True), "id")
+            self._courses = {course.code: course for course in courses}
+        return self._courses
+
+    def course(self, code):
+        return self.courses.get(code)
+
+    def add_course(self, course):
+        if self._courses is not None:
+            self._courses[course.code] = course
+
+
+_current_context = ContextVar("tool_context", default=None)
+
+
+@contextmanager
+def using(context):
+    """Makes ``context`` the one tools resolve their ``user_id`` against."""
+    token = _current_context.set(context)
+    try:
+        yield context
+    finally:
+        _current_context.reset(token)
+
+
+def _context_for(user_id):
+    """The installed context if it is for ``user_id``, else a fresh one (raises User.DoesNotExist)."""
+    context = _current_context.get()
+    if context is None or context.user.id != user_id:
+        context = ToolContext(User.objects.get(id=user_id))
+    return context
+
+
+def _conflict_note(item):
+    """Appends a schedule-overlap warning to a tool's confirmation message."""
+    found = conflicts.conflicts_for(item)
+    if not found:
+        return ""
+    lines = "\n".join(
+        f"- {c.kind.title()} '{c.title}' on {timezone.localtime(c.start).strftime('%B %d at %I:%M %p')}"
+        for c in found
+    )
+    return f"\n\n⚠️ Heads up, this overlaps with:\n{lines}"
+
+
 def get_academic_summary(user_id: int):
     """
-    Retrieves all courses, assignments, and exams for a specific user.
+    Retrieves the current term's courses, assignments, and exams for a specific user.
     Args:
         user_id (int): The ID of the user.
     Returns:
         A formatted string summary of all academic data.
     """
     try:
-        user = User.objects.get(id=user_id)
-        courses = user.courses.all()
+        user = _context_for(user_id).user
+        courses = user.courses.current()
         
         summary = "Here is your current academic data:\n\n"
         
@@ -27,7 +96,10 @@ def get_academic_summary(user_id: int):
                 summary += f"  🎓 Credits: {course.credits}\n\n"
             
             # Get all assignments for user's courses
-            assignments = Assignment.objects.filter(course__user=user).order_by('due_date')
+            assignments = (
+                Assignment.objects.filter(in_current_term("course__"), course__user=user)
+                .select_related("course").order_by('due_date')
+            )
             if assignments.exists():
                 summary += "📝 **My Assignments:**\n"
                 for assignment in assignments:
@@ -48,7 +120,10 @@ def get_academic_summary(user_id: int):
                     summary += "\n"
             
             # Get all exams for user's courses
-            exams = Exam.objects.filter(course__user=user).order_by('exam_date')
+            exams = (
+                Exam.objects.filter(in_current_term("course__"), course__user=user)
+                .select_related("course").order_by('exam_date')
+            )
             if exams.exists():
                 summary += "📋 **My Exams:**\n"
                 for exam in exams:
@@ -71,7 +146,10 @@ def get_academic_summary(user_id: int):
                     summary += "\n"
             
             # Get recent attendance records
-            attendance_records = Attendance.objects.filter(course__user=user).order_by('-date')[:5]
+            attendance_records = (
+                Attendance.objects.filter(in_current_term("course__"), course__user=user)
+                .select_related("course").order_by('-date')[:5]
+            )
             if attendance_records.exists():
                 summary += "✅ **Recent Attendance:**\n"
                 for record in attendance_records:
@@ -80,11 +158,11 @@ def get_academic_summary(user_id: int):
                 summary += "\n"
             
             # Get upcoming events
-            from datetime import datetime, timedelta
+            now = timezone.now()
             upcoming_events = CalendarEvent.objects.filter(
                 user=user,
-                event_date__gte=datetime.now(),
-                event_date__lte=datetime.now() + timedelta(days=14)
+                event_date__gte=now,
+                event_date__lte=now + timedelta(days=14)
             ).order_by('event_date')
             
             if upcoming_events.exists():
@@ -116,6 +194,104 @@ def get_academic_summary(user_id: int):
     except Exception as e:
         return f"❌ Error retrieving your academic data: {str(e)}\n\nPlease try again or contact support if the problem persists."
 
+def get_study_plan(user_id: int, days: int = 7):
+    """
+    Suggests when to work on pending assignments, fitted around the user's
+    events, exams and classes within their preferred study hours.
+    Args:
+        user_id (int): The ID of the user.
+        days (int): How many days ahead of today to show.
+    Returns:
+        A formatted string listing planned study blocks by day.
+    """
+    try:
+        user = _context_for(user_id).user
+        plan = scheduler.get_study_plan(user)
+        now = timezone.now()
+        blocks = plan.blocks_between(now, now + timedelta(days=max(1, int(days))))
+
+        if not blocks and not plan.unscheduled:
+            return "🎉 Nothing to plan: you have no pending assignments with upcoming due dates."
+
+        lines = [f"📚 **Study Plan (Next {days} Days):**"]
+        current_day = None
+        for block in blocks:
+            local_start = timezone.localtime(block.start)
+            if local_start.date() != current_day:
+                current_day = local_start.date()
+                lines.append(f"\n📅 **{local_start.strftime('%A, %B %d')}**")
+            lines.append(
+                f"- {local_start.strftime('%I:%M %p')}-{timezone.localtime(block.end).strftime('%I:%M %p')}: "
+                f"**{block.title}** ({block.course})"
+            )
+        if plan.unscheduled:
+            titles = dict(Assignment.objects.filter(id__in=plan.unscheduled).values_list('id', 'title'))
+            lines.append("\n⚠️ **Not enough free time before the due date for:**")
+            for assignment_id, minutes in plan.unscheduled.items():
+                lines.append(f"- {titles.get(assignment_id, 'Assignment')}: {minutes / 60:.1f} hours short")
+        return "\n".join(lines)
+
+    except User.DoesNotExist:
+        return "❌ User not found. Please make sure you're logged in."
+    except Exception as e:
+        return f"❌ Error building your study plan: {str(e)}"
+
+def get_grade_projection(user_id: int, course_code: str, target: str = "A", assume: float = 0):
+    """
+    Shows the current grade in a course and what the user needs on the
+    remaining assignments and exams to reach a target grade.
+    Args:
+        user_id (int): The ID of the user.
+        course_code (str): The code of the course.
+        target (str): The target letter grade (A, B, C or D) or a percentage.
+        assume (float): Percentage assumed for the other remaining items when solving for one item (0 uses the current grade).
+    Returns:
+        A formatted string with the current grade, which letters are still reachable and the scores needed.
+    """
+    try:
+        course = _context_for(user_id).course(course_code)
+        if course is None:
+            return f"❌ Course with code '{course_code}' not found. Please check the course code or add the course first."
+
+        projection = grades.course_projection(course, assume=assume or None, target=target)
+        if not projection["remaining"] and projection["current"] is None:
+            return f"📭 Nothing in {course.name} is set up for grading yet."
+
+        lines = [f"🎓 **{course.name} Grade Projection:**"]
+        if projection["current"] is None:
+            lines.append("- Current grade: nothing graded yet")
+        else:
+            lines.append(f"- Current grade: {projection['current']}% ({projection['current_letter']}), "
+                         f"{projection['graded_weight']}% of the course graded")
+        lines.append(f"- Possible final range: {projection['projected_min']}% to {projection['projected_max']}%")
+        outlook = ", ".join(
+            f"{letter}: {status}" for letter, status in projection["outlook"].items() if letter != "target"
+        )
+        lines.append(f"- Letter grades: {outlook}")
+
+        goal = f"{target} ({projection['target']:g}%)"
+        needed_average = projection["needed_average"]["target"]
+        if not projection["remaining"]:
+            reached = projection["current"] >= projection["target"]
+            lines.append(f"\n{'✅' if reached else '❌'} Everything is graded; you {'reached' if reached else 'missed'} {goal}.")
+        elif needed_average is None:
+            lines.append(f"\n😬 {goal} is out of reach even with full marks on everything left.")
+        else:
+            lines.append(f"\n🎯 **For {goal}:** average {needed_average}% on everything left")
+            lines.append(f"Needed on each item if the others score {projection['assumed_percent']}%:")
+            for item in projection["remaining"]:
+                score = item["needed"]["target"]
+                needed = "out of reach" if score is None else f"{score * item['max_score'] / 100:g}/{item['max_score']:g} ({score}%)"
+                lines.append(f"- {item['title']}: {needed}")
+        return "\n".join(lines)
+
+    except User.DoesNotExist:
+        return "❌ User not found. Please make sure you're logged in."
+    except ValueError:
+        return f"❌ '{target}' is not a letter grade or percentage."
+    except Exception as e:
+        return f"❌ Error projecting your grade: {str(e)}"
+
 def add_new_course(user_id: int, name: str, code: str, instructor: str):
     """
     Adds a new course to the user's database.
@@ -128,21 +304,24 @@ def add_new_course(user_id: int, name: str, code: str, instructor: str):
         A success message or an error string.
     """
     try:
-        user = User.objects.get(id=user_id)
+        context = _context_for(user_id)
         
-        # Check if course with same code already exists for this user
-        if Course.objects.filter(user=user, code=code).exists():
+        # Create the course with default values for new fields; the database
+        # rejects a code the user already has in the same term
+        try:
+            with transaction.atomic():
+                course = Course.objects.create(
+                    user=context.user, 
+                    term=terms.active_term(context.user),
+                    name=name, 
+                    code=code, 
+                    instructor=instructor,
+                    credits=3,  # Default to 3 credits
+                    color="#007bff"  # Default blue color
+                )
+        except IntegrityError:
             return f"❌ A course with code '{code}' already exists. Please use a different code."
-        
-        # Create the course with default values for new fields
-        course = Course.objects.create(
-            user=user, 
-            name=name, 
-            code=code, 
-            instructor=instructor,
-            credits=3,  # Default to 3 credits
-            color="#007bff"  # Default blue color
-        )
+        context.add_course(course)
         
         return f"✅ Successfully added the course '{name}' ({code}) taught by {instructor} to your list! 🎓"
         
@@ -164,9 +343,11 @@ def add_calendar_event(user_id: int, title: str, event_date: str, description: s
         A success message or an error string.
     """
     try:
-        user = User.objects.get(id=user_id)
+        user = _context_for(user_id).user
         # Convert the string date to a datetime object
         event_datetime = datetime.fromisoformat(event_date)
+        if timezone.is_naive(event_datetime):
+            event_datetime = timezone.make_aware(event_datetime)
         
         # Create the event with default values for new fields
         event = CalendarEvent.objects.create(
@@ -178,7 +359,7 @@ def add_calendar_event(user_id: int, title: str, event_date: str, description: s
             color="#28a745"  # Default green color
         )
         
-        return f"✅ Successfully added '{title}' to your calendar for {event_datetime.strftime('%B %d, %Y at %I:%M %p')}! 📅"
+        return f"✅ Successfully added '{title}' to your calendar for {event_datetime.strftime('%B %d, %Y at %I:%M %p')}! 📅" + _conflict_note(event)
         
     except User.DoesNotExist:
         return "❌ User not found. Please make sure you're logged in."
@@ -202,12 +383,9 @@ def add_assignment(user_id: int, course_code: str, title: str, due_date: str, pr
         A success message or an error string.
     """
     try:
-        user = User.objects.get(id=user_id)
-        
         # Find the course by code
-        try:
-            course = Course.objects.get(user=user, code=course_code)
-        except Course.DoesNotExist:
+        course = _context_for(user_id).course(course_code)
+        if course is None:
             return f"❌ Course with code '{course_code}' not found. Please check the course code or add the course first."
         
         # Convert the string date to a datetime object
@@ -253,17 +431,19 @@ def add_exam(user_id: int, course_code: str, title: str, exam_date: str, exam_ty
         A success message or an error string.
     """
     try:
-        user = User.objects.get(id=user_id)
-        
         # Find the course by code
-        try:
-            course = Course.objects.get(user=user, code=course_code)
-        except Course.DoesNotExist:
+        course = _context_for(user_id).course(course_code)
+        if course is None:
             return f"❌ Course with code '{course_code}' not found. Please check the course code or add the course first."
         
         # Convert the string date to a datetime object
         exam_datetime = datetime.fromisoformat(exam_date)
+        if timezone.is_naive(exam_datetime):
+            exam_datetime = timezone.make_aware(exam_datetime)
         
+        if not 0 < duration <= Exam.MAX_DURATION_MINUTES:
+            return f"❌ Exam duration must be between 1 and {Exam.MAX_DURATION_MINUTES} minutes."
+
         # Validate exam type
         valid_types = ['midterm', 'final', 'quiz', 'project', 'presentation']
         if exam_type.lower() not in valid_types:
@@ -279,7 +459,7 @@ def add_exam(user_id: int, course_code: str, title: str, exam_date: str, exam_ty
             location=location
         )
         
-        return f"✅ Successfully added {exam_type} exam '{title}' for {course.name} on {exam_datetime.strftime('%B %d, %Y at %I:%M %p')}! 📋"
+        return f"✅ Successfully added {exam_type} exam '{title}' for {course.name} on {exam_datetime.strftime('%B %d, %Y at %I:%M %p')}! 📋" + _conflict_note(exam)
         
     except User.DoesNotExist:
         return "❌ User not found. Please make sure you're logged in."
@@ -4,4 +4,5 @@ from . import views
 urlpatterns = [
     path('chat/', views.chat_view, name='chat_view'),
     path('chat/api/', views.chat_api, name='chat_api'),
+    path('metrics/', views.agent_metrics, name='agent_metrics'),
 ]
\ No newline at end of file
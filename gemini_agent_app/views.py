@@ -6,34 +6,77 @@ from rest_framework import status
 from django.contrib.auth.decorators import login_required
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
-from .agent import StudyPlanAgent # Import the new agent class
+from django.urls import reverse
+from academic_app import jobs
+from . import history, intents, memo, ratelimit, response_cache
 import json
 
 @login_required
 def chat_view(request):
     """
-    Renders the chat interface HTML page.
+    Renders the chat interface HTML page with the user's recent messages.
     """
-    return render(request, "chat_ui.html")
+    return render(request, "chat_ui.html", {"chat_history": history.recent_messages(request.user)})
 
 @csrf_exempt # Use this for API endpoints to ignore CSRF for simplicity, but for production, use proper tokens
 def chat_api(request):
     """
     Handles the API requests from the chatbot frontend.
+
+    Simple commands are answered by calling a tool directly (intents.py),
+    and repeated questions from the response cache. Otherwise the agent's
+    Gemini round trips run as a background job and this returns the job's
+    status URL straight away for the frontend to poll.
     """
     if request.method == 'POST':
+        if not request.user.is_authenticated:
+            return JsonResponse({"error": "Please log in to chat"}, status=401)
+
         data = json.loads(request.body)
         user_message = data.get('message')
         
         if not user_message:
             return JsonResponse({"error": "No message provided"}, status=400)
         
-        # Initialize the AI agent for the current user
-        agent = StudyPlanAgent(request.user)
-        
-        # Call the agent to get a response
-        ai_response = agent.generate_response(user_message)
+        # Formulaic commands ("add assignment Lab 3 to CS101 due Friday 5pm") go straight to a tool
+        routed = intents.route(request.user, user_message)
+        if routed is not None:
+            history.record(request.user, user_message, routed)
+            return JsonResponse({"response": routed, "fast_path": True}, status=200)
+
+        # Near-identical questions since the user's data last changed are answered from cache
+        cached = response_cache.lookup(request.user.id, user_message)
+        if cached is not None:
+            history.record(request.user, user_message, cached[0])
+            return JsonResponse({"response": cached[0], "cached": True}, status=200)
+
+        # Queue the agent call for a worker (see academic_app/jobs.py)
+        job = jobs.enqueue(
+            "chat.reply",
+            {"user_id": request.user.id, "message": user_message},
+            user=request.user,
+            priority=10,  # Someone is waiting on the reply
+        )
         
-        return JsonResponse({"response": ai_response}, status=200)
+        return JsonResponse({
+            "job_id": job.id,
+            "status_url": reverse("job_status", args=[job.id]),
+        }, status=202)
     
-    return JsonResponse({"error": "Invalid request method"}, status=405)
\ No newline at end of file
+    return JsonResponse({"error": "Invalid request method"}, status=405)
+
+
+@login_required
+def agent_metrics(request):
+    """
+    Agent counters for operators (staff only), for the process serving the request.
+    """
+    if not request.user.is_staff:
+        return JsonResponse({"error": "Staff only"}, status=403)
+    return JsonResponse({
+        "tool_memo": memo.totals(),
+        "response_cache": response_cache.totals(),
+        "model_calls": ratelimit.totals(),
+        "intents": intents.totals(),
+    })
+
@@ -0,0 +1,26 @@
+# gunicorn.conf.py
+# Production server settings. Run with: gunicorn academic_planner_project.wsgi
+import multiprocessing
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+
+# WhiteNoise hands Django a file-backed response; gunicorn passes it through
+# wsgi.file_wrapper so static assets go out with os.sendfile() (zero-copy).
+sendfile = True
+
+# Load the app once in the master and fork workers from it, so imports are
+# paid once and shared copy-on-write. Pair with GEMINI_PRELOAD=True to
+# include the Gemini SDK.
+preload_app = os.getenv("GUNICORN_PRELOAD", "False").lower() == "true"
+
+
+def post_worker_init(worker):
+    # The app is loaded; warm the worker up before it starts accepting requests.
+    from django.conf import settings
+
+    if settings.WARMUP:
+        from academic_app import warmup
+
+        warmup.run()